@@ -2,14 +2,46 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import random
 import heapq
-import networkx as nx
-import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import time
+from engine import WordGraph
+from ladders import ShortestLadders, k_shortest_ladders
+from renderer import LadderRenderer
+from session_log import SessionLog
+from stats_store import StatsStore
+from bitset_bfs import BitsetBFS
+from incremental import IncrementalSolver
+from timing import measure_interleaved, mann_whitney_p, is_significant
+from difficulty import BANDS, puzzle_table
+from daily import DailyPuzzles
+from letter_tables import LetterTables, UNREACHABLE
+from sessions import score_moves
+from dawg import Dawg
+from shared_graph import PackedGraph
+from watcher import FileWatcher
+from costs import EdgeCosts, RarityPenalty, PositionPenalty, LetterPenalty, cheapest_ladder
+from query_planner import QueryPlanner
+from challenge import ChallengeBuilder
 
 class WordLadderGame:
-    def __init__(self, dictionary_file='dictionary.txt', words_file='words.txt'):
-        self.load_dictionary(dictionary_file)
+    def __init__(self, dictionary_file='dictionary.txt', words_file='words.txt', bfs_engine='queue',
+                 dictionary_backend='set', graph=None):
+        self.dictionary_backend = dictionary_backend  # 'set', 'dawg' (compact automaton) or 'graph'
+        self.dictionary_file = dictionary_file
+        self.dictionary_watcher = FileWatcher(dictionary_file)
+        self.pending_dictionary = None  # Reloaded words waiting for the current game to end
+        self._suggestions = (None, [])  # (graph, end word, current word) -> ranked next moves
+        self._suggestion_job = None
+        if graph is not None:
+            # A prebuilt (e.g. shared-memory) graph doubles as the read-only word set
+            self.dictionary_backend = 'graph'
+            self.dictionary = graph.words  # Sorted, so membership is a binary search
+            self.graph = graph
+        else:
+            self.load_dictionary(dictionary_file)
+        self.bfs_engine = bfs_engine  # 'queue' (per-node loop) or 'bitset' (whole-level sweeps)
+        self._bitset_bfs = None
+        self.renderer = LadderRenderer(self.graph)
         self.current_path = []
         self.optimal_path = []
         self.current_algorithm = "A*"
@@ -26,20 +58,103 @@ class WordLadderGame:
             "Advanced": 5,  # 5-letter words for advanced
             "Challenge": 5  # 5-letter words with constraints for challenge
         }
+        self.difficulty_bands = {
+            "Beginner": "easy",
+            "Advanced": "medium",
+            "Challenge": "hard"
+        }
+        self.min_path_length = {
+            "Beginner": 3,  # At least 2 moves (3 words including start and end)
+            "Advanced": 4,  # At least 3 moves (4 words including start and end)
+            "Challenge": 4  # At least 3 moves (4 words including start and end)
+        }
+        self._difficulty_table = None
+        self._daily_puzzles = None
+        self._letter_tables = None
+        self._query_planner = None
+        self._challenge_builder = None
+        self._play_graph = (None, None)  # (graph, challenge) -> graph of the words a player may use
         self.banned_words = set()
         self.restricted_letters = set()
+        self.challenge_detour = 2  # Extra moves Challenge constraints force beyond the shortest ladder
+        self.challenge = None
+        self.edit_ladder = self.graph.edits  # Also allow adding or removing one letter per move
+        self.cost_model = "Uniform"  # UCS step costs: "Uniform", "Rarity" or "Position"
+        self._edge_costs = (None, None)
+        self.session_log = None  # Opened by run() for interactive play
+        self.stats_store = None
+        self.result_recorded = True  # No game in progress yet
     
     
     def load_dictionary(self, dictionary_file):
         """Load dictionary from file, keeping only words of the same length."""
         try:
-            with open(dictionary_file, 'r') as f:
-                self.dictionary = set(word.strip().lower() for word in f.readlines())
+            self.dictionary = self.read_dictionary(dictionary_file)
             print(f"Loaded {len(self.dictionary)} words from dictionary")
         except FileNotFoundError:
             # Fallback to a minimal dictionary for testing
             self.dictionary = {'cat', 'hat', 'bat', 'bet', 'let', 'set', 'sit', 'hit', 'hot', 'dot', 'dog'}
             print("Using default dictionary as file was not found")
+        if self.dictionary_backend == 'dawg':
+            self.dictionary = Dawg(self.dictionary)
+        self.graph = self.pack_graph(WordGraph(self.dictionary))
+    
+    def pack_graph(self, graph):
+        """Keep the graph as flat arrays under the DAWG backend, so no per-word objects stay alive."""
+        if self.dictionary_backend == 'dawg':
+            return PackedGraph.pack(graph)
+        return graph
+    
+    def read_dictionary(self, dictionary_file):
+        """Read the set of words in a dictionary file."""
+        with open(dictionary_file, 'r') as f:
+            # Blank lines are skipped as WordGraph.from_file does, so both fingerprint the same words
+            return set(word.strip().lower() for word in f if word.strip())
+    
+    def reload_dictionary(self):
+        """Pick up changes to the dictionary file; a game in progress finishes on its old words."""
+        try:
+            self.pending_dictionary = self.read_dictionary(self.dictionary_file)
+        except FileNotFoundError:
+            return
+        if self.result_recorded:
+            self.apply_pending_dictionary()
+    
+    def apply_pending_dictionary(self):
+        """Swap in reloaded words, updating the graph only around the words that changed."""
+        if self.pending_dictionary is None:
+            return
+        words, self.pending_dictionary = self.pending_dictionary, None
+        update = self.prepare_dictionary(words)
+        if update:
+            self.install_dictionary(words, *update)
+    
+    def prepare_dictionary(self, words):
+        """Build the graph for a new word set; return (graph, added, removed), or None if nothing changed.
+        
+        The game itself is left untouched, so a server can run this off its event loop.
+        """
+        current = set(self.dictionary)
+        added, removed = words - current, current - words
+        if not added and not removed:
+            return None
+        return self.pack_graph(self.graph.with_changes(added, removed)), added, removed
+    
+    def install_dictionary(self, words, graph, added, removed):
+        """Swap in words and the graph prepare_dictionary() built for them."""
+        # Caches keyed on the graph (bitset BFS, tables, layouts) rebuild on next use
+        self.graph = graph
+        self.dictionary = Dawg(words) if self.dictionary_backend == 'dawg' else words
+        self.renderer.set_graph(self.graph)
+        if self.session_log:
+            self.session_log.set_graph(self.graph)
+        print(f"Reloaded dictionary: {len(added)} words added, {len(removed)} removed")
+    
+    def watch_dictionary(self, interval=1000):
+        """Poll the dictionary file from the Tk event loop and reload it when it changes."""
+        if self.dictionary_watcher.changed():
+            self.reload_dictionary()
+        self.root.after(interval, self.watch_dictionary, interval)
     
     def load_words(self, words_file):
         """Load start and end words from a file."""
@@ -61,8 +176,40 @@ class WordLadderGame:
         differences = sum(1 for a, b in zip(word1, word2) if a != b)
         return differences == 1
     
+    def is_one_edit_away(self, word1, word2):
+        """Check if two words differ by one substitution, insertion or deletion."""
+        if len(word1) == len(word2):
+            return self.is_one_letter_different(word1, word2)
+        if abs(len(word1) - len(word2)) != 1:
+            return False
+        shorter, longer = sorted((word1, word2), key=len)
+        # Skip the first mismatch in the longer word; the rest must line up
+        for i in range(len(shorter)):
+            if shorter[i] != longer[i]:
+                return shorter[i:] == longer[i + 1:]
+        return True
+    
+    def set_edit_ladder(self, enabled):
+        """Switch between substitution-only ladders and edit ladders."""
+        if enabled == self.edit_ladder:
+            return
+        self.edit_ladder = enabled
+        self.graph = self.pack_graph(WordGraph(self.dictionary, edits=enabled))
+        self.renderer.set_graph(self.graph)
+    
     def find_neighbors(self, word):
         """Find all words in the dictionary that differ by one letter."""
+        if self.edit_ladder:
+            # Insertions and deletions cross lengths, so use the precomputed edit index
+            return self.graph.neighbors(word)
+        
+        if self.dictionary_backend == 'dawg':
+            # Walk the automaton instead of probing every candidate spelling
+            return self.dictionary.substitutions(word)
+        
+        if self.dictionary_backend == 'graph':
+            return self.graph.neighbors(word)
+        
         neighbors = []
         for i in range(len(word)):
             for c in 'abcdefghijklmnopqrstuvwxyz':
@@ -76,11 +223,31 @@ class WordLadderGame:
         """Calculate the Hamming distance between two words."""
         return sum(1 for a, b in zip(word1, word2) if a != b)
     
+    def edit_distance(self, word1, word2):
+        """Calculate the Levenshtein distance between two words."""
+        previous = list(range(len(word2) + 1))
+        for i, a in enumerate(word1, 1):
+            current = [i]
+            for j, b in enumerate(word2, 1):
+                current.append(min(previous[j] + 1, current[j - 1] + 1,
+                                   previous[j - 1] + (a != b)))
+            previous = current
+        return previous[-1]
+    
+    def bitset_bfs(self):
+        """Return the bitset BFS engine for the current graph, building it on first use."""
+        if self._bitset_bfs is None or self._bitset_bfs.graph is not self.graph:
+            self._bitset_bfs = BitsetBFS(self.graph)
+        return self._bitset_bfs
+    
     def bfs(self, start_word, end_word):
         """Breadth-First Search to find the shortest path."""
         if start_word not in self.dictionary or end_word not in self.dictionary:
             return None
         
+        if self.bfs_engine == 'bitset':
+            return self.bitset_bfs().shortest_path(start_word, end_word)
+        
         queue = [(start_word, [start_word])]
         visited = {start_word}
         
@@ -97,16 +264,45 @@ class WordLadderGame:
         
         return None
     
+    def edge_costs(self):
+        """Return the UCS step costs for the current cost model and Challenge rules."""
+        key = (self.graph, self.cost_model,
+               frozenset(self.banned_words), frozenset(self.restricted_letters))
+        if self._edge_costs[0] != key:
+            models = []
+            if self.cost_model == "Rarity":
+                models.append(RarityPenalty(self.graph.words))
+            elif self.cost_model == "Position":
+                models.append(PositionPenalty())
+            if self.banned_words or self.restricted_letters:
+                # Steer around Challenge restrictions without making the puzzle unsolvable
+                models.append(LetterPenalty(self.restricted_letters, self.banned_words))
+            self._edge_costs = (key, EdgeCosts(*models))
+        return self._edge_costs[1]
+    
     def ucs(self, start_word, end_word):
-        """Uniform Cost Search to find the shortest path."""
+        """Uniform Cost Search to find the cheapest path under the current step costs."""
+        if start_word not in self.dictionary or end_word not in self.dictionary:
+            return None
+        
+        # Costs are small integers, so a bucket queue replaces the heap
+        path, _ = cheapest_ladder(self.graph, start_word, end_word, self.edge_costs())
+        return path
+    
+    def a_star(self, start_word, end_word):
+        """A* Search to find the shortest path."""
         if start_word not in self.dictionary or end_word not in self.dictionary:
             return None
         
-        priority_queue = [(0, start_word, [start_word])]  # (cost, word, path)
+        # Hamming distance only bounds substitution-only ladders
+        heuristic = self.edit_distance if self.edit_ladder else self.hamming_distance
+        
+        # Priority queue: (f(n), g(n), word, path)
+        priority_queue = [(heuristic(start_word, end_word), 0, start_word, [start_word])]
         visited = set()
         
         while priority_queue:
-            cost, current_word, path = heapq.heappop(priority_queue)
+            _, g_cost, current_word, path = heapq.heappop(priority_queue)
             
             if current_word in visited:
                 continue
@@ -118,37 +314,92 @@ class WordLadderGame:
             
             for neighbor in self.find_neighbors(current_word):
                 if neighbor not in visited:
-                    new_cost = cost + 1  # Each step has uniform cost of 1
-                    heapq.heappush(priority_queue, (new_cost, neighbor, path + [neighbor]))
+                    g_new = g_cost + 1  # Uniform step cost
+                    h_new = heuristic(neighbor, end_word)  # Heuristic
+                    f_new = g_new + h_new  # f(n) = g(n) + h(n)
+                    heapq.heappush(priority_queue, (f_new, g_new, neighbor, path + [neighbor]))
         
         return None
     
-    def a_star(self, start_word, end_word):
-        """A* Search to find the shortest path."""
+    def letter_tables(self):
+        """Return the per-position letter tables for the current graph, building them on first use."""
+        if self._letter_tables is None or self._letter_tables.graph is not self.graph:
+            self._letter_tables = LetterTables(self.graph)
+        return self._letter_tables
+    
+    def query_planner(self):
+        """Return the batch query planner for the current graph, whose BFS trees persist across calls."""
+        if self._query_planner is None or self._query_planner.graph is not self.graph:
+            self._query_planner = QueryPlanner(self.graph)
+        return self._query_planner
+    
+    def play_graph(self):
+        """Return the graph of words a player may move through.
+
+        That is the whole graph, except in a Challenge, where banned words and
+        words with restricted letters are dropped (the start word is never
+        entered, so it stays). Ladders, hints, suggestions and auto-solve all
+        search this graph, so they never propose a move submit_word rejects.
+        """
+        key = (self.graph, self.challenge)
+        if self._play_graph[0] != key:
+            graph = self.graph
+            if self.challenge:
+                forbidden = {word for word in graph.words if word != self.start_word and (
+                    word in self.banned_words or not self.restricted_letters.isdisjoint(word))}
+                graph = graph.with_changes(set(), forbidden)
+            self._play_graph = (key, graph)
+        return self._play_graph[1]
+    
+    def challenge_builder(self):
+        """Return the Challenge constraint builder for the current graph, building its cut structure on first use."""
+        if self._challenge_builder is None or self._challenge_builder.graph is not self.graph:
+            self._challenge_builder = ChallengeBuilder(self.graph)
+        return self._challenge_builder
+    
+    def a_star_letters(self, start_word, end_word):
+        """A* Search guided by the letter-position tables instead of Hamming distance."""
+        if self.edit_ladder:
+            # The tables only describe same-length substitutions
+            return self.a_star(start_word, end_word)
         if start_word not in self.dictionary or end_word not in self.dictionary:
             return None
         
-        # Priority queue: (f(n), g(n), word, path)
-        priority_queue = [(self.hamming_distance(start_word, end_word), 0, start_word, [start_word])]
+        heuristic = self.letter_tables().heuristic(end_word)
+        if heuristic(start_word) >= UNREACHABLE:
+            return None
+        
+        # Priority queue: (f(n), g(n), word); paths are rebuilt from parents
+        priority_queue = [(heuristic(start_word), 0, start_word)]
+        parents = {start_word: None}
+        best_g = {start_word: 0}
         visited = set()
         
         while priority_queue:
-            _, g_cost, current_word, path = heapq.heappop(priority_queue)
+            _, g_cost, current_word = heapq.heappop(priority_queue)
             
             if current_word in visited:
                 continue
-                
+            
             visited.add(current_word)
             
             if current_word == end_word:
-                return path
+                path = []
+                while current_word is not None:
+                    path.append(current_word)
+                    current_word = parents[current_word]
+                return path[::-1]
             
-            for neighbor in self.find_neighbors(current_word):
-                if neighbor not in visited:
-                    g_new = g_cost + 1  # Uniform step cost
-                    h_new = self.hamming_distance(neighbor, end_word)  # Heuristic
-                    f_new = g_new + h_new  # f(n) = g(n) + h(n)
-                    heapq.heappush(priority_queue, (f_new, g_new, neighbor, path + [neighbor]))
+            for neighbor in self.graph.neighbors(current_word):
+                g_new = g_cost + 1
+                if neighbor in visited or g_new >= best_g.get(neighbor, UNREACHABLE):
+                    continue
+                h_new = heuristic(neighbor)
+                if h_new >= UNREACHABLE:
+                    continue  # Some position can never take the target letter
+                best_g[neighbor] = g_new
+                parents[neighbor] = current_word
+                heapq.heappush(priority_queue, (g_new + h_new, g_new, neighbor))
         
         return None
     
@@ -160,15 +411,51 @@ class WordLadderGame:
             return self.ucs(start_word, end_word)
         elif algorithm == "A*":
             return self.a_star(start_word, end_word)
+        elif algorithm == "A* (letters)":
+            return self.a_star_letters(start_word, end_word)
         else:
             raise ValueError(f"Unknown algorithm: {algorithm}")
     
+    def difficulty_table(self):
+        """Return the puzzle difficulty table for the current graph, building it on first use."""
+        if self._difficulty_table is None or self._difficulty_table.graph is not self.graph:
+            self._difficulty_table = puzzle_table(self.graph)
+        return self._difficulty_table
+    
+    def daily_puzzles(self):
+        """Return the seeded daily puzzle generator, opening its cache on first use."""
+        if self._daily_puzzles is None:
+            self._daily_puzzles = DailyPuzzles(self)
+        return self._daily_puzzles
+    
+    def find_k_paths(self, start_word, end_word, k):
+        """Find up to k alternative ladders between words, shortest first."""
+        return k_shortest_ladders(self.play_graph(), start_word, end_word, k)
+    
+    def next_hint(self, path, current_word):
+        """Return the word that follows current_word on path, or None at the end."""
+        try:
+            current_index = path.index(current_word)
+        except ValueError:
+            # If current word is not on the path, suggest the first step from start
+            return path[1] if len(path) > 1 else None
+        if current_index < len(path) - 1:
+            return path[current_index + 1]
+        return None
+    
+    def shortest_ladders(self, start_word, end_word):
+        """Build the DAG of every shortest ladder between two words."""
+        return ShortestLadders(self.play_graph(), start_word, end_word)
+    
     def validate_move(self, word, prev_word):
         """Check if a word is a valid move from the previous word."""
         if not word in self.dictionary:
             return False, "Word not in dictionary"
         
-        if not self.is_one_letter_different(prev_word, word):
+        if self.edit_ladder:
+            if not self.is_one_edit_away(prev_word, word):
+                return False, "Must change, add or remove exactly one letter"
+        elif not self.is_one_letter_different(prev_word, word):
             return False, "Must change exactly one letter"
         
         return True, "Valid move"
@@ -291,17 +578,30 @@ class WordLadderGame:
                                  style='Game.TCombobox')
         mode_combo.pack(side=tk.LEFT, padx=5)
         
+        # Edit ladder toggle: moves may also add or remove a letter
+        self.edit_ladder_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(mode_frame, text="Add/remove letters",
+                        variable=self.edit_ladder_var).pack(side=tk.LEFT, padx=10)
+        
         # Right side - Algorithm
         algo_frame = ttk.Frame(controls_frame, style='Game.TFrame')
         algo_frame.pack(side=tk.RIGHT, padx=(30, 0))
         ttk.Label(algo_frame, text="Algorithm:", style='Game.TLabel').pack(side=tk.LEFT, padx=5)
         self.algorithm_var = tk.StringVar(value="A*")
         algorithm_combo = ttk.Combobox(algo_frame, textvariable=self.algorithm_var,
-                                     values=["BFS", "UCS", "A*"],
-                                     width=6, state='readonly', font=('Poppins', 11),
+                                     values=["BFS", "UCS", "A*", "A* (letters)"],
+                                     width=11, state='readonly', font=('Poppins', 11),
                                      style='Game.TCombobox')
         algorithm_combo.pack(side=tk.LEFT, padx=5)
         
+        # Step costs used by UCS
+        ttk.Label(algo_frame, text="Step cost:", style='Game.TLabel').pack(side=tk.LEFT, padx=5)
+        self.cost_var = tk.StringVar(value="Uniform")
+        ttk.Combobox(algo_frame, textvariable=self.cost_var,
+                     values=["Uniform", "Rarity", "Position"],
+                     width=9, state='readonly', font=('Poppins', 11),
+                     style='Game.TCombobox').pack(side=tk.LEFT, padx=5)
+        
         # Start Game button with hover effect
         start_button = ttk.Button(main_frame, text="Start New Game",
                                  command=self.start_game,
@@ -309,6 +609,13 @@ class WordLadderGame:
                                  padding="12 8")
         start_button.pack(pady=15)
         
+        # Same puzzle for every player on a given day
+        daily_button = ttk.Button(main_frame, text="Today's Puzzle",
+                                 command=self.start_daily_game,
+                                 style='Game.TButton',
+                                 padding="12 8")
+        daily_button.pack(pady=(0, 15))
+        
         # Word display frame (graph)
         self.word_frame = ttk.Frame(main_frame, style='Game.TFrame')
         self.word_frame.pack(fill=tk.BOTH, expand=True, pady=15)
@@ -337,6 +644,12 @@ class WordLadderGame:
                                padding="8 6")
         submit_btn.pack(side=tk.LEFT, padx=5)
         
+        # As-you-type next moves, refreshed once typing pauses; Tab takes the first one
+        self.suggestion_label = ttk.Label(self.entry_frame, text="", style='Game.TLabel')
+        self.suggestion_label.pack(side=tk.LEFT, padx=10)
+        self.word_entry.bind('<KeyRelease>', self.schedule_suggestions)
+        self.word_entry.bind('<Tab>', self.accept_suggestion)
+        
         # Game info frame
         self.info_frame = ttk.Frame(main_frame, style='Game.TFrame')
         self.info_frame.pack(fill=tk.X, padx=30, pady=10)
@@ -438,10 +751,15 @@ class WordLadderGame:
         valid, message = self.validate_move(word, prev_word)
         if valid:
             self.tries.append(word)
+            if self.session_log:
+                self.session_log.move(word)
             self.update_word_display()
             
             if word == self.end_word:
                 score = self.calculate_score()
+                if self.session_log:
+                    self.session_log.win(score)
+                self.record_result(solved=True, score=score)
                 win_message = (
                     f"🎉 Congratulations! You've completed the word ladder! 🎉\n"
                     f"Path: {' → '.join([self.start_word] + self.tries)}\n"
@@ -530,6 +848,8 @@ class WordLadderGame:
                                text=f"Tries remaining: {tries_left}",
                                style='Game.TLabel')
         tries_label.pack(pady=5)
+        
+        self.schedule_suggestions()
     
     def draw_node(self, canvas, x, y, word, is_start=False, is_current=False, is_end=False, can_remove=False, word_index=None):
         """Draw a node with word label and optional remove button with animation."""
@@ -598,6 +918,8 @@ class WordLadderGame:
             
             # Remove the word and all words that come after it
             self.tries = self.tries[:index]
+            if self.session_log:
+                self.session_log.remove(index)
             self.update_word_display()
             
             # Update message
@@ -610,14 +932,44 @@ class WordLadderGame:
             # Clear the entry field to allow for new input
             self.word_entry.delete(0, tk.END)
     
-    def start_game(self):
+    def start_daily_game(self):
+        """Start today's puzzle for the selected mode."""
+        # Draw from the graph the game will be played on
+        self.apply_pending_dictionary()
+        self.set_edit_ladder(self.edit_ladder_var.get())
+        mode = self.mode_var.get()
+        challenge = None
+        try:
+            if mode == "Challenge":
+                # Day-seeded constraints, the same for every player of this puzzle
+                words, challenge = self.daily_puzzles().challenge()
+            else:
+                words = self.daily_puzzles().puzzle(mode=mode)
+        except ValueError:
+            # No pair in this dictionary fits the mode; play a random game instead
+            words = None
+        self.start_game(words, challenge)
+    
+    def start_game(self, words=None, challenge=None):
         """Start a new game with the given parameters."""
+        # A game left unfinished counts as unsolved for its puzzle's solve rate
+        if self.tries:
+            self.record_result(solved=False)
+        
+        # A dictionary reloaded mid-game takes effect from the next game
+        self.apply_pending_dictionary()
+        
         # Setup game mode
         mode = self.mode_var.get()
+        self.set_edit_ladder(self.edit_ladder_var.get())
+        self.cost_model = self.cost_var.get()
         self.setup_game_mode(mode)
         
-        # Select random words for the current mode
-        self.start_word, self.end_word = self.select_random_words()
+        # Select random words for the current mode, unless a puzzle was given
+        self.start_word, self.end_word = words or self.select_random_words()
+        
+        if mode == "Challenge":
+            self.setup_challenge(challenge)
         
         # Calculate max tries based on minimum path
         self.max_tries[mode], self.min_tries = self.calculate_max_tries()
@@ -629,12 +981,27 @@ class WordLadderGame:
         # Calculate optimal path
         algorithm = self.algorithm_var.get()
         self.optimal_path = self.find_path(self.start_word, self.end_word, algorithm)
+        if self.challenge:
+            # An unconstrained ladder may cross banned words; hints follow the builder's ladder
+            self.optimal_path = self.challenge.ladder
         
         if not self.optimal_path:
             self.set_message(f"No path found between '{self.start_word}' and '{self.end_word}'. Trying new words...")
             self.start_game()  # Retry with new words
             return
         
+        if self.session_log:
+            self.session_log.game_start(self.start_word, self.end_word, mode, algorithm)
+        self.result_recorded = False
+        
+        # Keep every optimal ladder so hints can accept any of them
+        self.ladders = self.shortest_ladders(self.start_word, self.end_word)
+        
+        # Keep the search towards end_word warm for hints and auto-solve after detours
+        self.solver = IncrementalSolver(self.play_graph(), self.end_word)
+        self.solver.distance(self.start_word)
+        self._suggestions = (None, [])  # Challenge bans differ between games
+        
         # Show the entry frame now that the game has started
         # Move the entry frame to appear above the info frame
         self.entry_frame.pack(fill=tk.X, padx=20, pady=5, before=self.info_frame)
@@ -650,6 +1017,7 @@ class WordLadderGame:
         message = (
             f"Transform '{self.start_word}' to '{self.end_word}'\n\n"
             f"Minimum possible moves: {self.min_tries}\n"
+            f"Optimal ladders: {self.ladders.count()}\n"
             f"Maximum allowed moves: {self.max_tries[mode]}\n"
             f"Mode: {mode} ({self.word_lengths[mode]}-letter words)"
         )
@@ -659,6 +1027,11 @@ class WordLadderGame:
                 f"\n\nBanned words: {', '.join(self.banned_words)}\n"
                 f"Restricted letters: {', '.join(self.restricted_letters)}"
             )
+            if self.challenge:
+                # The builder lowers the detour when no constraints within budget force the full one
+                message += f"\nDetour: +{self.challenge.detour} moves over the unconstrained shortest ladder"
+                if self.challenge.detour < self.challenge_detour:
+                    message += f" (this puzzle cannot be held to +{self.challenge_detour})"
             
             # Display challenge mode rules in the message text box
             challenge_rules = (
@@ -687,26 +1060,79 @@ class WordLadderGame:
         current_word = self.start_word if not self.tries else self.tries[-1]
         
         # Find where we are in the optimal path
-        try:
-            current_index = self.optimal_path.index(current_word)
-            if current_index < len(self.optimal_path) - 1:
-                next_word = self.optimal_path[current_index + 1]
-                self.show_game_info(f"Hint: Try using '{next_word}'")
-                # Auto-fill the entry box with the hint
-                self.word_entry.delete(0, tk.END)
-                self.word_entry.insert(0, next_word)
+        next_word = self.next_hint(self.optimal_path, current_word)
+        
+        # Any optimal move is fine; stay on the solver's ladder when it is one of them
+        options = self.ladders.next_words(current_word)
+        if options and next_word not in options:
+            next_word = options[0]
+        elif not options:
+            # Off every optimal ladder: best move from here, not from the start word
+            next_word = self.solver.next_move(current_word)
+        
+        if next_word:
+            if len(options) > 1:
+                self.show_game_info(f"Hint: Try using '{next_word}' "
+                                    f"(one of {len(options)} optimal moves)")
             else:
-                self.show_game_info("You're at the end! Try to reach the target word.")
-        except ValueError:
-            # If current word is not in optimal path, suggest the next word from start
-            self.show_game_info(f"Hint: Try using '{self.optimal_path[1]}'")
+                self.show_game_info(f"Hint: Try using '{next_word}'")
+            # Auto-fill the entry box with the hint
+            self.word_entry.delete(0, tk.END)
+            self.word_entry.insert(0, next_word)
+        else:
+            self.show_game_info("You're at the end! Try to reach the target word.")
+    
+    def suggest_moves(self, current_word, prefix="", limit=5):
+        """Return up to limit (word, moves to end) next moves starting with prefix, best first."""
+        graph = self.play_graph()  # Challenge-forbidden words are not in it
+        key = (graph, self.end_word, current_word)
+        if self._suggestions[0] != key:
+            # Rank the neighbor list once per position; keystrokes only filter it
+            ranked = []
+            for word in graph.neighbors(current_word):
+                distance = self.solver.distance(word)
+                ranked.append((distance is None, distance, word))
+            ranked.sort()
+            self._suggestions = (key, [(word, distance) for _, distance, word in ranked])
+        return [move for move in self._suggestions[1] if move[0].startswith(prefix)][:limit]
+    
+    def schedule_suggestions(self, event=None):
+        """Refresh the suggestions once typing pauses instead of on every keystroke."""
+        if self._suggestion_job is not None:
+            self.root.after_cancel(self._suggestion_job)
+        self._suggestion_job = self.root.after(150, self.show_suggestions)
+    
+    def show_suggestions(self):
+        """Show the best next moves matching what has been typed so far."""
+        self._suggestion_job = None
+        current_word = self.start_word if not self.tries else self.tries[-1]
+        if current_word == self.end_word:
+            self.suggestion_label.config(text="")
+            return
+        prefix = self.word_entry.get().strip().lower()
+        moves = self.suggest_moves(current_word, prefix)
+        if moves:
+            text = "  ".join(f"{word} ({'?' if distance is None else distance})"
+                             for word, distance in moves)
+        else:
+            text = "No valid move starts like that"
+        self.suggestion_label.config(text=text)
+    
+    def accept_suggestion(self, event=None):
+        """Fill the entry with the best matching suggestion."""
+        current_word = self.start_word if not self.tries else self.tries[-1]
+        moves = self.suggest_moves(current_word, self.word_entry.get().strip().lower(), 1)
+        if moves:
             self.word_entry.delete(0, tk.END)
-            self.word_entry.insert(0, self.optimal_path[1])
+            self.word_entry.insert(0, moves[0][0])
+        return "break"  # Keep focus in the entry
     
     def reset_game(self):
         """Reset the current game."""
         # Reset tries
         self.tries = []
+        if self.session_log:
+            self.session_log.reset()
         self.update_word_display()
         
         # Clear entry field
@@ -723,44 +1149,62 @@ class WordLadderGame:
         # Filter dictionary by word length for the current mode
         self.active_dictionary = {word for word in self.dictionary if len(word) == word_length}
         
-        if mode == "Challenge":
-            # Select random banned words and restricted letters
-            self.banned_words = set(random.sample(list(self.active_dictionary), 5))
-            self.restricted_letters = set(random.sample('abcdefghijklmnopqrstuvwxyz', 3))
-            # Remove banned words from active dictionary
-            self.active_dictionary -= self.banned_words
-        else:
-            self.banned_words = set()
-            self.restricted_letters = set()
+        # Challenge constraints depend on the puzzle, so setup_challenge() sets them once words are drawn
+        self.banned_words = set()
+        self.restricted_letters = set()
+        self.challenge = None
     
-    def select_random_words(self):
+    def setup_challenge(self, challenge=None):
+        """Ban words and letters for the current puzzle so that it stays solvable at the target detour.
+
+        A prebuilt challenge (e.g. the daily one) is used as given.
+        """
+        if challenge is None:
+            try:
+                challenge = self.challenge_builder().build(self.start_word, self.end_word,
+                                                           detour=self.challenge_detour)
+            except ValueError:
+                self.challenge = None
+                return
+        self.challenge = challenge
+        self.banned_words = self.challenge.banned_words
+        self.restricted_letters = self.challenge.restricted_letters
+        # Remove banned words from active dictionary
+        self.active_dictionary -= self.banned_words
+    
+    def select_random_words(self, algorithm=None):
         """Select random start and end words based on current game mode."""
+        # Headless callers (e.g. the solver service) pass the algorithm explicitly
+        if algorithm is None:
+            algorithm = self.algorithm_var.get()
+        
         # Filter words based on current game mode's word length
         word_length = self.word_lengths[self.game_mode]
         valid_words = {word for word in self.dictionary if len(word) == word_length}
         
         if len(valid_words) < 2:
-            self.set_message("Not enough words in dictionary for this mode. Using default words.")
+            if hasattr(self, 'message_text'):
+                self.set_message("Not enough words in dictionary for this mode. Using default words.")
             return "cat", "dog"  # Fallback
         
         # Keep trying until we find a pair with a valid path of appropriate length
-        min_path_length = {
-            "Beginner": 3,  # At least 2 moves (3 words including start and end)
-            "Advanced": 4,  # At least 3 moves (4 words including start and end)
-            "Challenge": 4  # At least 3 moves (4 words including start and end)
-        }
-        
-        required_length = min_path_length[self.game_mode]
-        
-        for _ in range(100):  # Limit attempts to avoid infinite loop
-            start_word = random.choice(list(valid_words))
-            end_word = random.choice(list(valid_words))
-            
-            if start_word != end_word:
-                # Verify that a path exists between the words
-                test_path = self.find_path(start_word, end_word, self.algorithm_var.get())
-                if test_path and len(test_path) >= required_length:
-                    return start_word, end_word
+        required_length = self.min_path_length[self.game_mode]
+        
+        # One lookup in the precomputed table; nearby bands if the mode's band has no fit
+        table = self.difficulty_table()
+        band = self.difficulty_bands[self.game_mode]
+        for candidate_band in [band] + [b for b in BANDS if b != band]:
+            pair = table.sample(word_length, candidate_band, required_length - 1)
+            if pair:
+                return pair
+        
+        # Draw every attempt up front and check them as one batch that shares BFS trees
+        valid_words = list(valid_words)
+        attempts = [(random.choice(valid_words), random.choice(valid_words)) for _ in range(100)]
+        attempts = [(start_word, end_word) for start_word, end_word in attempts if start_word != end_word]
+        for (start_word, end_word), moves in zip(attempts, self.query_planner().distances(attempts)):
+            if moves is not None and moves + 1 >= required_length:
+                return start_word, end_word
         
         # If no valid pair found after 100 attempts, use appropriate defaults
         if self.game_mode == "Beginner":
@@ -772,8 +1216,12 @@ class WordLadderGame:
     
     def calculate_max_tries(self):
         """Calculate maximum tries based on minimum path length."""
-        # Find minimum path length using A* (most efficient)
-        optimal_path = self.find_path(self.start_word, self.end_word, "A*")
+        if self.challenge:
+            # The builder already knows the fewest moves under the Challenge constraints
+            optimal_path = self.challenge.ladder
+        else:
+            # Find minimum path length using A* (most efficient)
+            optimal_path = self.find_path(self.start_word, self.end_word, "A*")
         if not optimal_path:
             return 8, 5  # Default fallback if no path found (max_tries, min_tries)
         
@@ -782,77 +1230,66 @@ class WordLadderGame:
         
         return max_tries, min_tries
     
+    def record_result(self, solved, score=0.0, auto_solved=False):
+        """Store the current game's outcome once, if a stats store is open."""
+        if self.result_recorded:
+            return
+        self.result_recorded = True
+        if not self.stats_store:
+            return
+        self.stats_store.record_game(self.game_mode, self.algorithm_var.get(),
+                                     self.start_word, self.end_word, len(self.tries),
+                                     self.min_tries, score, solved, auto_solved)
+    
     def calculate_score(self):
         """Calculate score out of 10 based on moves taken vs minimum possible."""
         if not hasattr(self, 'min_tries'):
             return 0
         
-        moves_taken = len(self.tries)
-        max_allowed = self.max_tries[self.game_mode]
-        
-        # Score formula:
-        # 10 points if completed in minimum tries
-        # Linear reduction down to 5 points if used maximum tries
-        # Below 5 if went over optimal path but still within max tries
-        
-        if moves_taken <= self.min_tries:
-            score = 10.0  # Perfect score
-        else:
-            # Calculate score reduction for each extra move
-            extra_moves = moves_taken - self.min_tries
-            max_extra_moves = max_allowed - self.min_tries
-            
-            # Score reduces from 10 to 5 over the allowed extra moves
-            score = 10.0 - (5.0 * extra_moves / max_extra_moves)
-        
-        # Ensure score is between 0 and 10
-        score = max(0.0, min(10.0, score))
-        
-        return round(score, 1)
+        # 10 points in the minimum, sliding to 5 at the move limit
+        return score_moves(len(self.tries), self.min_tries, self.max_tries[self.game_mode])
     
     def show_graph(self):
         """Display a simple word ladder graph showing the path taken."""
+        # Only one path window at a time, since they all share the renderer's figure
+        if getattr(self, 'graph_popup', None) is not None:
+            self.graph_popup.destroy()
+        
         # Create popup window
         popup = tk.Toplevel(self.root)
         popup.title("Word Ladder Path")
         popup.geometry("800x600")
+        self.graph_popup = popup
         
-        # Create graph
-        G = nx.Graph()
-        
-        # Add nodes and edges for the path taken
         path = [self.start_word] + self.tries
-        for i in range(len(path) - 1):
-            G.add_edge(path[i], path[i + 1])
-        
-        # Create figure
-        fig = plt.figure(figsize=(8, 6), facecolor='white')
-        plt.clf()
+        figure = self.renderer.draw_path(path, self.start_word, self.end_word)
         
-        # Set layout
-        pos = nx.spring_layout(G)
-        
-        # Draw edges
-        nx.draw_networkx_edges(G, pos, edge_color='gray')
+        # Add to window
+        canvas = FigureCanvasTkAgg(figure, master=popup)
+        canvas.draw()
+        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
         
-        # Draw nodes
-        node_colors = ['lightgreen' if node == self.start_word 
-                       else 'lightcoral' if node == self.end_word 
-                       else 'lightblue' for node in G.nodes()]
+        # Optional view of the real graph around the path
+        neighborhood_var = tk.BooleanVar(value=False)
         
-        nx.draw_networkx_nodes(G, pos, node_color=node_colors, node_size=2000)
-        nx.draw_networkx_labels(G, pos, font_size=12, font_weight='bold')
+        def redraw():
+            self.renderer.draw_path(path, self.start_word, self.end_word,
+                                    neighborhood=neighborhood_var.get())
+            canvas.draw_idle()
         
-        plt.title("Word Ladder Path", pad=20)
-        plt.axis('off')
+        def close():
+            # Release the drawing and the Tk canvas so nothing outlives the window
+            self.renderer.release()
+            canvas.get_tk_widget().destroy()
+            popup.destroy()
+            self.graph_popup = None
         
-        # Add to window
-        canvas = FigureCanvasTkAgg(fig, master=popup)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        ttk.Checkbutton(popup, text="Show neighborhood", variable=neighborhood_var,
+                        command=redraw).pack(pady=(5, 0))
         
         # Add close button
-        ttk.Button(popup, text="Close", command=popup.destroy).pack(pady=10)
+        ttk.Button(popup, text="Close", command=close).pack(pady=10)
+        popup.protocol("WM_DELETE_WINDOW", close)
     
     def show_game_info(self, message):
         """Show game information in a popup window with improved styling."""
@@ -915,11 +1352,31 @@ class WordLadderGame:
             self.show_game_info("Start a game first to see the solution.")
             return
         
+        # Solve from the player's current position, reusing the warm search
+        current_word = self.start_word if not self.tries else self.tries[-1]
+        solution = self.solver.path_from(current_word)
+        if not solution:
+            self.show_game_info(f"No path from '{current_word}' to '{self.end_word}'.")
+            return
+        if len(solution) < 2:
+            self.show_game_info("You've already reached the target word!")
+            return
+        max_tries = self.max_tries[self.game_mode]
+        restarted = len(self.tries) + len(solution) - 1 > max_tries
+        if restarted:
+            # Too few tries left to finish from here; start over so the ladder fits the limit
+            self.tries = []
+            if self.session_log:
+                self.session_log.reset()
+            solution = self.solver.path_from(self.start_word)
+        steps = solution[1:]
+        moves_before = len(self.tries)
+        
         # Disable buttons during animation
         self.disable_buttons()
         
-        # Reset game state
-        self.tries = []
+        if self.session_log:
+            self.session_log.auto_solve()
         self.update_word_display()
         
         # Create popup for solution animation
@@ -928,12 +1385,13 @@ class WordLadderGame:
         popup.geometry("600x400")
         popup.configure(bg='#2C3E50')
         
-        # Get the current algorithm
-        algorithm = self.algorithm_var.get()
+        # Tell the player why their moves were cleared
+        intro = (f"Not enough tries left from '{current_word}', so starting over from "
+                 f"'{self.start_word}'.\n" if restarted else "")
         
         # Add info label
         info_label = ttk.Label(popup, 
-                              text=f"Watch as AI solves the word ladder using {algorithm} algorithm...",
+                              text=f"{intro}Watch a shortest ladder from '{solution[0]}' play out...",
                               style='Game.TLabel',
                               padding="20")
         info_label.pack(pady=20)
@@ -947,41 +1405,53 @@ class WordLadderGame:
         
         # Function to update solution step by step
         def animate_solution():
-            if len(self.tries) < len(self.optimal_path) - 1:
-                next_word = self.optimal_path[len(self.tries) + 1]
+            step_index = len(self.tries) - moves_before
+            if step_index < len(steps):
+                next_word = steps[step_index]
                 self.tries.append(next_word)
+                if self.session_log:
+                    self.session_log.move(next_word)
                 self.update_word_display()
                 
                 # Update info label
                 step_num = len(self.tries)
-                total_steps = len(self.optimal_path) - 1
-                info_label.config(text=f"Step {step_num} of {total_steps}: {next_word}")
+                info_label.config(text=f"Step {step_index + 1} of {len(steps)}: {next_word}")
                 
                 # Update statistics
                 stats_text = (
                     f"Current path: {' → '.join([self.start_word] + self.tries)}\n"
                     f"Steps taken: {step_num} of {self.min_tries} (minimum)\n"
-                    f"Tries remaining: {self.max_tries[self.game_mode] - step_num}\n"
-                    f"Algorithm: {algorithm}"
+                    f"Tries remaining: {max(0, max_tries - step_num)}"
                 )
                 stats_label.config(text=stats_text)
                 
                 # Schedule next step
-                if len(self.tries) < len(self.optimal_path) - 1:
+                if step_index + 1 < len(steps):
                     popup.after(1000, animate_solution)
                 else:
                     # Calculate final score
                     score = self.calculate_score()
+                    if self.session_log:
+                        self.session_log.win(score)
+                    self.record_result(solved=True, score=score, auto_solved=True)
                     
                     # Show completion message with statistics
                     completion_text = (
                         "Solution Complete! 🎉\n\n"
                         f"Path: {' → '.join([self.start_word] + self.tries)}\n"
                         f"Steps taken: {len(self.tries)} (Minimum possible: {self.min_tries})\n"
-                        f"Score: {score}/10\n"
-                        f"Algorithm: {algorithm}\n\n"
-                        "This was the optimal solution found by the AI!"
+                        f"Score: {score}/10\n\n"
+                        + ("Finished along a shortest ladder from your position!" if moves_before
+                           else "This is a shortest ladder for the puzzle!")
                     )
+                    
+                    # Mention the next-best route so players can try another way there
+                    alternatives = self.find_k_paths(self.start_word, self.end_word, 2)
+                    if len(alternatives) > 1:
+                        completion_text += (
+                            f"\nAnother way there ({len(alternatives[1]) - 1} moves): "
+                            f"{' → '.join(alternatives[1])}"
+                        )
                     info_label.config(text=completion_text)
                     stats_label.config(text="")  # Clear the stats label
                     
@@ -1067,7 +1537,7 @@ class WordLadderGame:
         results_text.configure(yscrollcommand=scrollbar.set)
         
         # Add initial message
-        results_text.insert(tk.END, "Running comparison of BFS, UCS, and A* algorithms...\n\n")
+        results_text.insert(tk.END, "Running comparison of BFS, UCS, A* and A* (letters)...\n\n")
         results_text.see(tk.END)
         
         # Add current algorithm label
@@ -1140,15 +1610,20 @@ class WordLadderGame:
         
         # Function to run each algorithm and update results
         def run_comparison():
-            algorithms = ["BFS", "UCS", "A*"]
+            algorithms = ["BFS", "UCS", "A*", "A* (letters)"]
             algorithm_colors = {
                 "BFS": "#3498DB",  # Blue
                 "UCS": "#9B59B6",  # Purple
-                "A*": "#2ECC71"    # Green
+                "A*": "#2ECC71",   # Green
+                "A* (letters)": "#F39C12"  # Orange
             }
             
-            # Run each algorithm multiple times to get more accurate timing
-            num_runs = 5  # Run each algorithm 5 times for more accurate timing
+            # Time every algorithm in interleaved rounds so drift during the run hits them alike
+            results_text.insert(tk.END, "Timing all algorithms in interleaved rounds...\n\n")
+            popup.update()
+            timings = dict(zip(algorithms, measure_interleaved(
+                [(self.find_path, (self.start_word, self.end_word, algorithm))
+                 for algorithm in algorithms])))
             
             for algorithm in algorithms:
                 # Update status and current algorithm label
@@ -1159,25 +1634,19 @@ class WordLadderGame:
                 results_text.see(tk.END)
                 popup.update()  # Force UI update
                 
-                # Measure time with multiple runs for more accuracy
-                total_time = 0
-                path = None
-                
-                for run in range(num_runs):
-                    start_time = time.perf_counter()  # Use perf_counter for higher precision
-                    path = self.find_path(self.start_word, self.end_word, algorithm)
-                    end_time = time.perf_counter()
-                    total_time += (end_time - start_time)
-                
-                # Calculate average time
-                avg_time = total_time / num_runs
+                timing = timings[algorithm]
+                path = self.find_path(self.start_word, self.end_word, algorithm)
                 
                 # Calculate metrics
                 path_length = len(path) - 1 if path else "No path found"
+                if self.stats_store:
+                    self.stats_store.record_timing(algorithm, self.start_word, self.end_word,
+                                                   timing.median, len(path) - 1 if path else None)
                 
                 # Store results
                 results[algorithm] = {
-                    "time": avg_time,
+                    "time": timing.median,
+                    "timing": timing,
                     "path_length": path_length,
                     "path": path
                 }
@@ -1186,7 +1655,10 @@ class WordLadderGame:
                 visualize_path(path, algorithm)
                 
                 # Update results display
-                results_text.insert(tk.END, f"  - Time: {avg_time:.8f} seconds (avg of {num_runs} runs)\n")
+                ci_low, ci_high = timing.confidence_interval()
+                results_text.insert(tk.END, f"  - Time: {timing.median:.8f} seconds median "
+                                            f"(IQR {timing.iqr:.8f}, 95% CI {ci_low:.8f}–{ci_high:.8f}, "
+                                            f"{len(timing)} samples × {timing.loops} runs)\n")
                 results_text.insert(tk.END, f"  - Path length: {path_length}\n")
                 if path:
                     results_text.insert(tk.END, f"  - Path: {' → '.join(path)}\n")
@@ -1208,30 +1680,36 @@ class WordLadderGame:
             
             # Display summary
             fastest_time = results[fastest]["time"]
-            if fastest_time > 0.000001:  # Ensure we have a meaningful time measurement
-                results_text.insert(tk.END, f"Fastest algorithm: {fastest} ({results[fastest]['time']:.8f} seconds)\n")
-                
-                if path_lengths:
-                    shortest = min(path_lengths, key=path_lengths.get)
-                    results_text.insert(tk.END, f"Shortest path: {shortest} (length: {path_lengths[shortest]})\n\n")
-                
-                # Performance comparison as percentage
-                results_text.insert(tk.END, "Performance comparison (time):\n")
-                for alg in algorithms:
-                    time_ratio = results[alg]["time"] / fastest_time
-                    percentage = (time_ratio - 1) * 100
-                    if alg == fastest:
-                        results_text.insert(tk.END, f"  - {alg}: Baseline (fastest)\n")
-                    else:
-                        results_text.insert(tk.END, f"  - {alg}: {percentage:.2f}% slower than {fastest}\n")
-            else:
-                results_text.insert(tk.END, "All algorithms completed too quickly for accurate timing comparison.\n")
-                results_text.insert(tk.END, "Try with longer words or a more complex word ladder.\n")
-                
-                # Just show the raw times
-                results_text.insert(tk.END, "\nRaw timing results:\n")
-                for alg in algorithms:
-                    results_text.insert(tk.END, f"  - {alg}: {results[alg]['time']:.8f} seconds\n")
+            results_text.insert(tk.END, f"Fastest algorithm: {fastest} ({fastest_time:.8f} seconds median)\n")
+            
+            if path_lengths:
+                shortest = min(path_lengths, key=path_lengths.get)
+                results_text.insert(tk.END, f"Shortest path: {shortest} (length: {path_lengths[shortest]})\n\n")
+            
+            # Performance comparison as percentage, flagging differences that are just noise
+            # or too small to matter (under 5% apart, or overlapping median intervals)
+            results_text.insert(tk.END, "Performance comparison (median time):\n")
+            for alg in algorithms:
+                if alg == fastest:
+                    results_text.insert(tk.END, f"  - {alg}: Baseline (fastest)\n")
+                    continue
+                percentage = (results[alg]["time"] / fastest_time - 1) * 100
+                p_value = mann_whitney_p(results[alg]["timing"], results[fastest]["timing"])
+                verdict = ("significant" if is_significant(results[alg]["timing"], results[fastest]["timing"])
+                           else "NOT significant, within noise")
+                results_text.insert(tk.END, f"  - {alg}: {percentage:.2f}% slower than {fastest} "
+                                            f"(p = {p_value:.3f}, {verdict})\n")
+            
+            # Alternative routes show how much slack near-optimal ladders have
+            alternatives = self.find_k_paths(self.start_word, self.end_word, 5)
+            if alternatives:
+                shortest_length = len(alternatives[0]) - 1
+                results_text.insert(tk.END, "\nAlternative routes (k-shortest ladders):\n")
+                for rank, path in enumerate(alternatives, 1):
+                    slack = len(path) - 1 - shortest_length
+                    results_text.insert(tk.END, f"  {rank}. {' → '.join(path)} "
+                                                f"({len(path) - 1} moves, +{slack})\n")
+                results_text.see(tk.END)
             
             # Update current algorithm label
             current_algo_label.config(text=f"Fastest Algorithm: {fastest}")
@@ -1254,14 +1732,37 @@ class WordLadderGame:
         # Run comparison after a short delay to allow UI to update
         popup.after(100, run_comparison)
     
-    def run(self):
+    def run(self, log_file='session.wlog', stats_file='stats.db'):
         """Run the game."""
         self.setup_ui()
-        self.root.mainloop()
+        self.session_log = SessionLog(log_file, self.graph)
+        self.stats_store = StatsStore(stats_file)
+        self.watch_dictionary()
+        try:
+            self.root.mainloop()
+        finally:
+            if self.tries:
+                self.record_result(solved=False)
+            self.stats_store.close()
+            self.session_log.close()
 
 # Example usage
 if __name__ == "__main__":
-    game = WordLadderGame()
+    import argparse
+    import profiling
+    
+    parser = argparse.ArgumentParser(description="Word Ladder Adventure Game")
+    parser.add_argument("--profile", choices=profiling.MODES,
+                        help=f"Capture cProfile stats or tracemalloc snapshots "
+                             f"(or set {profiling.PROFILE_ENV})")
+    parser.add_argument("--profile-dir", default=None,
+                        help=f"Where captures are written (or set {profiling.PROFILE_DIR_ENV})")
+    parser.add_argument("--dictionary-backend", choices=("set", "dawg"), default="set",
+                        help="Store the dictionary as a set or as a compact DAWG")
+    args = parser.parse_args()
+    
+    game = WordLadderGame(dictionary_backend=args.dictionary_backend)
+    profiling.install_from_env(game, args.profile, args.profile_dir)
     game.run()
 
 
@@ -0,0 +1,202 @@
+try:
+    import numpy as np
+except ImportError:  # The int-bitset backend needs nothing beyond the standard library
+    np = None
+
+
+class BitsetBFS:
+    """Breadth-first search over word IDs with whole-level set operations.
+
+    Instead of popping one word at a time, each BFS level is expanded at
+    once. With NumPy the frontier and visited sets are boolean arrays and
+    a level is a vectorized gather over the CSR adjacency (indptr/indices)
+    of the word graph; for many sources at once (all-pairs sweeps) a level
+    is a single OR-reduction over a (words x sources) frontier matrix.
+    Without NumPy the same sets are Python ints used as bitsets, with one
+    precomputed neighbor mask per word.
+    """
+
+    def __init__(self, graph, backend=None):
+        self.graph = graph
+        self.size = len(graph)
+        self.backend = backend or ("numpy" if np is not None else "int")
+        if self.backend == "numpy":
+            if np is None:
+                raise ImportError("The numpy backend requires NumPy")
+            degrees = np.fromiter((len(n) for n in graph.adjacency), dtype=np.int64,
+                                  count=self.size)
+            self.indptr = np.zeros(self.size + 1, dtype=np.int64)
+            np.cumsum(degrees, out=self.indptr[1:])
+            self.indices = np.fromiter((j for n in graph.adjacency for j in n),
+                                       dtype=np.int32, count=int(self.indptr[-1]))
+        elif self.backend == "int":
+            self.masks = [sum(1 << j for j in neighbors) for neighbors in graph.adjacency]
+        else:
+            raise ValueError(f"Unknown backend: {self.backend}")
+
+    def _gather(self, rows):
+        """Return the concatenated neighbor IDs of the given rows (NumPy backend)."""
+        starts = self.indptr[rows]
+        counts = self.indptr[rows + 1] - starts
+        total = int(counts.sum())
+        if not total:
+            return self.indices[:0]
+        # Offsets of each row's slice inside the flat gather
+        offsets = np.repeat(starts - np.cumsum(counts) + counts, counts)
+        return self.indices[offsets + np.arange(total)]
+
+    def distances(self, source, target=None):
+        """Return moves from source to every word (-1 if unreachable).
+
+        With a target the sweep stops after the level that reaches it.
+        """
+        if self.backend == "numpy":
+            return self._distances_numpy(source, target)
+        return self._distances_int(source, target)
+
+    def _distances_numpy(self, source, target):
+        dist = np.full(self.size, -1, dtype=np.int32)
+        visited = np.zeros(self.size, dtype=bool)
+        frontier = np.array([source], dtype=np.int64)
+        visited[source] = True
+        dist[source] = 0
+        depth = 0
+        while frontier.size and (target is None or dist[target] < 0):
+            depth += 1
+            candidates = self._gather(frontier)
+            candidates = candidates[~visited[candidates]]
+            if not candidates.size:
+                break
+            # Duplicates are harmless: they all get the same depth
+            visited[candidates] = True
+            dist[candidates] = depth
+            frontier = np.unique(candidates)
+        return dist
+
+    def _distances_int(self, source, target):
+        dist = [-1] * self.size
+        dist[source] = 0
+        visited = frontier = 1 << source
+        target_bit = 1 << target if target is not None else 0
+        masks = self.masks
+        depth = 0
+        while frontier and not visited & target_bit:
+            depth += 1
+            expanded = 0
+            bits = frontier
+            while bits:
+                low = bits & -bits
+                expanded |= masks[low.bit_length() - 1]
+                bits ^= low
+            frontier = expanded & ~visited
+            visited |= frontier
+            bits = frontier
+            while bits:
+                low = bits & -bits
+                dist[low.bit_length() - 1] = depth
+                bits ^= low
+        return dist
+
+    def shortest_path(self, start_word, end_word):
+        """Return one shortest ladder as a list of words, or None."""
+        if start_word not in self.graph or end_word not in self.graph:
+            return None
+        start = self.graph.ids[start_word]
+        end = self.graph.ids[end_word]
+        # Sweep from the end so the path can be read off greedily from the start
+        dist = self.distances(end, target=start)
+        if dist[start] < 0:
+            return None
+        path = [start]
+        while path[-1] != end:
+            step = dist[path[-1]] - 1
+            path.append(next(n for n in self.graph.neighbor_ids(path[-1]) if dist[n] == step))
+        return [self.graph.words[i] for i in path]
+
+    def all_distances(self, sources=None, batch=64):
+        """Yield (source, distances) for many sources, sweeping a batch of them per pass.
+
+        The NumPy backend advances every source in a batch together: a
+        level is one OR-reduction of the frontier matrix over each word's
+        neighbor slice. The int backend runs one bitset BFS per source.
+        """
+        if sources is None:
+            sources = range(self.size)
+        sources = list(sources)
+        if self.backend != "numpy":
+            for source in sources:
+                yield source, self.distances(source)
+            return
+
+        has_neighbors = self.indptr[1:] > self.indptr[:-1]
+        row_starts = self.indptr[:-1][has_neighbors]
+        for first in range(0, len(sources), batch):
+            chunk = np.asarray(sources[first:first + batch], dtype=np.int64)
+            columns = np.arange(len(chunk))
+            dist = np.full((self.size, len(chunk)), -1, dtype=np.int32)
+            frontier = np.zeros((self.size, len(chunk)), dtype=bool)
+            frontier[chunk, columns] = True
+            visited = frontier.copy()
+            dist[chunk, columns] = 0
+            depth = 0
+            while frontier.any():
+                depth += 1
+                expanded = np.zeros_like(frontier)
+                if row_starts.size:
+                    # Row v of the result ORs the frontier rows of v's neighbors
+                    expanded[has_neighbors] = np.logical_or.reduceat(
+                        frontier[self.indices], row_starts, axis=0)
+                frontier = expanded & ~visited
+                visited |= frontier
+                dist[frontier] = depth
+            for column, source in enumerate(chunk):
+                yield int(source), dist[:, column]
+
+
+def benchmark(dictionary_file='dictionary.txt', sources=None, repeats=3):
+    """Time full-graph distance sweeps: queue BFS vs. both bitset backends."""
+    import time
+    from Game import WordLadderGame
+
+    game = WordLadderGame(dictionary_file)
+    graph = game.graph
+    sources = sources or len(graph)
+    words = graph.words[:sources]
+
+    def sweep_queue():
+        # The current bfs: one search per (source, target) would be quadratic,
+        # so time its per-node loop as a full sweep from each source instead
+        for source in words:
+            visited = {source}
+            queue = [source]
+            while queue:
+                current = queue.pop(0)
+                for neighbor in game.find_neighbors(current):
+                    if neighbor not in visited:
+                        visited.add(neighbor)
+                        queue.append(neighbor)
+
+    engines = {"queue bfs": sweep_queue}
+    for backend in ("int", "numpy"):
+        if backend == "numpy" and np is None:
+            continue
+        engine = BitsetBFS(graph, backend)
+        engines[f"bitset ({backend})"] = \
+            lambda engine=engine: [engine.distances(graph.ids[w]) for w in words]
+        if backend == "numpy":
+            engines["bitset (numpy, batched)"] = \
+                lambda engine=engine: list(engine.all_distances(range(len(words))))
+
+    print(f"Full sweeps from {len(words)} sources over {len(graph)} words")
+    for name, run in engines.items():
+        best = float('inf')
+        for _ in range(repeats):
+            start_time = time.perf_counter()
+            run()
+            best = min(best, time.perf_counter() - start_time)
+        print(f"  {name:<26} {best * 1000:9.2f} ms")
+
+
+if __name__ == "__main__":
+    import sys
+    benchmark(*sys.argv[1:2])
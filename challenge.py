@@ -0,0 +1,258 @@
+import random
+from collections import Counter
+
+ALPHABET = 'abcdefghijklmnopqrstuvwxyz'
+
+
+class CutStructure:
+    """Articulation points and biconnected blocks of a WordGraph.
+
+    One iterative Tarjan DFS finds them all. Substitution ladders never
+    change a word's length, so the blocks of each length's graph come out
+    of the same pass. The blocks and cut words form the block-cut tree,
+    and the blocks on its route between two words hold every word that a
+    ladder between them without repeated words can use.
+    """
+
+    def __init__(self, graph):
+        self.graph = graph
+        size = len(graph)
+        self.articulation = set()  # Word IDs whose removal splits their component
+        self.blocks = []           # Biconnected blocks as lists of word IDs
+        self.word_blocks = [[] for _ in range(size)]  # word ID -> indexes of its blocks
+        self._find_blocks()
+
+    def _find_blocks(self):
+        adjacency = self.graph.adjacency
+        size = len(self.graph)
+        discovered = [-1] * size
+        low = [0] * size
+        timer = 0
+        for root in range(size):
+            if discovered[root] >= 0:
+                continue
+            discovered[root] = low[root] = timer
+            timer += 1
+            root_children = 0
+            edges = []  # Tree and back edges not yet assigned to a block
+            stack = [(root, -1, iter(adjacency[root]))]
+            while stack:
+                word_id, parent, neighbors = stack[-1]
+                for neighbor in neighbors:
+                    if discovered[neighbor] < 0:
+                        discovered[neighbor] = low[neighbor] = timer
+                        timer += 1
+                        edges.append((word_id, neighbor))
+                        stack.append((neighbor, word_id, iter(adjacency[neighbor])))
+                        if word_id == root:
+                            root_children += 1
+                        break
+                    if neighbor != parent and discovered[neighbor] < discovered[word_id]:
+                        edges.append((word_id, neighbor))
+                        low[word_id] = min(low[word_id], discovered[neighbor])
+                else:
+                    stack.pop()
+                    if parent < 0:
+                        continue
+                    low[parent] = min(low[parent], low[word_id])
+                    if low[word_id] >= discovered[parent]:
+                        # Nothing below word_id reaches above parent: close a block
+                        if parent != root:
+                            self.articulation.add(parent)
+                        block = set()
+                        while True:
+                            edge = edges.pop()
+                            block.update(edge)
+                            if edge == (parent, word_id):
+                                break
+                        for member in block:
+                            self.word_blocks[member].append(len(self.blocks))
+                        self.blocks.append(sorted(block))
+            if root_children > 1:
+                self.articulation.add(root)
+
+    def _route(self, start, end):
+        """Return the block-cut tree nodes from start to end, or None if they are not connected.
+
+        Nodes are ('word', cut word ID) or ('block', block index).
+        """
+        source = ('word', start) if start in self.articulation else ('block', self.word_blocks[start][0]) \
+            if self.word_blocks[start] else None
+        target_blocks = set(self.word_blocks[end])
+        if source is None or not target_blocks:
+            return None
+        parents = {source: None}
+        frontier = [source]
+        found = None
+        while frontier and found is None:
+            next_frontier = []
+            for node in frontier:
+                kind, value = node
+                if kind == 'block':
+                    if value in target_blocks:
+                        found = node
+                        break
+                    linked = [('word', member) for member in self.blocks[value]
+                              if member in self.articulation]
+                else:
+                    linked = [('block', block) for block in self.word_blocks[value]]
+                for other in linked:
+                    if other not in parents:
+                        parents[other] = node
+                        next_frontier.append(other)
+            frontier = next_frontier
+        if found is None:
+            return None
+        route = []
+        node = found
+        while node is not None:
+            route.append(node)
+            node = parents[node]
+        return route[::-1]
+
+    def corridor(self, start, end):
+        """Return the IDs of every word some simple ladder from start to end can use, or None.
+
+        A simple ladder stays inside the blocks on the block-cut tree route;
+        leaving one means returning through the same cut word.
+        """
+        if start == end:
+            return {start}
+        route = self._route(start, end)
+        if route is None:
+            return None
+        return {member for kind, value in route if kind == 'block' for member in self.blocks[value]}
+
+
+class Challenge:
+    """Challenge constraints for one puzzle and the ladder that proves them solvable."""
+
+    __slots__ = ("banned_words", "restricted_letters", "ladder", "min_moves", "detour")
+
+    def __init__(self, banned_words, restricted_letters, ladder, min_moves, detour):
+        self.banned_words = banned_words
+        self.restricted_letters = restricted_letters
+        self.ladder = ladder        # A shortest ladder that obeys the constraints
+        self.min_moves = min_moves  # Fewest moves under the constraints
+        self.detour = detour        # Moves added over the unconstrained shortest ladder
+
+
+class ChallengeBuilder:
+    """Pick banned words and restricted letters that keep a puzzle solvable at a set detour.
+
+    Solvability comes from the witness: a ladder of shortest + detour
+    moves is chosen first, and only words off it and letters absent from
+    it are used, so it always survives.
+
+    Detour: every ladder crosses every distance-from-start layer, and a
+    ladder shorter than the witness only uses "shortcut" words, those on
+    some ladder shorter than it. If one layer's shortcut words are all
+    banned or restricted (and the witness's word there is not a shortcut),
+    no shorter ladder is left, so the minimum is exactly the witness
+    length. Everything is read off two distance fields.
+
+    CutStructure narrows where constraints go: a shorter ladder can be
+    taken without repeated words, so it stays in the corridor of blocks
+    between the endpoints. Words outside it (dead ends hanging off a cut
+    word) are never counted as shortcuts, and filler bans go to corridor
+    words first, where they actually block routes. When no layer can be
+    closed within the ban budget the detour is lowered until one can;
+    Challenge.detour is the one reached.
+    """
+
+    def __init__(self, graph):
+        self.graph = graph
+        self.cuts = CutStructure(graph)
+
+    def _descend(self, word_id, field, rng):
+        """Walk from word_id down a distance field to its root; return the word IDs."""
+        adjacency = self.graph.adjacency
+        path = [word_id]
+        remaining = field[word_id]
+        while remaining:
+            remaining -= 1
+            word_id = rng.choice([n for n in adjacency[word_id] if field.get(n) == remaining])
+            path.append(word_id)
+        return path
+
+    def _witnesses(self, length, from_start, to_end, rng, attempts=20):
+        """Yield simple ladders of exactly length moves, each through a different middle word."""
+        via = [word_id for word_id, moves in from_start.items() if moves + to_end[word_id] == length]
+        rng.shuffle(via)
+        for word_id in via[:attempts]:
+            ladder = self._descend(word_id, from_start, rng)[::-1] + self._descend(word_id, to_end, rng)[1:]
+            if len(set(ladder)) == len(ladder):
+                yield ladder
+
+    def _close_layer(self, ladder, shortcuts, from_start, to_end, banned, letters, candidates):
+        """Pick letters, then words, that remove every shortcut from one layer; return them or None."""
+        words = self.graph.words
+        length = len(ladder) - 1
+        # A layer where the witness itself could shortcut (e.g. at a cut word) cannot be closed
+        blocked = {from_start[word_id] for word_id in ladder
+                   if from_start[word_id] + to_end[word_id] < length}
+        layers = {}
+        for word_id in shortcuts:
+            layers.setdefault(from_start[word_id], []).append(word_id)
+        best = None
+        for moves in range(1, from_start[ladder[-1]]):
+            if moves in blocked:
+                continue
+            remaining = layers.get(moves, [])
+            chosen = set()
+            # Greedy cover: each letter goes where it knocks out the most of this layer
+            while remaining and candidates and len(chosen) < letters:
+                hits = Counter(letter for word_id in remaining for letter in set(words[word_id]))
+                letter = max(candidates, key=lambda letter: 0 if letter in chosen else hits[letter])
+                if not hits[letter] or letter in chosen:
+                    break
+                chosen.add(letter)
+                remaining = [word_id for word_id in remaining if letter not in words[word_id]]
+            if best is None or len(remaining) < len(best[1]):
+                best = (chosen, remaining)
+        if best is None or len(best[1]) > banned:
+            return None
+        return best[0], set(best[1])
+
+    def build(self, start_word, end_word, banned=5, letters=3, detour=2, rng=random):
+        """Return a Challenge for a puzzle; raise ValueError if the words are not connected."""
+        graph = self.graph
+        start, end = graph.ids.get(start_word), graph.ids.get(end_word)
+        corridor = self.cuts.corridor(start, end) if start is not None and end is not None else None
+        if corridor is None:
+            raise ValueError(f"No ladder between '{start_word}' and '{end_word}'")
+        from_start = graph.distance_field(start)
+        to_end = graph.distance_field(end)
+        shortest = from_start[end]
+        words = graph.words
+
+        for extra in range(detour, -1, -1):
+            for ladder in self._witnesses(shortest + extra, from_start, to_end, rng):
+                length = len(ladder) - 1
+                on_ladder = set(ladder)
+                shortcuts = [word_id for word_id, moves in from_start.items()
+                             if moves + to_end[word_id] < length and word_id not in on_ladder
+                             and word_id in corridor]
+                used = set("".join(words[word_id] for word_id in ladder))
+                candidates = [letter for letter in ALPHABET if letter not in used]
+                rng.shuffle(candidates)  # Random order breaks ties between equally useful letters
+                closed = self._close_layer(ladder, shortcuts, from_start, to_end, banned, letters,
+                                           candidates) if extra else (set(), set())
+                if closed is None:
+                    continue
+                restricted, banned_ids = closed
+
+                # Spare letters go to those knocking out the most other shortcuts
+                hits = Counter(letter for word_id in shortcuts for letter in set(words[word_id]))
+                spare = sorted((letter for letter in candidates if letter not in restricted),
+                               key=lambda letter: -hits[letter])
+                restricted.update(spare[:letters - len(restricted)])
+                # Spare bans go to other shortcuts, then other corridor words, then any off the witness
+                for pool in (shortcuts, sorted(corridor),
+                             graph.words_of_length(len(start_word))):
+                    spare = [word_id for word_id in pool
+                             if word_id not in on_ladder and word_id not in banned_ids]
+                    banned_ids.update(rng.sample(spare, min(banned - len(banned_ids), len(spare))))
+                return Challenge({words[word_id] for word_id in banned_ids}, restricted,
+                                 [words[word_id] for word_id in ladder], length, extra)
+        raise ValueError(f"No ladder between '{start_word}' and '{end_word}'")
@@ -0,0 +1,124 @@
+import math
+from collections import Counter
+
+
+class RarityPenalty:
+    """Extra cost for moving onto rare words.
+
+    Words are ranked by how common they are and split into `levels`
+    quantiles: the most common quantile costs nothing extra, the rarest
+    costs levels - 1. Commonness comes from `frequencies` ({word: count},
+    e.g. from a corpus) when given, otherwise from how common the word's
+    letters are across the dictionary, which is a usable stand-in when
+    no frequency list ships with the word list.
+    """
+
+    def __init__(self, words, frequencies=None, levels=4):
+        words = list(words)
+        if frequencies is None:
+            letter_counts = Counter(letter for word in words for letter in word)
+            total = sum(letter_counts.values())
+            commonness = {word: sum(math.log(letter_counts[letter] / total) for letter in word)
+                          / max(len(word), 1) for word in words}
+        else:
+            commonness = {word: math.log(frequencies.get(word, 0) + 1) for word in words}
+        ranked = sorted(words, key=lambda word: (-commonness[word], word))
+        self.max_penalty = levels - 1
+        self.penalties = {word: rank * levels // max(len(ranked), 1)
+                          for rank, word in enumerate(ranked)}
+
+    def __call__(self, from_word, to_word):
+        return self.penalties.get(to_word, self.max_penalty)
+
+
+class PositionPenalty:
+    """Extra cost by which letter position a move changes (e.g. the first letter is harder to spot)."""
+
+    def __init__(self, penalties=None):
+        self.penalties = penalties if penalties is not None else {0: 2}
+        self.max_penalty = max(self.penalties.values(), default=0)
+
+    def __call__(self, from_word, to_word):
+        # First differing position; for an insertion or deletion it is where the words part
+        for position, (a, b) in enumerate(zip(from_word, to_word)):
+            if a != b:
+                return self.penalties.get(position, 0)
+        return self.penalties.get(min(len(from_word), len(to_word)), 0)
+
+
+class LetterPenalty:
+    """Extra cost for words containing given letters or for given words, as Challenge mode sets them."""
+
+    def __init__(self, letters=(), words=(), penalty=5):
+        self.letters = frozenset(letters)
+        self.words = frozenset(words)
+        self.penalty = penalty
+        self.max_penalty = penalty
+
+    def __call__(self, from_word, to_word):
+        if to_word in self.words or not self.letters.isdisjoint(to_word):
+            return self.penalty
+        return 0
+
+
+class EdgeCosts:
+    """Step cost of a move: 1 plus the penalties of every model, memoized per edge."""
+
+    def __init__(self, *models):
+        self.models = models
+        self.max_cost = 1 + sum(model.max_penalty for model in models)
+        self.cache = {}
+
+    def __call__(self, from_word, to_word):
+        key = (from_word, to_word)
+        cost = self.cache.get(key)
+        if cost is None:
+            cost = 1 + sum(model(from_word, to_word) for model in self.models)
+            self.cache[key] = cost
+        return cost
+
+
+def cheapest_ladder(graph, start_word, end_word, costs):
+    """Dial's algorithm: return (path, total cost) of the cheapest ladder, or (None, None).
+
+    Costs are small positive integers bounded by costs.max_cost, so the
+    frontier is a ring of max_cost + 1 buckets indexed by cost instead of
+    a heap; pushing and popping are list appends and pops. Paths are
+    rebuilt from a parent map rather than copied onto every entry.
+    """
+    start, end = graph.ids.get(start_word), graph.ids.get(end_word)
+    if start is None or end is None:
+        return None, None
+    words = graph.words
+    adjacency = graph.adjacency
+    size = costs.max_cost + 1
+    buckets = [[] for _ in range(size)]
+    buckets[0].append(start)
+    dist = {start: 0}
+    parent = {start: None}
+    pending = 1
+    current = 0
+    while pending:
+        bucket = buckets[current % size]
+        # Every cost is between 1 and max_cost, so nothing lands back in this bucket
+        while bucket:
+            word_id = bucket.pop()
+            pending -= 1
+            if dist[word_id] != current:
+                continue  # Superseded by a cheaper entry
+            if word_id == end:
+                path = []
+                while word_id is not None:
+                    path.append(words[word_id])
+                    word_id = parent[word_id]
+                return path[::-1], current
+            word = words[word_id]
+            for neighbor in adjacency[word_id]:
+                new_cost = current + costs(word, words[neighbor])
+                if new_cost < dist.get(neighbor, new_cost + 1):
+                    dist[neighbor] = new_cost
+                    parent[neighbor] = word_id
+                    buckets[new_cost % size].append(neighbor)
+                    pending += 1
+        current += 1
+    return None, None
@@ -0,0 +1,130 @@
+import datetime
+import hashlib
+import json
+import os
+import random
+import threading
+
+from challenge import Challenge
+from difficulty import BANDS
+from session_log import dictionary_fingerprint
+
+
+class DailyPuzzles:
+    """Reproducible puzzles for a date or seed, memoized in a small JSON file.
+
+    Each puzzle comes from its own random.Random seeded by a hash of the
+    key, the mode and the word table, so the global random module is never
+    touched and every player asking for the same day gets the same ladder.
+    Challenge constraints are built from that same generator right after
+    the pair and cached with it, so they are the same for everyone too.
+    The cache keeps the most recent max_entries puzzles.
+    """
+
+    def __init__(self, game, cache_file='daily_cache.json', max_entries=1000):
+        self.game = game
+        self.cache_file = cache_file
+        self.max_entries = max_entries
+        self.lock = threading.Lock()
+        self.cache = self._load()
+
+    def _load(self):
+        """Read the on-disk cache, starting empty if it is missing or unreadable."""
+        try:
+            with open(self.cache_file, 'r') as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def _save(self):
+        """Write the cache atomically so a crash never leaves half a file."""
+        while len(self.cache) > self.max_entries:
+            del self.cache[next(iter(self.cache))]
+        temp_file = self.cache_file + '.tmp'
+        with open(temp_file, 'w') as f:
+            json.dump(self.cache, f)
+        os.replace(temp_file, self.cache_file)
+
+    def _cache_key(self, key, mode):
+        """Key a puzzle by seed, mode and the exact graph it was drawn from."""
+        graph = self.game.graph
+        kind = "edit" if graph.edits else "sub"
+        return f"{dictionary_fingerprint(graph.words).hex()}:{kind}:{mode}:{key}"
+
+    def puzzle(self, day=None, mode="Beginner", seed=None):
+        """Return the (start, end) puzzle for a date (default: today, UTC) or an explicit seed."""
+        return tuple(self._entry(day, mode, seed)[:2])
+
+    def challenge(self, day=None, seed=None):
+        """Return ((start, end), Challenge) for a date or seed; the Challenge is None if none fits."""
+        entry = self._entry(day, "Challenge", seed)
+        constraints = entry[2]
+        if constraints is None:
+            return tuple(entry[:2]), None
+        return tuple(entry[:2]), Challenge(set(constraints["banned_words"]),
+                                           set(constraints["restricted_letters"]),
+                                           constraints["ladder"], constraints["min_moves"],
+                                           constraints["detour"])
+
+    def _entry(self, day, mode, seed):
+        """Return the cached [start, end] (plus constraints for Challenge), drawing it if needed."""
+        if seed is None:
+            day = day or datetime.datetime.now(datetime.timezone.utc).date()
+            key = f"date:{day.isoformat() if hasattr(day, 'isoformat') else day}"
+        else:
+            key = f"seed:{seed}"
+        cache_key = self._cache_key(key, mode)
+
+        with self.lock:
+            entry = self.cache.get(cache_key)
+            # Challenge entries cached before constraints were kept are drawn again
+            if entry is not None and (mode != "Challenge" or len(entry) > 2):
+                return entry
+
+            rng = random.Random(int.from_bytes(
+                hashlib.blake2b(cache_key.encode(), digest_size=8).digest(), 'big'))
+            entry = list(self._draw(mode, rng))
+            if mode == "Challenge":
+                entry.append(self._constraints(entry, rng))
+            self.cache[cache_key] = entry
+            self._save()
+            return entry
+
+    def _constraints(self, pair, rng):
+        """Build Challenge constraints for a pair with rng only, as a JSON-ready dict or None."""
+        game = self.game
+        try:
+            challenge = game.challenge_builder().build(pair[0], pair[1], detour=game.challenge_detour,
+                                                       rng=rng)
+        except ValueError:
+            return None
+        return {
+            "banned_words": sorted(challenge.banned_words),
+            "restricted_letters": "".join(sorted(challenge.restricted_letters)),
+            "ladder": challenge.ladder,
+            "min_moves": challenge.min_moves,
+            "detour": challenge.detour,
+        }
+
+    def _draw(self, mode, rng):
+        """Draw one puzzle for a mode from the difficulty table using rng only."""
+        game = self.game
+        table = game.difficulty_table()
+        length = game.word_lengths[mode]
+        band = game.difficulty_bands[mode]
+        min_moves = game.min_path_length[mode] - 1
+        for candidate_band in [band] + [b for b in BANDS if b != band]:
+            pair = table.sample(length, candidate_band, min_moves, rng=rng)
+            if pair:
+                return pair
+        raise ValueError(f"No puzzle available for mode {mode}")
+
+
+if __name__ == "__main__":
+    import sys
+    from Game import WordLadderGame
+
+    day = sys.argv[1] if len(sys.argv) > 1 else None
+    mode = sys.argv[2] if len(sys.argv) > 2 else "Beginner"
+    start_word, end_word = DailyPuzzles(WordLadderGame()).puzzle(day, mode)
+    print(f"{day or 'Today'} ({mode}): {start_word} → {end_word}")
@@ -0,0 +1,155 @@
+import sys
+from array import array
+
+
+class _Node:
+    """A state of the automaton while it is being built."""
+
+    __slots__ = ("edges", "final", "number")
+
+    def __init__(self):
+        self.edges = {}
+        self.final = False
+        self.number = None
+
+    def key(self):
+        """Identify the state by its finality and (label, child) pairs; children are numbered first."""
+        return self.final, tuple((label, child.number) for label, child in sorted(self.edges.items()))
+
+
+class Dawg:
+    """A read-only word set stored as a minimal acyclic automaton (DAWG).
+
+    Words sharing prefixes share a path from the root and words sharing
+    suffixes share a path into the final states, so a large lexicon needs
+    far fewer states than characters. It is built with Daciuk's
+    incremental algorithm over the sorted words, then flattened into
+    arrays: each state's outgoing edges are a slice of one label string
+    and one target array, so there is no per-word Python object at all.
+
+    Supports `in`, len() and sorted iteration like the set it replaces,
+    plus substitutions(), which walks the automaton for the words one
+    letter away instead of probing 26 x L candidate strings.
+    """
+
+    def __init__(self, words):
+        self.size = 0
+        nodes = self._build(words)
+        self.first = array('I', [0])  # state -> offset of its first edge; one extra end entry
+        self.targets = array('I')
+        self.final = bytearray(len(nodes))
+        labels = []
+        for node in nodes:
+            for label, child in sorted(node.edges.items()):
+                labels.append(label)
+                self.targets.append(child.number)
+            self.first.append(len(labels))
+            self.final[node.number] = node.final
+        self.labels = "".join(labels)
+
+    def _build(self, words):
+        """Build the minimal automaton; return its states ordered by number (root first)."""
+        root = _Node()
+        register = {}
+        unchecked = []  # (parent, label, child) along the last word, not yet minimized
+
+        def minimize(down_to):
+            while len(unchecked) > down_to:
+                parent, label, child = unchecked.pop()
+                key = child.key()
+                if key in register:
+                    parent.edges[label] = register[key]
+                else:
+                    child.number = len(register) + 1  # 0 is the root
+                    register[key] = child
+
+        previous = ""
+        for word in sorted(set(words)):
+            common = 0
+            while common < min(len(word), len(previous)) and word[common] == previous[common]:
+                common += 1
+            minimize(common)
+            node = unchecked[-1][2] if unchecked else root
+            for label in word[common:]:
+                child = _Node()
+                node.edges[label] = child
+                unchecked.append((node, label, child))
+                node = child
+            node.final = True
+            self.size += 1
+            previous = word
+        minimize(0)
+
+        root.number = 0
+        nodes = [root] + list(register.values())
+        nodes.sort(key=lambda node: node.number)
+        return nodes
+
+    def _step(self, state, letter):
+        """Follow the edge labelled letter out of state; return the target or None."""
+        k = self.labels.find(letter, self.first[state], self.first[state + 1])
+        return self.targets[k] if k >= 0 else None
+
+    def _walk(self, state, word, start=0):
+        """Follow word[start:] from state; return the state reached or None."""
+        for i in range(start, len(word)):
+            state = self._step(state, word[i])
+            if state is None:
+                return None
+        return state
+
+    def __contains__(self, word):
+        if not isinstance(word, str):
+            return False
+        state = self._walk(0, word)
+        return state is not None and self.final[state] == 1
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        """Yield the words in sorted order."""
+        stack = [(0, "")]
+        while stack:
+            state, prefix = stack.pop()
+            if self.final[state]:
+                yield prefix
+            # Push in reverse so the smallest label is explored first
+            for k in range(self.first[state + 1] - 1, self.first[state] - 1, -1):
+                stack.append((self.targets[k], prefix + self.labels[k]))
+
+    def substitutions(self, word):
+        """Return the words that differ from word in exactly one position."""
+        found = []
+        state = 0
+        for i, letter in enumerate(word):
+            for k in range(self.first[state], self.first[state + 1]):
+                if self.labels[k] == letter:
+                    continue
+                # Any other letter here must be followed by the rest of word exactly
+                end = self._walk(self.targets[k], word, i + 1)
+                if end is not None and self.final[end]:
+                    found.append(word[:i] + self.labels[k] + word[i + 1:])
+            state = self._step(state, letter)
+            if state is None:
+                break
+        return found
+
+    def states(self):
+        """Return the number of states in the automaton."""
+        return len(self.final)
+
+    def nbytes(self):
+        """Return the approximate memory held by the flattened automaton."""
+        return (sys.getsizeof(self.labels) + sys.getsizeof(self.first)
+                + sys.getsizeof(self.targets) + sys.getsizeof(self.final))
+
+
+if __name__ == "__main__":
+    dictionary_file = sys.argv[1] if len(sys.argv) > 1 else "dictionary.txt"
+    with open(dictionary_file, 'r') as f:
+        words = {word.strip().lower() for word in f if word.strip()}
+    dawg = Dawg(words)
+    set_bytes = sys.getsizeof(words) + sum(sys.getsizeof(word) for word in words)
+    print(f"{len(dawg)} words, {dawg.states()} states, {len(dawg.labels)} edges")
+    print(f"set: {set_bytes / 1024:.1f} KiB, DAWG: {dawg.nbytes() / 1024:.1f} KiB")
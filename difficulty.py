@@ -0,0 +1,226 @@
+import random
+
+BANDS = ("easy", "medium", "hard")
+# Sweep budget for tables that only draw puzzles: plenty of pairs per band, far fewer than all pairs
+PUZZLE_SOURCES = (8, 64)      # Fewest and most sources swept
+PUZZLE_SWEEP_WORDS = 2_000_000  # Word visits allowed across all sweeps
+PUZZLE_PAIRS = 8192           # Pairs kept in total, spread over the sources
+
+
+class DifficultyTable:
+    """Precomputed graph metrics and difficulty-banded puzzle pairs.
+
+    One BFS per source word yields, in a single pass, the distances used
+    for eccentricity, the number of shortest ladders to every target (the
+    solution count) and Brandes' dependency accumulation for betweenness.
+    With max_sources set, only a seeded sample of sources is swept and
+    betweenness is scaled up accordingly (the usual pivot approximation).
+    A word that is not a source gets the longest distance any sweep
+    reached it at, a lower bound on its eccentricity.
+
+    With pairs_per_source set, each sweep keeps only a seeded sample of its
+    same-length targets, so the table holds at most max_sources x
+    pairs_per_source pairs instead of every pair. The kept pairs of each
+    word length are ranked by score and split into equal easy/medium/hard
+    bands, so picking a puzzle is one random lookup. difficulty() scores
+    any other pair on demand.
+    """
+
+    # Weights of the score terms; distance dominates, the rest breaks ties
+    DISTANCE_WEIGHT = 1.0
+    SCARCITY_WEIGHT = 2.0    # few optimal ladders -> harder to stumble on one
+    DEAD_END_WEIGHT = 1.0    # low-degree endpoints -> fewer ways in or out
+    REMOTENESS_WEIGHT = 1.0  # endpoints on the rim of their component
+
+    def __init__(self, graph, max_sources=None, pairs_per_source=None, seed=0, betweenness=True):
+        self.graph = graph
+        self.pairs_per_source = pairs_per_source
+        self.with_betweenness = betweenness  # Puzzle drawing never reads it, and it doubles each sweep
+        rng = random.Random(seed)
+        size = len(graph)
+        self.degree = [len(neighbors) for neighbors in graph.adjacency]
+        self.component = [-1] * size
+        self.component_size = []
+        self._label_components()
+
+        self.eccentricity = [0] * size
+        self.betweenness = [0.0] * size
+        self.pairs = {}  # (start ID, end ID) -> (score, moves, solutions), sampled pairs only
+
+        sources = list(range(size))
+        if max_sources is not None and max_sources < size:
+            sources = rng.sample(sources, max_sources)
+        scale = size / len(sources) if sources else 1.0
+        for source in sources:
+            self._sweep(source, scale, rng)
+
+        self.bands = {}  # (word length, band) -> [(start ID, end ID, moves)]
+        self._build_bands()
+
+    def _label_components(self):
+        """Label connected components and record their sizes."""
+        for root in range(len(self.graph)):
+            if self.component[root] >= 0:
+                continue
+            label = len(self.component_size)
+            self.component[root] = label
+            stack = [root]
+            count = 0
+            while stack:
+                word_id = stack.pop()
+                count += 1
+                for neighbor in self.graph.neighbor_ids(word_id):
+                    if self.component[neighbor] < 0:
+                        self.component[neighbor] = label
+                        stack.append(neighbor)
+            self.component_size.append(count)
+
+    def _sweep(self, source, scale, rng):
+        """BFS from one source: distances, path counts, eccentricity, betweenness, pairs."""
+        adjacency = self.graph.adjacency
+        dist = {source: 0}
+        sigma = {source: 1}
+        order = [source]
+        head = 0
+        while head < len(order):
+            word_id = order[head]
+            head += 1
+            next_depth = dist[word_id] + 1
+            for neighbor in adjacency[word_id]:
+                if neighbor not in dist:
+                    dist[neighbor] = next_depth
+                    sigma[neighbor] = 0
+                    order.append(neighbor)
+                if dist[neighbor] == next_depth:
+                    sigma[neighbor] += sigma[word_id]
+
+        # Distances are symmetric, so every reached word is at least this far from something
+        eccentricity = self.eccentricity
+        for word_id in order:
+            if dist[word_id] > eccentricity[word_id]:
+                eccentricity[word_id] = dist[word_id]
+        eccentricity[source] = dist[order[-1]]
+
+        if self.with_betweenness:
+            self._accumulate(source, scale, dist, sigma, order)
+
+        length = len(self.graph.words[source])
+        targets = [target for target in order[1:] if len(self.graph.words[target]) == length]
+        if self.pairs_per_source is not None and len(targets) > self.pairs_per_source:
+            targets = rng.sample(targets, self.pairs_per_source)
+        for target in targets:
+            self.pairs[(source, target)] = (None, dist[target], sigma[target])
+
+    def _accumulate(self, source, scale, dist, sigma, order):
+        """Brandes: push dependencies back from the farthest words into betweenness."""
+        adjacency = self.graph.adjacency
+        delta = dict.fromkeys(order, 0.0)
+        for word_id in reversed(order):
+            depth = dist[word_id]
+            for neighbor in adjacency[word_id]:
+                if dist.get(neighbor) == depth - 1:
+                    delta[neighbor] += sigma[neighbor] / sigma[word_id] * (1 + delta[word_id])
+            if word_id != source:
+                # Undirected graph: every pair is seen from both ends, hence / 2
+                self.betweenness[word_id] += delta[word_id] * scale / 2
+
+    def _score(self, start, end, moves, solutions):
+        """Combine distance, solution count and endpoint metrics into one number."""
+        diameter = max(self.eccentricity[start], self.eccentricity[end], 1)
+        remoteness = (self.eccentricity[start] + self.eccentricity[end]) / (2 * diameter)
+        return (self.DISTANCE_WEIGHT * moves
+                + self.SCARCITY_WEIGHT / solutions
+                + self.DEAD_END_WEIGHT * (1 / self.degree[start] + 1 / self.degree[end])
+                + self.REMOTENESS_WEIGHT * remoteness)
+
+    def _build_bands(self):
+        """Score the kept pairs, then split each word length's pairs into equal bands."""
+        by_length = {}
+        for (start, end), (_, moves, solutions) in self.pairs.items():
+            score = self._score(start, end, moves, solutions)
+            self.pairs[(start, end)] = (score, moves, solutions)
+            by_length.setdefault(len(self.graph.words[start]), []).append((score, start, end, moves))
+
+        for length, scored in by_length.items():
+            scored.sort()
+            cut = len(scored) / len(BANDS)
+            for i, band in enumerate(BANDS):
+                chunk = scored[int(i * cut):int((i + 1) * cut)]
+                self.bands[(length, band)] = [(start, end, moves) for _, start, end, moves in chunk]
+
+    def metrics(self, word):
+        """Return the precomputed metrics of one word."""
+        word_id = self.graph.ids[word]
+        return {
+            "degree": self.degree[word_id],
+            "eccentricity": self.eccentricity[word_id],
+            "betweenness": self.betweenness[word_id],
+            "component_size": self.component_size[self.component[word_id]],
+        }
+
+    def difficulty(self, start_word, end_word):
+        """Return (score, moves, solutions) for a pair, or None if either word is unknown or unsolvable."""
+        start, end = self.graph.ids.get(start_word), self.graph.ids.get(end_word)
+        if start is None or end is None or start == end:
+            return None
+        if (start, end) in self.pairs:
+            return self.pairs[(start, end)]
+        # Not sampled: count shortest ladders with a BFS that stops after end's level
+        adjacency = self.graph.adjacency
+        dist = {start: 0}
+        sigma = {start: 1}
+        frontier = [start]
+        while frontier and end not in dist:
+            next_frontier = []
+            for word_id in frontier:
+                next_depth = dist[word_id] + 1
+                for neighbor in adjacency[word_id]:
+                    if neighbor not in dist:
+                        dist[neighbor] = next_depth
+                        sigma[neighbor] = 0
+                        next_frontier.append(neighbor)
+                    if dist[neighbor] == next_depth:
+                        sigma[neighbor] += sigma[word_id]
+            frontier = next_frontier
+        if end not in dist:
+            return None
+        moves, solutions = dist[end], sigma[end]
+        return self._score(start, end, moves, solutions), moves, solutions
+
+    def sample(self, length, band, min_moves=1, rng=random):
+        """Pick a random (start, end) pair of the given band, or None if the band is empty."""
+        candidates = self.bands.get((length, band), [])
+        if not candidates:
+            return None
+        pair = None
+        # Bands are sorted by score, so a few draws almost always clear min_moves
+        for _ in range(20):
+            start, end, moves = rng.choice(candidates)
+            if moves >= min_moves:
+                pair = start, end
+                break
+        else:
+            eligible = [(start, end) for start, end, moves in candidates if moves >= min_moves]
+            if not eligible:
+                return None
+            pair = rng.choice(eligible)
+        # Scores are symmetric, so either word can start; sampled sources then do not always lead
+        if rng.random() < 0.5:
+            pair = pair[::-1]
+        return self.graph.words[pair[0]], self.graph.words[pair[1]]
+
+
+def puzzle_table(graph, seed=0):
+    """Return a DifficultyTable sized for drawing puzzles rather than for graph statistics.
+
+    Fewer sources are swept as the graph grows, so building it costs about
+    PUZZLE_SWEEP_WORDS word visits at any size, and betweenness is skipped.
+    """
+    size = max(len(graph), 1)
+    if size * size <= PUZZLE_SWEEP_WORDS:
+        # Small enough to sweep every word and keep every pair
+        return DifficultyTable(graph, seed=seed, betweenness=False)
+    fewest, most = PUZZLE_SOURCES
+    sources = max(fewest, min(most, PUZZLE_SWEEP_WORDS // size))
+    return DifficultyTable(graph, max_sources=sources, pairs_per_source=PUZZLE_PAIRS // sources,
+                           seed=seed, betweenness=False)
@@ -0,0 +1,223 @@
+from collections import defaultdict
+
+
+class WordGraph:
+    """Read-only word table and neighbor index shared by the solvers.
+
+    Words get integer IDs (their position in the sorted word list) and each
+    word's one-letter neighbors are precomputed once through wildcard
+    buckets ("c_t" holds cat, cot, cut, ...), so later lookups never scan
+    the alphabet or the dictionary.
+
+    With edits=True the graph is an "edit ladder": words one insertion or
+    deletion apart are linked too. As in SymSpell, these edges come from
+    single-letter deletions ("cart" -> "art", "crt", "cat", "car") looked up
+    in the word table, so each word costs O(length) lookups no matter how
+    many words of the neighboring lengths exist.
+    """
+
+    def __init__(self, words, edits=False):
+        self.words = sorted(set(words))
+        self.ids = {word: i for i, word in enumerate(self.words)}
+        self.edits = edits
+        self.alphabet = sorted(set().union(*self.words))
+        self.adjacency = self._build_adjacency()
+        self._components = None
+
+    @classmethod
+    def from_file(cls, dictionary_file, edits=False):
+        """Build a graph straight from a dictionary file."""
+        with open(dictionary_file, 'r') as f:
+            return cls((word.strip().lower() for word in f if word.strip()), edits)
+
+    def _build_adjacency(self):
+        """Link every pair of words that share a wildcard bucket."""
+        buckets = defaultdict(list)
+        for i, word in enumerate(self.words):
+            for pos in range(len(word)):
+                buckets[word[:pos] + '_' + word[pos + 1:]].append(i)
+
+        adjacency = [[] for _ in self.words]
+        for members in buckets.values():
+            if len(members) < 2:
+                continue
+            for i in members:
+                # Two words can share at most one bucket, so no duplicates arise
+                adjacency[i].extend(j for j in members if j != i)
+
+        if self.edits:
+            for i, j in self._edit_pairs():
+                adjacency[i].append(j)
+                adjacency[j].append(i)
+        return [tuple(sorted(neighbors)) for neighbors in adjacency]
+
+    def _edit_pairs(self):
+        """Yield (shorter ID, longer ID) for every pair one deletion apart."""
+        for i, word in enumerate(self.words):
+            seen = set()
+            for pos in range(len(word)):
+                shorter = word[:pos] + word[pos + 1:]
+                # Deleting either letter of a double ("book" -> "bok") gives one edge
+                if shorter in seen:
+                    continue
+                seen.add(shorter)
+                j = self.ids.get(shorter)
+                if j is not None:
+                    yield j, i
+
+    def _probe(self, word):
+        """Return the IDs of word's neighbors by probing the word table.
+
+        Used for the handful of words an update adds, where building
+        wildcard buckets for the whole dictionary would be wasted work.
+        """
+        found = set()
+        for pos in range(len(word)):
+            for letter in self.alphabet:
+                if letter != word[pos]:
+                    found.add(self.ids.get(word[:pos] + letter + word[pos + 1:]))
+        if self.edits:
+            for pos in range(len(word)):
+                found.add(self.ids.get(word[:pos] + word[pos + 1:]))
+            for pos in range(len(word) + 1):
+                for letter in self.alphabet:
+                    found.add(self.ids.get(word[:pos] + letter + word[pos:]))
+        found.discard(None)
+        found.discard(self.ids.get(word))
+        return found
+
+    def with_changes(self, added=(), removed=()):
+        """Return a new graph with words added and removed, reusing this graph's index.
+
+        Only the added words are probed for neighbors; every other word keeps
+        its adjacency, renumbered, with removed words dropped. Component
+        labels, if already computed, carry over and only the components an
+        update touches are relabelled. This graph is left unchanged, so
+        anything still holding it keeps a consistent snapshot.
+        """
+        removed = {word for word in removed if word in self.ids}
+        added = {word for word in added if word not in self.ids}
+        graph = WordGraph.__new__(WordGraph)
+        # Two sorted runs, so this sort is a linear merge
+        graph.words = sorted([word for word in self.words if word not in removed] + sorted(added))
+        graph.ids = {word: i for i, word in enumerate(graph.words)}
+        graph.edits = self.edits
+        graph.alphabet = sorted(set(self.alphabet).union(*added))
+
+        remap = [graph.ids.get(word, -1) for word in self.words]
+        lookup = remap.__getitem__
+        adjacency = [None] * len(graph.words)
+        for old_id, new_id in enumerate(remap):
+            if new_id >= 0:
+                adjacency[new_id] = list(map(lookup, self.adjacency[old_id]))
+        # Only the old neighbors of removed words point at a dropped ID
+        for word in removed:
+            for j in self.adjacency[self.ids[word]]:
+                if remap[j] >= 0:
+                    adjacency[remap[j]] = [k for k in adjacency[remap[j]] if k >= 0]
+        touched = set()
+        for word in added:
+            word_id = graph.ids[word]
+            neighbors = graph._probe(word)
+            adjacency[word_id] = neighbors
+            for j in neighbors:
+                if graph.words[j] not in added:
+                    adjacency[j].append(word_id)
+                    touched.add(j)
+        for i in touched.union(graph.ids[word] for word in added):
+            adjacency[i] = sorted(adjacency[i])
+        graph.adjacency = [tuple(neighbors) for neighbors in adjacency]
+
+        graph._components = None
+        if self._components is not None:
+            graph._components = self._relabel(graph, remap, added, removed)
+        return graph
+
+    def _relabel(self, graph, remap, added, removed):
+        """Carry component labels over to graph, recomputing only touched components."""
+        old = self._components
+        dirty = {old[self.ids[word]] for word in removed}
+        for word in added:
+            for j in graph.adjacency[graph.ids[word]]:
+                old_id = self.ids.get(graph.words[j])
+                if old_id is not None:
+                    dirty.add(old[old_id])
+
+        labels = [-1] * len(graph)
+        pending = [graph.ids[word] for word in added]
+        for old_id, new_id in enumerate(remap):
+            if new_id >= 0:
+                if old[old_id] in dirty:
+                    pending.append(new_id)
+                else:
+                    labels[new_id] = old[old_id]
+        next_label = max(old, default=-1) + 1
+        for root in pending:
+            if labels[root] < 0:
+                graph._label_from(root, next_label, labels)
+                next_label += 1
+        return labels
+
+    def _label_from(self, root, label, labels):
+        """Give every unlabelled word in root's component the given label."""
+        labels[root] = label
+        stack = [root]
+        while stack:
+            word_id = stack.pop()
+            for neighbor in self.adjacency[word_id]:
+                if labels[neighbor] < 0:
+                    labels[neighbor] = label
+                    stack.append(neighbor)
+
+    def component_labels(self):
+        """Return a component label for every word ID, computing them on first use."""
+        if self._components is None:
+            labels = [-1] * len(self)
+            for root in range(len(self)):
+                if labels[root] < 0:
+                    self._label_from(root, root, labels)
+            self._components = labels
+        return self._components
+
+    def connected(self, word1, word2):
+        """Check whether a ladder exists between two words."""
+        labels = self.component_labels()
+        id1, id2 = self.ids.get(word1), self.ids.get(word2)
+        return id1 is not None and id2 is not None and labels[id1] == labels[id2]
+
+    def __contains__(self, word):
+        return word in self.ids
+
+    def __len__(self):
+        return len(self.words)
+
+    def neighbor_ids(self, word_id):
+        """Return the IDs of the words one letter away from word_id."""
+        return self.adjacency[word_id]
+
+    def neighbors(self, word):
+        """Return the words one letter away from word."""
+        word_id = self.ids.get(word)
+        if word_id is None:
+            return []
+        return [self.words[j] for j in self.adjacency[word_id]]
+
+    def distance_field(self, word_id):
+        """Return {word ID: moves to reach word_id} for its whole component."""
+        distances = {word_id: 0}
+        frontier = [word_id]
+        depth = 0
+        while frontier:
+            depth += 1
+            next_frontier = []
+            for current in frontier:
+                for neighbor in self.adjacency[current]:
+                    if neighbor not in distances:
+                        distances[neighbor] = depth
+                        next_frontier.append(neighbor)
+            frontier = next_frontier
+        return distances
+
+    def words_of_length(self, length):
+        """Return the IDs of every word with the given length."""
+        return [i for i, word in enumerate(self.words) if len(word) == length]
@@ -0,0 +1,124 @@
+import argparse
+import json
+import os
+from collections import Counter
+from multiprocessing import Pool
+
+from engine import WordGraph
+from shared_graph import SharedGraph
+
+# Each worker attaches to the shared graph once
+_worker_graph = None
+
+
+def _init_worker(handle):
+    """Attach this worker to the shared graph."""
+    global _worker_graph
+    _worker_graph = SharedGraph.attach(handle)
+
+
+def _sweep(sources):
+    """BFS from each source; return {source: distance histogram} (index = moves)."""
+    indptr = _worker_graph.indptr
+    indices = _worker_graph.indices
+    results = {}
+    for source in sources:
+        seen = {source}
+        frontier = [source]
+        histogram = [1]
+        while frontier:
+            next_frontier = []
+            for word_id in frontier:
+                for k in range(indptr[word_id], indptr[word_id + 1]):
+                    neighbor = indices[k]
+                    if neighbor not in seen:
+                        seen.add(neighbor)
+                        next_frontier.append(neighbor)
+            if next_frontier:
+                histogram.append(len(next_frontier))
+            frontier = next_frontier
+        results[source] = histogram
+    return results
+
+
+def build_report(graph, processes=None, chunk_size=64, min_moves=None):
+    """Compute per-length graph statistics with BFS sources spread over a process pool."""
+    min_moves = min_moves or {"Beginner": 2, "Advanced": 3, "Challenge": 3}
+    shared = SharedGraph.publish(graph)
+    try:
+        sources = list(range(len(graph)))
+        chunks = [sources[i:i + chunk_size] for i in range(0, len(sources), chunk_size)]
+        histograms = {}
+        with Pool(processes, initializer=_init_worker, initargs=(shared.handle(),)) as pool:
+            for result in pool.imap_unordered(_sweep, chunks):
+                histograms.update(result)
+    finally:
+        shared.close()
+
+    labels = graph.component_labels()
+    report = {}
+    for length in sorted({len(word) for word in graph.words}):
+        word_ids = graph.words_of_length(length)
+        degrees = [len(graph.neighbor_ids(i)) for i in word_ids]
+        component_sizes = Counter(labels[i] for i in word_ids)
+
+        distances = Counter()
+        diameter = 0
+        for word_id in word_ids:
+            histogram = histograms[word_id]
+            diameter = max(diameter, len(histogram) - 1)
+            for moves, count in enumerate(histogram[1:], 1):
+                distances[moves] += count
+        pairs = sum(distances.values())
+
+        report[length] = {
+            "words": len(word_ids),
+            "edges": sum(degrees) // 2,
+            "diameter": diameter,
+            "average_shortest_path": sum(d * c for d, c in distances.items()) / pairs if pairs else None,
+            "degree_histogram": dict(sorted(Counter(degrees).items())),
+            "component_sizes": sorted(component_sizes.values(), reverse=True),
+            "isolated_words": sorted(graph.words[i] for i in word_ids if not graph.neighbor_ids(i)),
+            # Ordered pairs far enough apart to be a puzzle in each mode
+            "mode_pairs": {mode: sum(c for d, c in distances.items() if d >= moves)
+                           for mode, moves in min_moves.items()},
+        }
+    return report
+
+
+def print_report(report):
+    """Print the report as a readable summary."""
+    for length, stats in report.items():
+        print(f"=== {length}-letter words ===")
+        print(f"  Words: {stats['words']}, edges: {stats['edges']}")
+        average = stats['average_shortest_path']
+        average = f"{average:.2f}" if average is not None else "n/a"
+        print(f"  Diameter: {stats['diameter']}, average shortest path: {average}")
+        print(f"  Components: {len(stats['component_sizes'])} "
+              f"(largest {stats['component_sizes'][0] if stats['component_sizes'] else 0})")
+        print(f"  Degree histogram: {stats['degree_histogram']}")
+        print(f"  Isolated words ({len(stats['isolated_words'])}): "
+              f"{', '.join(stats['isolated_words']) or 'none'}")
+        for mode, pairs in stats['mode_pairs'].items():
+            print(f"  {mode}: {pairs} candidate pairs{'' if pairs else ' (not supported)'}")
+        print()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="All-pairs statistics for a word ladder dictionary")
+    parser.add_argument("dictionary", nargs="?", default="dictionary.txt")
+    parser.add_argument("--processes", type=int, default=None)
+    parser.add_argument("--edits", action="store_true", help="Use the edit-ladder graph")
+    parser.add_argument("--json", metavar="FILE", help="Also write the report as JSON")
+    args = parser.parse_args()
+
+    graph = WordGraph.from_file(args.dictionary, edits=args.edits)
+    report = build_report(graph, args.processes or os.cpu_count())
+    print_report(report)
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
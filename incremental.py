@@ -0,0 +1,63 @@
+class IncrementalSolver:
+    """Answer "best path from here" towards one fixed end word.
+
+    The solver runs a BFS backwards from end_word but only as far as the
+    words asked about so far, and keeps its distances and open frontier
+    between calls. A query for a word inside the explored region is a walk
+    down the distance field (O(path length x degree)); a word outside it
+    just resumes the paused BFS for the missing levels. Removing words or
+    wandering off the optimal path therefore never starts a new search.
+    """
+
+    def __init__(self, graph, end_word):
+        self.graph = graph
+        self.end_word = end_word
+        self.end = graph.ids.get(end_word)
+        self.dist = {}      # word ID -> moves to end_word (final for every level explored)
+        self.frontier = []  # last explored level, where the BFS resumes
+        self.depth = 0
+        if self.end is not None:
+            self.dist[self.end] = 0
+            self.frontier = [self.end]
+
+    def _explore_until(self, word_id):
+        """Resume the backwards BFS, level by level, until word_id has a distance."""
+        dist = self.dist
+        adjacency = self.graph.adjacency
+        while word_id not in dist and self.frontier:
+            self.depth += 1
+            next_frontier = []
+            for current in self.frontier:
+                for neighbor in adjacency[current]:
+                    if neighbor not in dist:
+                        dist[neighbor] = self.depth
+                        next_frontier.append(neighbor)
+            self.frontier = next_frontier
+
+    def distance(self, word):
+        """Return the fewest moves from word to end_word, or None if unreachable."""
+        word_id = self.graph.ids.get(word)
+        if word_id is None:
+            return None
+        self._explore_until(word_id)
+        return self.dist.get(word_id)
+
+    def path_from(self, word):
+        """Return a shortest ladder from word to end_word, or None."""
+        remaining = self.distance(word)
+        if remaining is None:
+            return None
+        dist = self.dist
+        word_id = self.graph.ids[word]
+        path = [word_id]
+        while remaining:
+            remaining -= 1
+            # Every level below the current one is fully explored, so a step down exists
+            word_id = next(n for n in self.graph.neighbor_ids(word_id) if dist.get(n) == remaining)
+            path.append(word_id)
+        return [self.graph.words[i] for i in path]
+
+    def next_move(self, word):
+        """Return the first move of a shortest ladder from word, or None at the end."""
+        path = self.path_from(word)
+        return path[1] if path and len(path) > 1 else None
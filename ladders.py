@@ -0,0 +1,239 @@
+import heapq
+
+
+class ShortestLadders:
+    """All shortest ladders between two words, as a layered DAG.
+
+    The DAG is built in a single bidirectional BFS pass: both frontiers grow
+    one full level at a time (always the smaller one first) and every edge
+    that advances a level is recorded. The search stops on the level where
+    the frontiers touch, so only edges that can lie on a shortest ladder are
+    kept. Ladders are counted with dynamic programming and generated lazily,
+    so a pair with millions of optimal solutions never builds them all.
+    """
+
+    def __init__(self, graph, start_word, end_word):
+        self.graph = graph
+        self.start_word = start_word
+        self.end_word = end_word
+        self.children = {}   # word ID -> IDs one step closer to end_word
+        self.ways = {}       # word ID -> number of shortest ladders from it to end_word
+        self.length = None   # moves in a shortest ladder, None if unreachable
+        if start_word in graph and end_word in graph:
+            self._build()
+
+    def _build(self):
+        """Run the bidirectional layered BFS and count ladders per node."""
+        start = self.graph.ids[self.start_word]
+        end = self.graph.ids[self.end_word]
+        if start == end:
+            self.length = 0
+            self.ways = {start: 1}
+            return
+
+        edges = {}
+        front, back = {start}, {end}
+        front_depth = back_depth = 0
+        forward = True
+        expanded = set()
+        found = False
+
+        while front and back and not found:
+            if len(front) > len(back):
+                front, back = back, front
+                front_depth, back_depth = back_depth, front_depth
+                forward = not forward
+            expanded |= front
+
+            next_front = set()
+            for word_id in front:
+                for neighbor in self.graph.neighbor_ids(word_id):
+                    if neighbor in expanded:
+                        continue
+                    if neighbor in back:
+                        found = True
+                    elif found:
+                        # Once the frontiers touch, new nodes can't be on a shortest ladder
+                        continue
+                    next_front.add(neighbor)
+                    # Edges always point from the start side towards the end side
+                    if forward:
+                        edges.setdefault(word_id, []).append(neighbor)
+                    else:
+                        edges.setdefault(neighbor, []).append(word_id)
+            front = next_front
+            front_depth += 1
+
+        if not found:
+            return
+
+        self.length = front_depth + back_depth
+        self.children = edges
+        self._count(start, end)
+
+    def _count(self, start, end):
+        """Count ladders to end_word from every DAG node, deepest first."""
+        ways = {end: 1}
+        order = []
+        stack = [(start, False)]
+        seen = set()
+        # Iterative post-order DFS so long ladders don't hit the recursion limit
+        while stack:
+            word_id, done = stack.pop()
+            if done:
+                order.append(word_id)
+                continue
+            if word_id in seen:
+                continue
+            seen.add(word_id)
+            stack.append((word_id, True))
+            for child in self.children.get(word_id, ()):
+                if child not in seen:
+                    stack.append((child, False))
+
+        for word_id in order:
+            if word_id != end:
+                ways[word_id] = sum(ways.get(child, 0) for child in self.children.get(word_id, ()))
+
+        # Dead branches from the frontier that never met the other side are dropped
+        self.ways = {word_id: n for word_id, n in ways.items() if n}
+        self.children = {word_id: [c for c in kids if c in self.ways]
+                         for word_id, kids in self.children.items() if word_id in self.ways}
+
+    def count(self):
+        """Return the number of distinct shortest ladders."""
+        if self.length is None:
+            return 0
+        return self.ways[self.graph.ids[self.start_word]]
+
+    def __len__(self):
+        return self.count()
+
+    def __iter__(self):
+        """Yield every shortest ladder as a list of words, one at a time."""
+        if self.length is None:
+            return
+        words = self.graph.words
+        start = self.graph.ids[self.start_word]
+        end = self.graph.ids[self.end_word]
+        path = [start]
+        stack = [iter(self.children.get(start, ()))]
+        if start == end:
+            yield [self.start_word]
+            return
+        while stack:
+            child = next(stack[-1], None)
+            if child is None:
+                stack.pop()
+                path.pop()
+                continue
+            path.append(child)
+            if child == end:
+                yield [words[i] for i in path]
+                path.pop()
+            else:
+                stack.append(iter(self.children.get(child, ())))
+
+    def ladder_at(self, index):
+        """Return the index-th ladder in iteration order without generating the ones before it."""
+        if not 0 <= index < self.count():
+            raise IndexError("ladder index out of range")
+        word_id = self.graph.ids[self.start_word]
+        path = [word_id]
+        while word_id != self.graph.ids[self.end_word]:
+            for child in self.children[word_id]:
+                if index < self.ways[child]:
+                    word_id = child
+                    break
+                index -= self.ways[child]
+            path.append(word_id)
+        return [self.graph.words[i] for i in path]
+
+    def is_on_ladder(self, word):
+        """Check if word lies on at least one shortest ladder."""
+        return self.graph.ids.get(word) in self.ways
+
+    def next_words(self, word):
+        """Return every optimal next move from a word on a shortest ladder."""
+        word_id = self.graph.ids.get(word)
+        return [self.graph.words[c] for c in self.children.get(word_id, ())]
+
+    def is_optimal_move(self, prev_word, word):
+        """Check if moving from prev_word to word keeps the player on a shortest ladder."""
+        return word in self.next_words(prev_word)
+
+
+def k_shortest_ladders(graph, start_word, end_word, k):
+    """Return up to k loopless ladders from start_word to end_word, shortest first.
+
+    This is Yen's algorithm with Lawler's refinement: a candidate found by
+    deviating at position i shares its first i words with its parent, so
+    its own spur searches start at i instead of re-walking the shared
+    prefix. Every spur search is an A* guided by one exact distance field
+    to end_word; removing nodes and edges can only lengthen distances, so
+    the field stays admissible and each spur search stays close to linear
+    in the spur path's length.
+    """
+    if k <= 0 or start_word not in graph or end_word not in graph:
+        return []
+    start = graph.ids[start_word]
+    end = graph.ids[end_word]
+
+    # Exact distances to end_word on the full graph, shared by every spur search
+    dist_to_end = graph.distance_field(end)
+    if start not in dist_to_end:
+        return []
+
+    def spur_search(spur, banned_nodes, banned_edges):
+        """A* from spur to end avoiding the root prefix and the used next edges."""
+        queue = [(dist_to_end[spur], 0, spur)]
+        parents = {spur: None}
+        best = {spur: 0}
+        while queue:
+            _, g_cost, word_id = heapq.heappop(queue)
+            if word_id == end:
+                path = []
+                while word_id is not None:
+                    path.append(word_id)
+                    word_id = parents[word_id]
+                return path[::-1]
+            if g_cost > best[word_id]:
+                continue
+            for neighbor in graph.neighbor_ids(word_id):
+                if neighbor in banned_nodes or neighbor not in dist_to_end:
+                    continue
+                if word_id == spur and neighbor in banned_edges:
+                    continue
+                g_new = g_cost + 1
+                if g_new < best.get(neighbor, g_new + 1):
+                    best[neighbor] = g_new
+                    parents[neighbor] = word_id
+                    heapq.heappush(queue, (g_new + dist_to_end[neighbor], g_new, neighbor))
+        return None
+
+    first = spur_search(start, set(), set())
+    found = [(first, 0)]  # (path, deviation index)
+    candidates = []
+    seen = {tuple(first)}
+
+    while len(found) < k:
+        path, deviation = found[-1]
+        for i in range(deviation, len(path) - 1):
+            root = path[:i + 1]
+            spur = path[i]
+            # Edges already taken out of this root by accepted ladders
+            banned_edges = {p[i + 1] for p, _ in found if p[:i + 1] == root}
+            spur_path = spur_search(spur, set(root[:-1]), banned_edges)
+            if spur_path is None:
+                continue
+            candidate = root[:-1] + spur_path
+            key = tuple(candidate)
+            if key not in seen:
+                seen.add(key)
+                heapq.heappush(candidates, (len(candidate), key, i))
+        if not candidates:
+            break
+        _, key, deviation = heapq.heappop(candidates)
+        found.append((list(key), deviation))
+
+    return [[graph.words[i] for i in path] for path, _ in found]
@@ -0,0 +1,70 @@
+import numpy as np
+
+# Larger than any real ladder; a sum that reaches it means "unreachable"
+UNREACHABLE = 1 << 20
+
+
+class LetterTables:
+    """Per-position letter transition tables for an admissible A* heuristic.
+
+    For every word length and position p, table[p, a, b] is the fewest
+    changes needed to turn letter a into letter b at that position, using
+    only the (a, b) swaps that actually occur on one-step edges of the
+    length graph. Every move changes exactly one position, so the sum of
+    these per-position costs never overestimates the true ladder length,
+    and it is at least the Hamming distance. It is also consistent: one
+    move changes one position's cost by at most 1.
+
+    A pair whose letters can't be connected at some position gets
+    UNREACHABLE, which lets A* prune words that can never reach the target.
+    Only substitution graphs are supported; edit ladders change lengths.
+    """
+
+    def __init__(self, graph):
+        self.graph = graph
+        self.alphabet = sorted({letter for word in graph.words for letter in word})
+        self.index = {letter: i for i, letter in enumerate(self.alphabet)}
+        self.tables = self._build()
+
+    def _build(self):
+        """Collect the letter swaps used by each edge, then close them per position."""
+        size = len(self.alphabet)
+        tables = {}
+        for word_id, word in enumerate(self.graph.words):
+            length = len(word)
+            if length not in tables:
+                table = np.full((length, size, size), UNREACHABLE, dtype=np.int32)
+                table[:, np.arange(size), np.arange(size)] = 0
+                tables[length] = table
+            table = tables[length]
+            for neighbor in self.graph.neighbor_ids(word_id):
+                other = self.graph.words[neighbor]
+                if len(other) != length:
+                    continue
+                for p in range(length):
+                    if word[p] != other[p]:
+                        table[p, self.index[word[p]], self.index[other[p]]] = 1
+                        break
+
+        # Floyd-Warshall over the letters, vectorized across positions
+        for table in tables.values():
+            for k in range(size):
+                np.minimum(table, table[:, :, k:k + 1] + table[:, k:k + 1, :], out=table)
+            np.minimum(table, UNREACHABLE, out=table)
+        return tables
+
+    def heuristic(self, end_word):
+        """Return h(word): a lower bound on moves from word to end_word."""
+        table = self.tables.get(len(end_word))
+        if table is None or any(letter not in self.index for letter in end_word):
+            return lambda word: UNREACHABLE
+        index = self.index
+        # costs[p][letter] = changes needed at p to reach end_word's letter there
+        costs = [dict(zip(self.alphabet, table[p, :, index[letter]].tolist()))
+                 for p, letter in enumerate(end_word)]
+
+        def estimate(word):
+            if len(word) != len(costs):
+                return UNREACHABLE
+            return sum(cost[letter] for cost, letter in zip(costs, word))
+        return estimate
@@ -0,0 +1,103 @@
+import cProfile
+import functools
+import os
+import re
+import time
+import tracemalloc
+
+PROFILE_ENV = 'WORDLADDER_PROFILE'          # "cpu" or "memory"
+PROFILE_DIR_ENV = 'WORDLADDER_PROFILE_DIR'  # where captures are written
+MODES = ("cpu", "memory")
+
+
+def _find_path_name(game, args, kwargs, result):
+    start_word, end_word = args[0], args[1]
+    algorithm = args[2] if len(args) > 2 else kwargs.get('algorithm', 'A*')
+    return f"find_path-{start_word}-{end_word}-{algorithm}"
+
+
+def _select_random_words_name(game, args, kwargs, result):
+    start_word, end_word = result
+    return f"select_random_words-{game.game_mode}-{start_word}-{end_word}"
+
+
+def _start_game_name(game, args, kwargs, result):
+    return (f"start_game-{game.game_mode}-{getattr(game, 'start_word', '')}"
+            f"-{getattr(game, 'end_word', '')}")
+
+
+# Methods that get wrapped, with how to name their capture files
+PROFILED_METHODS = {
+    "find_path": _find_path_name,
+    "select_random_words": _select_random_words_name,
+    "start_game": _start_game_name,
+}
+
+
+class Profiler:
+    """Capture cProfile stats or tracemalloc snapshots around a game's hot methods.
+
+    Only the outermost profiled call is captured, so a start_game profile
+    already contains its select_random_words and find_path calls instead of
+    producing one file per nested search.
+    """
+
+    def __init__(self, mode, directory='profiles'):
+        if mode not in MODES:
+            raise ValueError(f"Unknown profile mode: {mode}")
+        self.mode = mode
+        self.directory = directory
+        self.active = False
+        self.count = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def install(self, game):
+        """Wrap the hot methods of one game instance; the class itself is untouched."""
+        for method_name, name_fn in PROFILED_METHODS.items():
+            setattr(game, method_name, self._wrap(game, getattr(game, method_name), name_fn))
+        return game
+
+    def _path(self, name, extension):
+        """Build a unique, filesystem-safe capture file name."""
+        self.count += 1
+        safe = re.sub(r'[^A-Za-z0-9_.-]', '_', name.replace('*', 'star'))
+        stamp = time.strftime('%Y%m%d-%H%M%S')
+        return os.path.join(self.directory, f"{safe}-{stamp}-{os.getpid()}-{self.count}.{extension}")
+
+    def _wrap(self, game, method, name_fn):
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            if self.active:
+                return method(*args, **kwargs)
+            self.active = True
+            try:
+                if self.mode == "cpu":
+                    profile = cProfile.Profile()
+                    result = profile.runcall(method, *args, **kwargs)
+                    profile.dump_stats(self._path(name_fn(game, args, kwargs, result), "pstats"))
+                else:
+                    started = not tracemalloc.is_tracing()
+                    if started:
+                        tracemalloc.start(25)
+                    try:
+                        result = method(*args, **kwargs)
+                        snapshot = tracemalloc.take_snapshot()
+                    finally:
+                        if started:
+                            tracemalloc.stop()
+                    snapshot.dump(self._path(name_fn(game, args, kwargs, result), "snapshot"))
+                return result
+            finally:
+                self.active = False
+        return wrapper
+
+
+def install_from_env(game, mode=None, directory=None):
+    """Profile a game if a mode is given or set in WORDLADDER_PROFILE; return the Profiler or None."""
+    mode = mode or os.environ.get(PROFILE_ENV)
+    if not mode:
+        return None
+    directory = directory or os.environ.get(PROFILE_DIR_ENV, 'profiles')
+    profiler = Profiler(mode.lower(), directory)
+    profiler.install(game)
+    return profiler
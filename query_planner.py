@@ -0,0 +1,184 @@
+import heapq
+import random
+import time
+from array import array
+
+
+class ShortestPathTree:
+    """Parent pointers and depths of one full BFS from a root word ID."""
+
+    __slots__ = ("root", "parent", "depth")
+
+    def __init__(self, graph, root):
+        self.root = root
+        self.parent = array('i', [-1]) * len(graph)
+        self.depth = array('i', [-1]) * len(graph)
+        parent, depth = self.parent, self.depth
+        parent[root] = root
+        depth[root] = 0
+        adjacency = graph.adjacency
+        frontier = [root]
+        level = 0
+        while frontier:
+            level += 1
+            next_frontier = []
+            for word_id in frontier:
+                for neighbor in adjacency[word_id]:
+                    if depth[neighbor] < 0:
+                        depth[neighbor] = level
+                        parent[neighbor] = word_id
+                        next_frontier.append(neighbor)
+            frontier = next_frontier
+
+    def distance(self, word_id):
+        """Return the moves between word_id and the root, or None if unreachable."""
+        depth = self.depth[word_id]
+        return depth if depth >= 0 else None
+
+    def chain(self, word_id):
+        """Return the word IDs from word_id up to the root, or None if unreachable."""
+        if self.depth[word_id] < 0:
+            return None
+        chain = [word_id]
+        while word_id != self.root:
+            word_id = self.parent[word_id]
+            chain.append(word_id)
+        return chain
+
+
+class QueryPlanner:
+    """Answer batches of (start, end) ladder queries from shared BFS trees.
+
+    Ladders are undirected, so one BFS tree from a word answers every
+    query that has it at either end. solve() plans a batch greedily: the
+    word that ends the most unanswered queries gets the next tree, until
+    every query is covered, and queries whose endpoint already has a
+    cached tree are answered first without any search. Trees are kept in
+    an LRU cache of max_trees (each costs 8 bytes per word), so a later
+    query from the same word is a single walk up its parent chain.
+    """
+
+    def __init__(self, graph, max_trees=32):
+        self.graph = graph
+        self.max_trees = max_trees
+        self.trees = {}  # root word ID -> ShortestPathTree, least recently used first
+        self.stats = {"queries": 0, "trees_built": 0}
+
+    def tree(self, root):
+        """Return the BFS tree from word ID root, building it if it is not cached."""
+        tree = self.trees.pop(root, None)
+        if tree is None:
+            tree = ShortestPathTree(self.graph, root)
+            self.stats["trees_built"] += 1
+            if len(self.trees) >= self.max_trees:
+                del self.trees[next(iter(self.trees))]
+        self.trees[root] = tree
+        return tree
+
+    def plan(self, queries):
+        """Group queries by shared endpoint; return [(root word ID, [query index])].
+
+        Queries with a word missing from the graph are left out of every group.
+        """
+        ids = self.graph.ids
+        groups = {}
+        pending = {}  # word ID -> indexes of unanswered queries ending there
+        for index, (start_word, end_word) in enumerate(queries):
+            start, end = ids.get(start_word), ids.get(end_word)
+            if start is None or end is None:
+                continue
+            cached = end if end in self.trees else start if start in self.trees else None
+            if cached is not None:
+                groups.setdefault(cached, []).append(index)
+                continue
+            pending.setdefault(start, []).append(index)
+            if end != start:
+                pending.setdefault(end, []).append(index)
+
+        answered = set()
+        heap = [(-len(indexes), word_id) for word_id, indexes in pending.items()]
+        heapq.heapify(heap)
+        while heap:
+            count, word_id = heapq.heappop(heap)
+            live = [index for index in pending[word_id] if index not in answered]
+            if not live:
+                continue
+            if len(live) < -count:
+                # Some of its queries went to an earlier tree; requeue with the true count
+                pending[word_id] = live
+                heapq.heappush(heap, (-len(live), word_id))
+                continue
+            groups.setdefault(word_id, []).extend(live)
+            answered.update(live)
+        return list(groups.items())
+
+    def _path(self, tree, start, end):
+        """Return the word IDs of a shortest ladder from start to end via tree, or None."""
+        if tree.root == end:
+            return tree.chain(start)
+        chain = tree.chain(end)
+        return chain[::-1] if chain else None
+
+    def solve(self, queries):
+        """Return a shortest ladder (or None) for every (start, end) pair, in order."""
+        queries = list(queries)
+        words = self.graph.words
+        results = [None] * len(queries)
+        ids = self.graph.ids
+        for root, indexes in self.plan(queries):
+            tree = self.tree(root)
+            for index in indexes:
+                start_word, end_word = queries[index]
+                path = self._path(tree, ids[start_word], ids[end_word])
+                if path:
+                    results[index] = [words[word_id] for word_id in path]
+        self.stats["queries"] += len(queries)
+        return results
+
+    def distances(self, queries):
+        """Return the fewest moves (or None) for every (start, end) pair, in order."""
+        queries = list(queries)
+        results = [None] * len(queries)
+        ids = self.graph.ids
+        for root, indexes in self.plan(queries):
+            tree = self.tree(root)
+            for index in indexes:
+                start_word, end_word = queries[index]
+                other = ids[start_word] if root == ids[end_word] else ids[end_word]
+                results[index] = tree.distance(other)
+        self.stats["queries"] += len(queries)
+        return results
+
+    def path(self, start_word, end_word):
+        """Return a shortest ladder for one pair, reusing a cached tree when there is one."""
+        return self.solve([(start_word, end_word)])[0]
+
+    def distance(self, start_word, end_word):
+        """Return the fewest moves for one pair, or None."""
+        return self.distances([(start_word, end_word)])[0]
+
+
+if __name__ == "__main__":
+    import sys
+    from engine import WordGraph
+
+    graph = WordGraph.from_file(sys.argv[1] if len(sys.argv) > 1 else 'dictionary.txt')
+    rng = random.Random(0)
+    # A pool-building style workload: many pairs around a few hundred hub words
+    hubs = rng.sample(graph.words, min(200, len(graph)))
+    queries = [(rng.choice(graph.words), rng.choice(hubs)) for _ in range(5000)]
+
+    start_time = time.perf_counter()
+    ids = graph.ids
+    expected = [graph.distance_field(ids[end_word]).get(ids[start_word])
+                for start_word, end_word in queries]
+    per_pair = time.perf_counter() - start_time
+
+    planner = QueryPlanner(graph, max_trees=len(hubs))
+    start_time = time.perf_counter()
+    found = planner.distances(queries)
+    planned = time.perf_counter() - start_time
+    mismatches = sum(a != b for a, b in zip(expected, found))
+    print(f"{len(queries)} queries: one BFS per pair {per_pair:.3f}s, "
+          f"planned {planned:.3f}s with {planner.stats['trees_built']} trees, "
+          f"{mismatches} mismatches")
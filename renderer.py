@@ -0,0 +1,119 @@
+from matplotlib.figure import Figure
+
+
+class LadderRenderer:
+    """Draw ladder paths onto one reusable matplotlib figure.
+
+    The figure is created once and cleared between games instead of going
+    through pyplot, whose global figure registry keeps every figure alive
+    until it is explicitly closed. Paths use a fixed left-to-right layout;
+    the optional neighborhood view places words using a force layout that
+    is computed once per word length and then cached.
+    """
+
+    NODE_COLORS = {'start': 'lightgreen', 'end': 'lightcoral', 'path': 'lightblue',
+                   'context': '#E8E8E8'}
+
+    def __init__(self, graph, figsize=(8, 6)):
+        self.graph = graph
+        self.figsize = figsize
+        self.figure = None
+        self.layouts = {}  # word length -> {word ID: (x, y)}
+
+    def set_graph(self, graph):
+        """Draw from a different word graph; cached layouts belong to the old one."""
+        self.graph = graph
+        self.layouts = {}
+
+    def get_figure(self):
+        """Return the shared figure, creating it on first use."""
+        if self.figure is None:
+            self.figure = Figure(figsize=self.figsize, facecolor='white')
+        return self.figure
+
+    def release(self):
+        """Drop everything drawn on the figure so it holds no artists between games."""
+        if self.figure is not None:
+            self.figure.clear()
+
+    def length_layout(self, length):
+        """Return the cached layout of every word with the given length."""
+        if length not in self.layouts:
+            # Imported here so the plain path view never pays for networkx
+            import networkx as nx
+
+            word_ids = self.graph.words_of_length(length)
+            G = nx.Graph()
+            G.add_nodes_from(word_ids)
+            for word_id in word_ids:
+                # Edit ladders link across lengths; each length keeps its own layout
+                G.add_edges_from((word_id, n) for n in self.graph.neighbor_ids(word_id)
+                                 if len(self.graph.words[n]) == length)
+            # Fixed seed keeps the layout identical across sessions
+            self.layouts[length] = nx.spring_layout(G, seed=42)
+        return self.layouts[length]
+
+    def draw_path(self, path, start_word, end_word, neighborhood=False):
+        """Redraw the figure with the given path and return it."""
+        figure = self.get_figure()
+        figure.clear()
+        ax = figure.add_subplot(111)
+
+        if neighborhood and all(word in self.graph for word in path):
+            self._draw_neighborhood(ax, path)
+            positions = [self._layout_position(word) for word in path]
+        else:
+            positions = [(float(i), 0.0) for i in range(len(path))]
+            ax.set_xlim(-0.75, max(len(path) - 1, 1) + 0.75)
+            ax.set_ylim(-1, 1)
+
+        # Path edges
+        for (x1, y1), (x2, y2) in zip(positions, positions[1:]):
+            ax.plot([x1, x2], [y1, y2], color='gray', linewidth=2, zorder=1)
+
+        # Path nodes and labels
+        colors = [self.NODE_COLORS['start'] if word == start_word
+                  else self.NODE_COLORS['end'] if word == end_word
+                  else self.NODE_COLORS['path'] for word in path]
+        xs, ys = zip(*positions) if positions else ((), ())
+        ax.scatter(xs, ys, s=2000, c=colors, zorder=2)
+        for word, (x, y) in zip(path, positions):
+            ax.text(x, y, word, ha='center', va='center', fontsize=12,
+                    fontweight='bold', zorder=3)
+
+        ax.set_title("Word Ladder Path", pad=20)
+        ax.axis('off')
+        return figure
+
+    def _layout_position(self, word):
+        """Look up a word's position in its length's cached layout."""
+        return tuple(self.length_layout(len(word))[self.graph.ids[word]])
+
+    def _draw_neighborhood(self, ax, path):
+        """Draw the words one move away from the path, and their edges, behind it."""
+        on_path = {self.graph.ids[word] for word in path}
+        context = set(on_path)
+        for word_id in on_path:
+            context.update(self.graph.neighbor_ids(word_id))
+
+        lengths = {len(self.graph.words[word_id]) for word_id in context}
+        layout = {}
+        for length in lengths:
+            layout.update(self.length_layout(length))
+
+        for word_id in context:
+            x1, y1 = layout[word_id]
+            for neighbor in self.graph.neighbor_ids(word_id):
+                # Each undirected edge once, only inside the drawn region
+                if neighbor > word_id and neighbor in context:
+                    x2, y2 = layout[neighbor]
+                    ax.plot([x1, x2], [y1, y2], color='#D0D0D0', linewidth=1, zorder=0)
+
+        others = [word_id for word_id in context if word_id not in on_path]
+        if others:
+            ax.scatter([layout[i][0] for i in others], [layout[i][1] for i in others],
+                       s=600, c=self.NODE_COLORS['context'], zorder=1)
+            for word_id in others:
+                x, y = layout[word_id]
+                ax.text(x, y, self.graph.words[word_id], ha='center', va='center',
+                        fontsize=8, color='dimgray', zorder=1)
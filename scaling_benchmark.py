@@ -0,0 +1,226 @@
+import argparse
+import csv
+import itertools
+import json
+import os
+import random
+import string
+import tempfile
+import time
+import tracemalloc
+from collections import Counter
+
+from bitset_bfs import BitsetBFS
+from dawg import Dawg
+from Game import WordLadderGame
+from letter_tables import LetterTables
+from timing import TimingResult
+
+SIZES = (1_000, 10_000, 100_000, 1_000_000)
+# (label, find_path algorithm, BFS engine)
+ALGORITHMS = (
+    ("BFS", "BFS", "queue"),
+    ("BFS (bitset)", "BFS", "bitset"),
+    ("UCS", "UCS", "queue"),
+    ("A*", "A*", "queue"),
+    ("A* (letters)", "A* (letters)", "queue"),
+)
+SEED_WORDS = 8  # Independent random words each synthetic dictionary grows from
+FIELDS = ("size", "words", "edges", "kind", "name", "median_s", "p95_s", "samples",
+          "memory_bytes", "status")
+
+
+def letter_weights(dictionary_file):
+    """Letter frequencies of a real word list, so synthetic words cluster like real ones."""
+    try:
+        with open(dictionary_file, 'r') as f:
+            counts = Counter(letter for line in f for letter in line.strip().lower())
+    except FileNotFoundError:
+        counts = Counter()
+    return [counts.get(letter, 0) + 1 for letter in string.ascii_lowercase]
+
+
+def synthetic_words(count, length, rng, weights=None):
+    """Return up to count distinct words of one length that form ladders, letters drawn by weight.
+
+    Independent random words are almost never one letter apart, so the
+    graph would have next to no edges. Instead a few random seed words
+    are grown: each new word changes one letter of a word already chosen,
+    which keeps every word on a ladder and lets clusters form as in a
+    real dictionary.
+    """
+    capacity = 26 ** length
+    if count * 2 >= capacity:
+        # Dense enough that rejection sampling would stall; sample the whole space
+        return set(rng.sample(["".join(letters) for letters in
+                               itertools.product(string.ascii_lowercase, repeat=length)],
+                              min(count, capacity)))
+    chosen = []
+    words = set()
+    while len(chosen) < min(SEED_WORDS, count):
+        word = "".join(rng.choices(string.ascii_lowercase, weights, k=length))
+        if word not in words:
+            words.add(word)
+            chosen.append(word)
+    while len(chosen) < count:
+        parent = rng.choice(chosen)
+        i = rng.randrange(length)
+        word = parent[:i] + rng.choices(string.ascii_lowercase, weights)[0] + parent[i + 1:]
+        if word not in words:
+            words.add(word)
+            chosen.append(word)
+    return words
+
+
+def sampled_words(words_file, count, length, rng):
+    """Return up to count words of one length sampled from a large word list."""
+    with open(words_file, 'r') as f:
+        pool = sorted({word.strip().lower() for word in f if len(word.strip()) == length})
+    return set(rng.sample(pool, min(count, len(pool))))
+
+
+def _timed_build(build, memory):
+    """Run build() and return (result, seconds, traced bytes or None).
+
+    The time comes from an untraced run; tracemalloc slows allocation down,
+    so memory, when asked for, is measured on a second traced run.
+    """
+    start_time = time.perf_counter()
+    result = build()
+    seconds = time.perf_counter() - start_time
+    if not memory:
+        return result, seconds, None
+    del result
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = build()
+        used = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    return result, seconds, used
+
+
+def connected_pairs(graph, count, rng):
+    """Pick count random (start, end) pairs that have a ladder between them."""
+    labels = graph.component_labels()
+    members = {}
+    for word_id, label in enumerate(labels):
+        members.setdefault(label, []).append(word_id)
+    # Weight components by the number of pairs they hold, like uniform pair sampling would
+    groups = [ids for ids in members.values() if len(ids) > 1]
+    if not groups:
+        return []
+    weights = [len(ids) * (len(ids) - 1) for ids in groups]
+    pairs = []
+    for group in rng.choices(groups, weights, k=count):
+        start, end = rng.sample(group, 2)
+        pairs.append((graph.words[start], graph.words[end]))
+    return pairs
+
+
+def run_size(size, words, queries, budget, memory, stopped, rng):
+    """Benchmark one dictionary; return result rows. Algorithms in `stopped` are skipped."""
+    with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as f:
+        f.write("\n".join(sorted(words)))
+        dictionary_file = f.name
+    try:
+        game, seconds, used = _timed_build(lambda: WordLadderGame(dictionary_file), memory)
+    finally:
+        os.unlink(dictionary_file)
+
+    graph = game.graph
+    base = {"size": size, "words": len(graph),
+            "edges": sum(len(neighbors) for neighbors in graph.adjacency) // 2}
+    rows = [dict(base, kind="build", name="dictionary + graph", median_s=seconds,
+                 memory_bytes=used, status="ok")]
+    for name, build in (("bitset index", lambda: BitsetBFS(graph)),
+                        ("letter tables", lambda: LetterTables(graph)),
+                        ("dawg", lambda: Dawg(graph.words))):
+        _, seconds, used = _timed_build(build, memory)
+        rows.append(dict(base, kind="build", name=name, median_s=seconds,
+                         memory_bytes=used, status="ok"))
+    # Build the game's lazy indexes now so no solve below pays for them
+    game.bitset_bfs()
+    game.letter_tables()
+
+    pairs = connected_pairs(graph, queries, rng)
+    for label, algorithm, engine in ALGORITHMS:
+        if label in stopped:
+            rows.append(dict(base, kind="solve", name=label, status="stopped"))
+            continue
+        game.bfs_engine = engine
+        samples = []
+        status = "ok"
+        for start_word, end_word in pairs:
+            start_time = time.perf_counter()
+            game.find_path(start_word, end_word, algorithm)
+            samples.append(time.perf_counter() - start_time)
+            if samples[-1] > budget:
+                # Too slow to finish the sweep; larger sizes skip it entirely
+                status = "over budget"
+                stopped.add(label)
+                break
+        timing = TimingResult(samples, 1) if samples else None
+        rows.append(dict(base, kind="solve", name=label,
+                         median_s=timing.median if timing else None,
+                         p95_s=timing.quantile(0.95) if timing else None,
+                         samples=len(samples), status=status))
+    return rows
+
+
+def print_rows(rows):
+    """Print result rows as they come in."""
+    for row in rows:
+        median = f"{row['median_s'] * 1000:10.3f} ms" if row.get('median_s') is not None else " " * 13
+        p95 = f"p95 {row['p95_s'] * 1000:10.3f} ms" if row.get('p95_s') is not None else ""
+        used = f"{row['memory_bytes'] / 2**20:8.1f} MiB" if row.get('memory_bytes') is not None else ""
+        print(f"  {row['kind']:<5} {row['name']:<20} {median} {p95} {used} {row['status']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="How the word ladder engines scale with dictionary size")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES))
+    parser.add_argument("--length", type=int, default=5, help="Word length of every dictionary")
+    parser.add_argument("--words-file", help="Sample from this large word list instead of generating words")
+    parser.add_argument("--queries", type=int, default=50, help="Solves per algorithm per size")
+    parser.add_argument("--budget", type=float, default=2.0,
+                        help="Seconds one solve may take before an algorithm is dropped")
+    parser.add_argument("--no-memory", action="store_true", help="Skip the traced memory builds")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--csv", metavar="FILE", help="Write the scaling curve as CSV")
+    parser.add_argument("--json", metavar="FILE", help="Write the scaling curve as JSON")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    weights = letter_weights("dictionary.txt")
+    stopped = set()
+    results = []
+    for size in sorted(args.sizes):
+        if args.words_file:
+            words = sampled_words(args.words_file, size, args.length, rng)
+        else:
+            words = synthetic_words(size, args.length, rng, weights)
+        print(f"=== {len(words)} words of length {args.length} ===")
+        rows = run_size(size, words, args.queries, args.budget, not args.no_memory, stopped, rng)
+        edges = rows[0]["edges"]
+        print(f"  {edges} edges")
+        if edges * 2 < len(words):
+            # Under one neighbor per word: most pairs have no ladder and solves measure little
+            print("  Warning: this dictionary has almost no ladders; the solve timings are not "
+                  "representative")
+        print_rows(rows)
+        results.extend(rows)
+
+    if args.csv:
+        with open(args.csv, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=FIELDS)
+            writer.writeheader()
+            writer.writerows(results)
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
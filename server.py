@@ -0,0 +1,470 @@
+import argparse
+import asyncio
+import datetime
+import json
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import urlsplit, parse_qs
+
+import profiling
+from Game import WordLadderGame
+from sessions import SessionHost
+from shared_graph import SharedGraph
+from watcher import FileWatcher
+from stats_store import StatsStore
+
+ALGORITHMS = ("BFS", "UCS", "A*", "A* (letters)")
+MODES = ("Beginner", "Advanced", "Challenge")
+
+# Each worker process keeps one warm game instance on the shared graph
+_worker_game = None
+
+
+def _init_worker(handle):
+    """Attach a worker to the published graph; nothing is read or rebuilt."""
+    global _worker_game
+    _worker_game = WordLadderGame(graph=SharedGraph.attach(handle))
+    # WORDLADDER_PROFILE captures every search a worker runs
+    profiling.install_from_env(_worker_game)
+
+
+def _solve(start_word, end_word, algorithm):
+    """Run a path search inside a worker process; return (path, seconds)."""
+    start_time = time.perf_counter()
+    path = _worker_game.find_path(start_word, end_word, algorithm)
+    return path, time.perf_counter() - start_time
+
+
+def _new_puzzle(mode, algorithm, attempts=5):
+    """Pick a puzzle for a mode inside a worker process; return (start, end, min moves, constraints).
+
+    Challenge puzzles come with the banned words and restricted letters
+    ChallengeBuilder picks for them, and min moves counts under those;
+    constraints is None for the other modes.
+    """
+    _worker_game.game_mode = mode
+    for _ in range(attempts):
+        start_word, end_word = _worker_game.select_random_words(algorithm)
+        path = _worker_game.find_path(start_word, end_word, algorithm)
+        if mode != "Challenge":
+            return start_word, end_word, len(path) - 1 if path else None, None
+        try:
+            challenge = _worker_game.challenge_builder().build(
+                start_word, end_word, detour=_worker_game.challenge_detour)
+        except ValueError:
+            continue  # No ladder at all; draw another pair
+        constraints = {"banned_words": sorted(challenge.banned_words),
+                       "restricted_letters": sorted(challenge.restricted_letters),
+                       "detour": challenge.detour}
+        return start_word, end_word, challenge.min_moves, constraints
+    raise ValueError(f"No connected puzzle found for mode {mode}")
+
+
+class HTTPError(Exception):
+    """Raised by a handler to answer with a non-200 status."""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class SolverService:
+    """Serve ladders, hints and validation from one warm process over HTTP/JSON."""
+
+    REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found",
+               405: "Method Not Allowed", 500: "Internal Server Error"}
+
+    def __init__(self, dictionary_file='dictionary.txt', workers=None, stats_file=None,
+                 session_timeout=1800):
+        # Validation is cheap, so the service keeps its own copy for inline checks
+        self.game = WordLadderGame(dictionary_file)
+        self.dictionary_file = dictionary_file
+        self.workers = workers
+        # Workers attach to one published copy of the graph instead of each building their own
+        self.shared_graph = SharedGraph.publish(self.game.graph)
+        self.executor = self._start_workers()
+        self.stats_store = StatsStore(stats_file) if stats_file else None
+        # Hosted games share the service's graph instead of a game object each
+        self.sessions = SessionHost(self.game.graph, idle_timeout=session_timeout,
+                                    stats_store=self.stats_store)
+        self.in_flight = {}  # Coalescing table: query key -> shared future
+        self.stats = {"requests": 0, "searches": 0, "coalesced": 0}
+        self.routes = {
+            "/path": self.handle_path,
+            "/hint": self.handle_hint,
+            "/validate": self.handle_validate,
+            "/new-puzzle": self.handle_new_puzzle,
+            "/daily": self.handle_daily,
+            "/stats": self.handle_stats,
+            "/session/start": self.handle_session_start,
+            "/session/move": self.handle_session_move,
+            "/session/hint": self.handle_session_hint,
+            "/session/state": self.handle_session_state,
+        }
+
+    def _start_workers(self, shared_graph=None):
+        """Start a worker pool attached to shared_graph (default: the currently published graph)."""
+        shared_graph = shared_graph or self.shared_graph
+        return ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                   initargs=(shared_graph.handle(),))
+
+    def _prepare_reload(self):
+        """Read the dictionary file and build its graph, shared copy and worker pool, or return None.
+
+        Runs in a thread: it only reads the service's current state, so
+        requests keep being served while the new graph is built.
+        """
+        try:
+            words = self.game.read_dictionary(self.dictionary_file)
+        except FileNotFoundError:
+            return None
+        update = self.game.prepare_dictionary(words)
+        if update is None:
+            return None
+        shared_graph = SharedGraph.publish(update[0])
+        return words, update, shared_graph, self._start_workers(shared_graph)
+
+    async def reload_dictionary(self):
+        """Apply dictionary file changes to new searches and sessions; running ones are left as they are."""
+        loop = asyncio.get_running_loop()
+        prepared = await loop.run_in_executor(None, self._prepare_reload)
+        if prepared is None:
+            return
+        # Only the swap happens on the event loop, so no request sees half a reload
+        words, update, shared_graph, executor = prepared
+        self.game.install_dictionary(words, *update)
+        self.sessions.set_graph(self.game.graph)
+        old_shared, self.shared_graph = self.shared_graph, shared_graph
+        old_executor, self.executor = self.executor, executor
+
+        def retire():
+            # Searches already queued finish on the old pool; only then is its graph freed
+            old_executor.shutdown(wait=True)
+            old_shared.close()
+        threading.Thread(target=retire, daemon=True).start()
+
+    async def watch_dictionary(self, interval=2):
+        """Reload the dictionary whenever its file changes."""
+        watcher = FileWatcher(self.dictionary_file)
+        while True:
+            await asyncio.sleep(interval)
+            if watcher.changed():
+                await self.reload_dictionary()
+
+    async def find_path(self, start_word, end_word, algorithm):
+        """Search in the executor, sharing one search among identical in-flight queries."""
+        key = (start_word, end_word, algorithm)
+        future = self.in_flight.get(key)
+        if future is not None:
+            self.stats["coalesced"] += 1
+            path, _ = await asyncio.shield(future)
+            return path
+
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self.executor, _solve, start_word, end_word, algorithm)
+        self.in_flight[key] = future
+        self.stats["searches"] += 1
+        try:
+            path, seconds = await asyncio.shield(future)
+            if self.stats_store:
+                self.stats_store.record_timing(algorithm, start_word, end_word, seconds,
+                                               len(path) - 1 if path else None)
+            return path
+        finally:
+            # Only the first caller owns the table entry
+            if self.in_flight.get(key) is future:
+                del self.in_flight[key]
+
+    def _word_param(self, params, name):
+        """Fetch a required lowercase word from the query string."""
+        value = params.get(name, [""])[0].strip().lower()
+        if not value:
+            raise HTTPError(400, f"Missing parameter: {name}")
+        return value
+
+    def _algorithm_param(self, params):
+        """Fetch the algorithm from the query string, defaulting to A*."""
+        algorithm = params.get("algorithm", ["A*"])[0]
+        if algorithm not in ALGORITHMS:
+            raise HTTPError(400, f"Unknown algorithm: {algorithm}")
+        return algorithm
+
+    async def handle_path(self, params):
+        """GET /path?start=...&end=...&algorithm=..."""
+        start_word = self._word_param(params, "start")
+        end_word = self._word_param(params, "end")
+        algorithm = self._algorithm_param(params)
+        path = await self.find_path(start_word, end_word, algorithm)
+        return {"start": start_word, "end": end_word, "algorithm": algorithm,
+                "path": path, "length": len(path) - 1 if path else None}
+
+    async def handle_hint(self, params):
+        """GET /hint?current=...&end=...&algorithm=..."""
+        current_word = self._word_param(params, "current")
+        end_word = self._word_param(params, "end")
+        algorithm = self._algorithm_param(params)
+        path = await self.find_path(current_word, end_word, algorithm)
+        hint = self.game.next_hint(path, current_word) if path else None
+        return {"current": current_word, "end": end_word, "hint": hint}
+
+    async def handle_validate(self, params):
+        """GET /validate?word=...&prev=..."""
+        word = self._word_param(params, "word")
+        prev_word = self._word_param(params, "prev")
+        valid, message = self.game.validate_move(word, prev_word)
+        return {"word": word, "prev": prev_word, "valid": valid, "message": message}
+
+    async def handle_new_puzzle(self, params):
+        """GET /new-puzzle?mode=...&algorithm=..."""
+        mode = params.get("mode", ["Beginner"])[0]
+        if mode not in MODES:
+            raise HTTPError(400, f"Unknown mode: {mode}")
+        algorithm = self._algorithm_param(params)
+        # Not coalesced: concurrent callers should each get their own puzzle
+        loop = asyncio.get_running_loop()
+        try:
+            start_word, end_word, min_moves, constraints = await loop.run_in_executor(
+                self.executor, _new_puzzle, mode, algorithm)
+        except ValueError as e:
+            raise HTTPError(500, str(e))
+        return dict(constraints or {}, mode=mode, start=start_word, end=end_word,
+                    min_moves=min_moves)
+
+    async def handle_daily(self, params):
+        """GET /daily?mode=...&date=YYYY-MM-DD or &seed=..."""
+        mode = params.get("mode", ["Beginner"])[0]
+        if mode not in MODES:
+            raise HTTPError(400, f"Unknown mode: {mode}")
+        day = params.get("date", [None])[0]
+        if day is not None:
+            # Any other string would still seed a puzzle and take a cache entry
+            try:
+                day = datetime.date.fromisoformat(day)
+            except ValueError:
+                raise HTTPError(400, f"Invalid date (expected YYYY-MM-DD): {day}")
+        seed = params.get("seed", [None])[0]
+        # Memoized after the first call; the first one may build the difficulty table
+        loop = asyncio.get_running_loop()
+        daily = self.game.daily_puzzles()
+        response = {"mode": mode, "date": day.isoformat() if day else None, "seed": seed}
+        if mode == "Challenge":
+            # The day-seeded constraints, the same ones the game UI plays
+            (start_word, end_word), challenge = await loop.run_in_executor(
+                None, daily.challenge, day, seed)
+            response.update(
+                banned_words=sorted(challenge.banned_words) if challenge else [],
+                restricted_letters=sorted(challenge.restricted_letters) if challenge else [],
+                min_moves=challenge.min_moves if challenge else None,
+                detour=challenge.detour if challenge else 0)
+        else:
+            start_word, end_word = await loop.run_in_executor(None, daily.puzzle, day, mode, seed)
+        return dict(response, start=start_word, end=end_word)
+
+    async def handle_stats(self, params):
+        """GET /stats"""
+        return dict(self.stats, in_flight=len(self.in_flight), sessions=len(self.sessions))
+
+    def _session_param(self, params):
+        """Fetch a session ID from the query string."""
+        session_id = params.get("id", [""])[0]
+        if session_id not in self.sessions.sessions:
+            raise self._no_session(session_id)
+        return session_id
+
+    def _no_session(self, session_id):
+        """The 404 for a session that is unknown or has expired."""
+        return HTTPError(404, f"No such session: {session_id}")
+
+    async def handle_session_start(self, params):
+        """GET /session/start?mode=...[&start=...&end=...]"""
+        mode = params.get("mode", ["Beginner"])[0]
+        if mode not in MODES:
+            raise HTTPError(400, f"Unknown mode: {mode}")
+        words = None
+        if "start" in params or "end" in params:
+            words = (self._word_param(params, "start"), self._word_param(params, "end"))
+        # The first call builds the difficulty table, so keep it off the event loop
+        loop = asyncio.get_running_loop()
+        try:
+            session = await loop.run_in_executor(None, self.sessions.new_session, mode, words)
+        except ValueError as e:
+            raise HTTPError(400, str(e))
+        return self.sessions.state(session.session_id)
+
+    async def handle_session_move(self, params):
+        """GET /session/move?id=...&word=..."""
+        session_id = self._session_param(params)
+        word = self._word_param(params, "word")
+        # The session can still expire after the check above; SessionHost then raises KeyError
+        try:
+            valid, message = self.sessions.submit(session_id, word)
+            return dict(self.sessions.state(session_id), valid=valid, message=message)
+        except KeyError:
+            raise self._no_session(session_id)
+
+    async def handle_session_hint(self, params):
+        """GET /session/hint?id=..."""
+        session_id = self._session_param(params)
+        loop = asyncio.get_running_loop()
+        try:
+            hint = await loop.run_in_executor(None, self.sessions.hint, session_id)
+        except KeyError:
+            raise self._no_session(session_id)
+        return {"id": session_id, "hint": hint}
+
+    async def handle_session_state(self, params):
+        """GET /session/state?id=..."""
+        session_id = self._session_param(params)
+        try:
+            return self.sessions.state(session_id)
+        except KeyError:
+            raise self._no_session(session_id)
+
+    async def expire_sessions(self, interval=60):
+        """Drop idle sessions every interval seconds."""
+        while True:
+            await asyncio.sleep(interval)
+            self.sessions.expire()
+
+    async def dispatch(self, method, target):
+        """Route one request and return (status, payload)."""
+        if method != "GET":
+            return 405, {"error": "Only GET is supported"}
+        url = urlsplit(target)
+        handler = self.routes.get(url.path)
+        if handler is None:
+            return 404, {"error": f"No such endpoint: {url.path}"}
+        try:
+            return 200, await handler(parse_qs(url.query))
+        except HTTPError as e:
+            return e.status, {"error": e.message}
+        except Exception as e:
+            return 500, {"error": str(e)}
+
+    async def handle_connection(self, reader, writer):
+        """Serve HTTP/1.1 requests on one keep-alive connection."""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, target, version = request_line.decode("latin-1").split()
+                except ValueError:
+                    break
+
+                # Read headers; request bodies are not used by any endpoint
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                length = int(headers.get("content-length", 0) or 0)
+                if length:
+                    await reader.readexactly(length)
+
+                self.stats["requests"] += 1
+                status, payload = await self.dispatch(method, target)
+                body = json.dumps(payload).encode()
+                keep_alive = (headers.get("connection", "").lower() != "close"
+                              and version == "HTTP/1.1")
+                writer.write(
+                    f"HTTP/1.1 {status} {self.REASONS[status]}\r\n"
+                    f"Content-Type: application/json\r\n"
+                    f"Content-Length: {len(body)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+                    .encode("latin-1") + body)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host="127.0.0.1", port=8080):
+        """Start listening and serve until cancelled."""
+        server = await asyncio.start_server(self.handle_connection, host, port, backlog=1024)
+        print(f"Word ladder service listening on http://{host}:{port}")
+        expiry = asyncio.create_task(self.expire_sessions())
+        watch = asyncio.create_task(self.watch_dictionary())
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            expiry.cancel()
+            watch.cancel()
+            self.executor.shutdown(cancel_futures=True)
+            self.shared_graph.close()
+            if self.stats_store:
+                self.stats_store.close()
+
+
+async def load_test(host, port, requests, concurrency, target="/path?start=cat&end=dog"):
+    """Fire requests at a running service over keep-alive connections and report latency."""
+    latencies = []
+    per_client = max(1, requests // concurrency)
+
+    async def client():
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            for _ in range(per_client):
+                start_time = time.perf_counter()
+                writer.write(f"GET {target} HTTP/1.1\r\nHost: {host}\r\n\r\n".encode())
+                await writer.drain()
+                length = 0
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b""):
+                        break
+                    if line.lower().startswith(b"content-length:"):
+                        length = int(line.split(b":")[1])
+                await reader.readexactly(length)
+                latencies.append(time.perf_counter() - start_time)
+        finally:
+            writer.close()
+
+    start_time = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start_time
+
+    latencies.sort()
+    print(f"{len(latencies)} requests in {elapsed:.2f}s ({len(latencies) / elapsed:.0f} req/s)")
+    print(f"p50: {latencies[len(latencies) // 2] * 1000:.2f} ms, "
+          f"p99: {latencies[int(len(latencies) * 0.99) - 1] * 1000:.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Word ladder solver service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--dictionary", default="dictionary.txt")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Search worker processes (default: CPU count)")
+    parser.add_argument("--stats-db", default=None,
+                        help="Record search timings in this SQLite stats store")
+    parser.add_argument("--session-timeout", type=int, default=1800,
+                        help="Seconds before an idle hosted game is dropped")
+    parser.add_argument("--load-test", type=int, metavar="N",
+                        help="Send N requests to a running service instead of serving")
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--target", default="/path?start=cat&end=dog")
+    args = parser.parse_args()
+
+    if args.load_test:
+        asyncio.run(load_test(args.host, args.port, args.load_test, args.concurrency, args.target))
+    else:
+        service = SolverService(args.dictionary, args.workers, args.stats_db,
+                                args.session_timeout)
+        try:
+            asyncio.run(service.serve(args.host, args.port))
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,246 @@
+import hashlib
+import queue
+import threading
+import time
+
+# Event types; a record's first payload byte
+SESSION, GAME_START, MOVE, REMOVE, RESET, AUTO_SOLVE, WIN = range(7)
+EVENT_NAMES = ("session", "game_start", "move", "remove", "reset", "auto_solve", "win")
+
+MODES = ("Beginner", "Advanced", "Challenge")
+ALGORITHMS = ("BFS", "UCS", "A*", "A* (letters)")
+
+_STOP = object()
+
+
+def dictionary_fingerprint(words):
+    """Return 8 bytes identifying a word table, so IDs are never decoded against the wrong one."""
+    return hashlib.blake2b("\n".join(words).encode(), digest_size=8).digest()
+
+
+def encode_varint(value, out):
+    """Append an unsigned LEB128 varint to a bytearray."""
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def decode_varint(data, pos):
+    """Read an unsigned LEB128 varint; return (value, next position)."""
+    result = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+class SessionLog:
+    """Append-only binary log of game events, written from a background thread.
+
+    Each record is a varint length followed by the payload: an event type
+    byte, the milliseconds since the previous event and the event's
+    arguments, all as varints. Words are stored by their ID in the shared
+    WordGraph, so a typical move costs 3-4 bytes on disk. Every process
+    that opens the log first writes a session record with the wall-clock
+    time and a fingerprint of the word table, and writes another whenever
+    the word table is reloaded.
+
+    The game thread only puts a tuple on a queue; encoding, buffering and
+    file I/O all happen on the writer thread, so the UI never waits on disk.
+    """
+
+    def __init__(self, log_file, graph, flush_every=64):
+        self.log_file = log_file
+        self.graph = graph
+        self.flush_every = flush_every
+        self.events = queue.SimpleQueue()
+        self.thread = threading.Thread(target=self._writer, name="session-log", daemon=True)
+        self.events.put((SESSION, time.time(), (dictionary_fingerprint(graph.words),)))
+        self.thread.start()
+
+    def set_graph(self, graph):
+        """Log words by their IDs in a new graph, starting a new session record for it."""
+        self.graph = graph
+        self.events.put((SESSION, time.time(), (dictionary_fingerprint(graph.words),)))
+
+    def record(self, event, *args):
+        """Queue one event; never blocks on I/O."""
+        self.events.put((event, time.time(), args))
+
+    def game_start(self, start_word, end_word, mode, algorithm):
+        self.record(GAME_START, self.graph.ids[start_word], self.graph.ids[end_word],
+                    MODES.index(mode), ALGORITHMS.index(algorithm))
+
+    def move(self, word):
+        self.record(MOVE, self.graph.ids[word])
+
+    def remove(self, index):
+        self.record(REMOVE, index)
+
+    def reset(self):
+        self.record(RESET)
+
+    def auto_solve(self):
+        self.record(AUTO_SOLVE)
+
+    def win(self, score):
+        # Scores have one decimal place, so tenths fit in a small varint
+        self.record(WIN, int(round(score * 10)))
+
+    def close(self):
+        """Flush everything queued so far and stop the writer thread."""
+        self.events.put(_STOP)
+        self.thread.join()
+
+    def _encode(self, event, timestamp, args, last_ms):
+        """Encode one record; return (bytes, new last timestamp in ms)."""
+        now_ms = int(timestamp * 1000)
+        payload = bytearray((event,))
+        if event == SESSION:
+            # Absolute base time; later events store deltas from it
+            encode_varint(now_ms, payload)
+            payload += args[0]  # Fingerprint taken when the record was queued
+            args = ()
+        else:
+            encode_varint(max(0, now_ms - last_ms), payload)
+        for value in args:
+            encode_varint(value, payload)
+        record = bytearray()
+        encode_varint(len(payload), record)
+        record += payload
+        return record, now_ms
+
+    def _writer(self):
+        """Drain the queue into a buffered append-only file."""
+        last_ms = 0
+        pending = 0
+        with open(self.log_file, 'ab', buffering=64 * 1024) as f:
+            while True:
+                try:
+                    item = self.events.get(timeout=1.0)
+                except queue.Empty:
+                    # Idle: push buffered records to the OS
+                    if pending:
+                        f.flush()
+                        pending = 0
+                    continue
+                if item is _STOP:
+                    break
+                record, last_ms = self._encode(*item, last_ms)
+                f.write(record)
+                pending += 1
+                if pending >= self.flush_every:
+                    f.flush()
+                    pending = 0
+
+
+def read_events(log_file):
+    """Yield (timestamp, event name, args) for every complete record in a log.
+
+    A record cut short by a crash ends the stream instead of raising.
+    """
+    with open(log_file, 'rb') as f:
+        data = f.read()
+
+    pos = 0
+    end = len(data)
+    base_ms = 0
+    while pos < end:
+        try:
+            length, body = decode_varint(data, pos)
+        except IndexError:
+            return
+        if body + length > end:
+            return
+        event = data[body]
+        pos = body + 1
+        if event == SESSION:
+            base_ms, pos = decode_varint(data, pos)
+            fingerprint = bytes(data[pos:pos + 8])
+            pos += 8
+            args = (fingerprint,)
+        else:
+            delta, pos = decode_varint(data, pos)
+            base_ms += delta
+            args = []
+            while pos < body + length:
+                value, pos = decode_varint(data, pos)
+                args.append(value)
+            args = tuple(args)
+        pos = body + length
+        yield base_ms / 1000.0, EVENT_NAMES[event], args
+
+
+def replay_games(log_file, graphs):
+    """Rebuild every logged game as a dict, applying moves, removals and resets in order.
+
+    graphs is one WordGraph or several, e.g. the dictionary before and after
+    a hot reload. Each session record's fingerprint picks the word table its
+    IDs decode against; games from sessions none of them match are skipped.
+    """
+    if hasattr(graphs, "words"):
+        graphs = (graphs,)
+    tables = {dictionary_fingerprint(graph.words): graph.words for graph in graphs}
+    words = None
+    game = None
+
+    for timestamp, name, args in read_events(log_file):
+        if name == "session":
+            # A new process (or a reloaded dictionary) never continues the previous game
+            if game is not None:
+                yield game
+                game = None
+            words = tables.get(args[0])
+        elif words is None:
+            continue  # Written against a word table we were not given
+        elif name == "game_start":
+            if game is not None:
+                yield game
+            start_id, end_id, mode, algorithm = args
+            game = {"started": timestamp, "start": words[start_id], "end": words[end_id],
+                    "mode": MODES[mode], "algorithm": ALGORITHMS[algorithm],
+                    "tries": [], "moves": 0, "resets": 0, "auto_solved": False,
+                    "score": None, "finished": None}
+        elif game is None:
+            continue
+        elif name == "move":
+            game["tries"].append(words[args[0]])
+            game["moves"] += 1
+        elif name == "remove":
+            del game["tries"][args[0]:]
+        elif name == "reset":
+            game["tries"] = []
+            game["resets"] += 1
+        elif name == "auto_solve":
+            # Auto-solve continues from the current position; its moves follow
+            game["auto_solved"] = True
+        elif name == "win":
+            game["score"] = args[0] / 10
+            game["finished"] = timestamp
+
+    if game is not None:
+        yield game
+
+
+if __name__ == "__main__":
+    import sys
+    from engine import WordGraph
+
+    log_file = sys.argv[1] if len(sys.argv) > 1 else 'session.wlog'
+    # Pass every version of the dictionary the log spans to decode all of it
+    dictionary_files = sys.argv[2:] or ['dictionary.txt']
+    graphs = [WordGraph.from_file(dictionary_file) for dictionary_file in dictionary_files]
+    games = list(replay_games(log_file, graphs))
+    known = {dictionary_fingerprint(graph.words) for graph in graphs}
+    skipped = sum(1 for _, name, args in read_events(log_file) if name == "session" and args[0] not in known)
+    if skipped:
+        print(f"Skipped {skipped} session(s) written with a dictionary that was not given")
+    won = [game for game in games if game["score"] is not None and not game["auto_solved"]]
+    print(f"Games: {len(games)}, won: {len(won)}, auto-solved: {sum(g['auto_solved'] for g in games)}")
+    if won:
+        print(f"Average score: {sum(g['score'] for g in won) / len(won):.1f}/10")
+        print(f"Average moves: {sum(g['moves'] for g in won) / len(won):.1f}")
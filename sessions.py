@@ -0,0 +1,315 @@
+import random
+import secrets
+import threading
+import time
+from array import array
+from bisect import bisect_left
+
+from challenge import ChallengeBuilder
+from difficulty import BANDS, puzzle_table
+from incremental import IncrementalSolver
+
+# Mode settings, matching WordLadderGame's defaults
+WORD_LENGTHS = {"Beginner": 3, "Advanced": 5, "Challenge": 5}
+MIN_MOVES = {"Beginner": 2, "Advanced": 3, "Challenge": 3}
+DIFFICULTY_BANDS = {"Beginner": "easy", "Advanced": "medium", "Challenge": "hard"}
+EXTRA_TRIES = 3  # Moves allowed beyond the minimum
+CHALLENGE_DETOUR = 2  # Moves Challenge constraints add to the shortest ladder
+HOSTED_ALGORITHM = "hosted"  # The algorithm column of hosted games in a StatsStore
+
+
+def score_moves(moves_taken, min_moves, max_moves):
+    """Score out of 10: perfect at the minimum, sliding to 5 at the move limit."""
+    if moves_taken <= min_moves:
+        score = 10.0
+    else:
+        extra_moves = moves_taken - min_moves
+        max_extra_moves = max_moves - min_moves
+        score = 10.0 - (5.0 * extra_moves / max_extra_moves)
+    return round(max(0.0, min(10.0, score)), 1)
+
+
+class GameSession:
+    """One game's state as word IDs into the shared graph it started on."""
+
+    __slots__ = ("session_id", "graph", "mode", "start", "end", "tries", "min_moves",
+                 "max_moves", "banned", "restricted", "ladder", "detour", "score", "last_active")
+
+    def __init__(self, session_id, graph, mode, start, end, min_moves, banned=(), restricted="",
+                 ladder=(), detour=0):
+        self.session_id = session_id
+        self.graph = graph  # Kept until the game ends, even if the host's dictionary is reloaded
+        self.mode = mode
+        self.start = start
+        self.end = end
+        self.tries = array('i')  # Word IDs the player has moved through
+        self.min_moves = min_moves
+        self.max_moves = min_moves + EXTRA_TRIES
+        self.banned = frozenset(banned)
+        self.restricted = restricted
+        self.ladder = array('i', ladder)  # Challenge only: a shortest ladder that obeys the constraints
+        self.detour = detour  # Challenge only: moves the constraints add to the shortest ladder
+        self.score = None  # Set once the end word is reached
+        self.last_active = time.monotonic()
+
+    def current(self):
+        """Return the ID of the word the player is on."""
+        return self.tries[-1] if self.tries else self.start
+
+    def allowed(self, word_id):
+        """Return whether the Challenge constraints let the player move onto word_id."""
+        return word_id not in self.banned and not any(
+            letter in self.restricted for letter in self.graph.words[word_id])
+
+    @property
+    def solved(self):
+        return self.score is not None
+
+
+class SessionHost:
+    """Host many concurrent games against one read-only WordGraph.
+
+    A WordLadderGame carries its own dictionary, graph and UI state; here a
+    game is a GameSession of a few ints and an array of word IDs, so
+    thousands of them cost little more than the graph itself. Distance
+    fields are shared too: sessions racing towards the same end word reuse
+    one IncrementalSolver. Sessions idle for longer than idle_timeout
+    seconds are dropped by expire(), which the caller runs periodically.
+
+    set_graph() swaps in a reloaded dictionary for new sessions only; each
+    running session keeps the graph it started on until it ends.
+
+    With a stats_store, every game is recorded once when it ends: solved
+    from submit(), abandoned when it is closed or expires unsolved.
+    """
+
+    def __init__(self, graph, idle_timeout=1800, max_solvers=1024, stats_store=None):
+        self.graph = graph
+        self.idle_timeout = idle_timeout
+        self.max_solvers = max_solvers
+        self.stats_store = stats_store
+        self.sessions = {}  # session ID -> GameSession, least recently active first
+        self.solvers = {}   # (graph, end word ID) -> IncrementalSolver, least recently used first
+        self._difficulty_table = None
+        self._challenge_builder = None
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.sessions)
+
+    def set_graph(self, graph):
+        """Start new sessions on graph; running sessions keep their own snapshot."""
+        with self.lock:
+            self.graph = graph
+
+    def difficulty_table(self):
+        """Return the difficulty table for the shared graph, building it on first use."""
+        if self._difficulty_table is None or self._difficulty_table.graph is not self.graph:
+            self._difficulty_table = puzzle_table(self.graph)
+        return self._difficulty_table
+
+    def challenge_builder(self, graph):
+        """Return the Challenge constraint builder for graph, building it on first use."""
+        builder = self._challenge_builder
+        if builder is None or builder.graph is not graph:
+            builder = self._challenge_builder = ChallengeBuilder(graph)
+        return builder
+
+    def solver(self, graph, end):
+        """Return the shared backwards search towards word ID end in graph."""
+        key = (graph, end)
+        solver = self.solvers.pop(key, None)
+        if solver is None:
+            solver = IncrementalSolver(graph, graph.words[end])
+            if len(self.solvers) >= self.max_solvers:
+                del self.solvers[next(iter(self.solvers))]
+        self.solvers[key] = solver
+        return solver
+
+    def _pick_words(self, mode, rng):
+        """Draw a pair for a mode from the difficulty table; return (graph, start ID, end ID)."""
+        table = self.difficulty_table()
+        graph = table.graph
+        band = DIFFICULTY_BANDS[mode]
+        for candidate_band in [band] + [b for b in BANDS if b != band]:
+            pair = table.sample(WORD_LENGTHS[mode], candidate_band, MIN_MOVES[mode], rng=rng)
+            if pair:
+                return graph, graph.ids[pair[0]], graph.ids[pair[1]]
+        raise ValueError(f"No puzzle available for mode {mode}")
+
+    def new_session(self, mode="Beginner", words=None, rng=random):
+        """Start a game for a mode, on words=(start, end) if given; return the session."""
+        if mode not in WORD_LENGTHS:
+            raise ValueError(f"Unknown mode: {mode}")
+        if words:
+            graph = self.graph
+            start, end = (graph.ids.get(word) for word in words)
+            if start is None or end is None:
+                raise ValueError("Start and end words must be in the dictionary")
+        else:
+            graph, start, end = self._pick_words(mode, rng)
+
+        with self.lock:
+            min_moves = self.solver(graph, end).distance(graph.words[start])
+        if min_moves is None:
+            raise ValueError(f"No ladder between '{graph.words[start]}' "
+                             f"and '{graph.words[end]}'")
+
+        banned, restricted, ladder, detour = (), "", (), 0
+        if mode == "Challenge":
+            # Constraints that keep a ladder open and lengthen the shortest one by the detour
+            challenge = self.challenge_builder(graph).build(graph.words[start], graph.words[end],
+                                                            detour=CHALLENGE_DETOUR, rng=rng)
+            banned = [graph.ids[word] for word in challenge.banned_words]
+            restricted = "".join(sorted(challenge.restricted_letters))
+            min_moves = challenge.min_moves
+            ladder = [graph.ids[word] for word in challenge.ladder]
+            # May fall short of CHALLENGE_DETOUR on puzzles that cannot be held to it
+            detour = challenge.detour
+
+        session = GameSession(secrets.token_urlsafe(12), graph, mode, start, end, min_moves,
+                              banned, restricted, ladder, detour)
+        with self.lock:
+            self.sessions[session.session_id] = session
+        return session
+
+    def get(self, session_id):
+        """Return a live session and mark it active; raise KeyError if unknown or expired."""
+        with self.lock:
+            session = self.sessions.pop(session_id)
+            session.last_active = time.monotonic()
+            self.sessions[session_id] = session
+        return session
+
+    def record(self, session):
+        """Store a finished or abandoned session's outcome, if a stats store is open."""
+        if not self.stats_store:
+            return
+        words = session.graph.words
+        self.stats_store.record_game(session.mode, HOSTED_ALGORITHM, words[session.start],
+                                     words[session.end], len(session.tries), session.min_moves,
+                                     session.score or 0.0, session.solved)
+
+    def close(self, session_id):
+        """Drop a session, recording it as abandoned if unsolved; unknown IDs are ignored."""
+        with self.lock:
+            session = self.sessions.pop(session_id, None)
+        if session is not None and not session.solved:
+            self.record(session)
+
+    def expire(self, now=None):
+        """Drop every session idle for longer than idle_timeout; return how many went."""
+        cutoff = (now if now is not None else time.monotonic()) - self.idle_timeout
+        expired = []
+        with self.lock:
+            # Sessions are kept in activity order, so the stale ones are at the front
+            while self.sessions:
+                session_id, session = next(iter(self.sessions.items()))
+                if session.last_active > cutoff:
+                    break
+                del self.sessions[session_id]
+                expired.append(session)
+        for session in expired:
+            if not session.solved:
+                self.record(session)
+        return len(expired)
+
+    def submit(self, session_id, word):
+        """Play a move; return (valid, message), as WordLadderGame.submit_word reports it."""
+        session = self.get(session_id)
+        word = word.strip().lower()
+        if not word:
+            return False, "Please enter a word."
+        if session.solved:
+            return False, "This ladder is already complete."
+        if len(session.tries) >= session.max_moves:
+            return False, f"You've reached the maximum number of tries ({session.max_moves})."
+        if session.mode == "Challenge":
+            if any(letter in session.restricted for letter in word):
+                return False, f"Word contains restricted letters: {', '.join(session.restricted)}"
+            if session.graph.ids.get(word) in session.banned:
+                return False, "This word is banned in challenge mode"
+
+        word_id = session.graph.ids.get(word)
+        if word_id is None:
+            return False, "Word not in dictionary"
+        prev = session.current()
+        neighbors = session.graph.neighbor_ids(prev)
+        position = bisect_left(neighbors, word_id)
+        if position == len(neighbors) or neighbors[position] != word_id:
+            if session.graph.edits:
+                return False, "Must change, add or remove exactly one letter"
+            return False, "Must change exactly one letter"
+
+        session.tries.append(word_id)
+        if word_id == session.end:
+            session.score = score_moves(len(session.tries), session.min_moves, session.max_moves)
+            self.record(session)
+            return True, (f"Completed in {len(session.tries)} moves "
+                          f"(minimum {session.min_moves}). Score: {session.score}/10")
+        return True, f"Valid move from '{session.graph.words[prev]}' to '{word}'"
+
+    def remove(self, session_id, index):
+        """Take back the move at index and every move after it."""
+        session = self.get(session_id)
+        if 0 <= index < len(session.tries) and not session.solved:
+            del session.tries[index:]
+
+    def reset(self, session_id):
+        """Clear every move of a session; a solved one is over and stays as it is."""
+        session = self.get(session_id)
+        if not session.solved:
+            session.tries = array('i')
+
+    def hint(self, session_id):
+        """Return the next word of a shortest ladder from the session's current word, or None."""
+        session = self.get(session_id)
+        if session.mode == "Challenge":
+            return self._challenge_hint(session)
+        with self.lock:
+            solver = self.solver(session.graph, session.end)
+            return solver.next_move(session.graph.words[session.current()])
+
+    def _challenge_hint(self, session):
+        """Next move under the session's constraints: along its ladder, else by a constrained BFS."""
+        current = session.current()
+        if current == session.end:
+            return None
+        graph = session.graph
+        if current in session.ladder:
+            return graph.words[session.ladder[session.ladder.index(current) + 1]]
+        # Off the ladder: search forwards over allowed words only, then walk back to the first move
+        parents = {current: None}
+        frontier = [current]
+        while frontier and session.end not in parents:
+            next_frontier = []
+            for word_id in frontier:
+                for neighbor in graph.adjacency[word_id]:
+                    if neighbor not in parents and session.allowed(neighbor):
+                        parents[neighbor] = word_id
+                        next_frontier.append(neighbor)
+            frontier = next_frontier
+        if session.end not in parents:
+            return None
+        word_id = session.end
+        while parents[word_id] != current:
+            word_id = parents[word_id]
+        return graph.words[word_id]
+
+    def state(self, session_id):
+        """Return a session's state as words, ready for JSON."""
+        session = self.get(session_id)
+        words = session.graph.words
+        return {
+            "id": session.session_id,
+            "mode": session.mode,
+            "start": words[session.start],
+            "end": words[session.end],
+            "tries": [words[i] for i in session.tries],
+            "min_moves": session.min_moves,
+            "max_moves": session.max_moves,
+            "banned_words": sorted(words[i] for i in session.banned),
+            "restricted_letters": sorted(session.restricted),
+            "detour": session.detour,
+            "score": session.score,
+        }
@@ -0,0 +1,245 @@
+import argparse
+import itertools
+import multiprocessing
+import random
+import time
+import zlib
+from collections import Counter
+
+PARTITIONS = ("length", "hash")
+
+
+def _read_words(dictionary_file):
+    with open(dictionary_file, 'r') as f:
+        for line in f:
+            word = line.strip().lower()
+            if word:
+                yield word
+
+
+class Partition:
+    """Map each word to the shard that owns it, the same way in every process.
+
+    "length" gives each word length to one shard, balancing the word counts
+    greedily (largest length to the emptiest shard); "hash" uses crc32,
+    which unlike hash() is not salted per process.
+    """
+
+    def __init__(self, kind, shards, dictionary_file=None):
+        if kind not in PARTITIONS:
+            raise ValueError(f"Unknown partition: {kind}")
+        self.kind = kind
+        self.shards = shards
+        self.lengths = {}
+        if kind == "length" and dictionary_file:
+            counts = Counter(len(word) for word in _read_words(dictionary_file))
+            loads = [0] * shards
+            for length, count in counts.most_common():
+                shard = loads.index(min(loads))
+                self.lengths[length] = shard
+                loads[shard] += count
+
+    def __call__(self, word):
+        if self.kind == "length":
+            return self.lengths.get(len(word), len(word) % self.shards)
+        return zlib.crc32(word.encode()) % self.shards
+
+
+class Shard:
+    """The words one worker owns, their neighbor lists and per-query BFS state.
+
+    Neighbor lists hold words from every shard, but they are found with a
+    streaming pass over the dictionary that keeps only this shard's
+    wildcard buckets (and deletion variants for edit ladders), so a worker
+    never holds more than its own part of the graph.
+    """
+
+    def __init__(self, index, partition, dictionary_file, edits=False):
+        self.owned = {word for word in _read_words(dictionary_file) if partition(word) == index}
+        self.neighbors = {word: set() for word in self.owned}
+        buckets = {}    # wildcard key -> owned words in that bucket
+        shorter = {}    # owned word minus one letter -> owned words
+        for word in self.owned:
+            for pos in range(len(word)):
+                buckets.setdefault(word[:pos] + '_' + word[pos + 1:], []).append(word)
+                if edits:
+                    shorter.setdefault(word[:pos] + word[pos + 1:], []).append(word)
+
+        for word in _read_words(dictionary_file):
+            for pos in range(len(word)):
+                for owned in buckets.get(word[:pos] + '_' + word[pos + 1:], ()):
+                    if owned != word:
+                        self.neighbors[owned].add(word)
+                if edits:
+                    # word is one insertion away from an owned word
+                    deleted = word[:pos] + word[pos + 1:]
+                    if deleted in self.neighbors:
+                        self.neighbors[deleted].add(word)
+            if edits:
+                # word is one deletion away from an owned word
+                for owned in shorter.get(word, ()):
+                    self.neighbors[owned].add(word)
+        self.queries = {}  # query ID -> {owned word: parent word}
+
+    def step(self, query, candidates, target):
+        """Visit (word, parent) candidates owned here; return (target found, [(neighbor, word)])."""
+        parents = self.queries.setdefault(query, {})
+        found = False
+        expanded = []
+        for word, parent in candidates:
+            if word in parents or word not in self.owned:
+                continue
+            parents[word] = parent
+            if word == target:
+                found = True
+                continue
+            expanded.extend((neighbor, word) for neighbor in self.neighbors[word])
+        return found, expanded
+
+    def parent(self, query, word):
+        return self.queries.get(query, {}).get(word)
+
+    def finish(self, query):
+        self.queries.pop(query, None)
+
+    def stats(self):
+        return {"words": len(self.owned),
+                "edges": sum(len(neighbors) for neighbors in self.neighbors.values())}
+
+
+def _serve_shard(conn, index, partition, dictionary_file, edits):
+    """Worker loop: build one shard, then answer (method, args) messages until None."""
+    shard = Shard(index, partition, dictionary_file, edits)
+    conn.send("ready")
+    while True:
+        message = conn.recv()
+        if message is None:
+            break
+        method, args = message
+        conn.send(getattr(shard, method)(*args))
+    conn.close()
+
+
+class ShardedSolver:
+    """Shortest ladders over a graph split across worker processes.
+
+    Each worker owns the words of one shard: by word length (a
+    substitution ladder then never leaves its shard) or by a hash of the
+    word, which spreads one huge length over every worker. The
+    coordinator runs a level-synchronous BFS: each round it sends every
+    shard the candidates it owns, and the shard marks the new ones visited
+    (recording their parent) and expands them. The neighbors that come
+    back are grouped by owner into the next round's messages, so the
+    frontier crosses shards only through the coordinator. Local processes
+    stand in for remote nodes; messages go over pipes.
+    """
+
+    def __init__(self, dictionary_file='dictionary.txt', shards=4, partition="hash", edits=False):
+        self.shards = shards
+        self.partition = Partition(partition, shards, dictionary_file)
+        self.queries = itertools.count()
+        self.connections = []
+        self.processes = []
+        for index in range(shards):
+            parent_conn, child_conn = multiprocessing.Pipe()
+            process = multiprocessing.Process(
+                target=_serve_shard, daemon=True,
+                args=(child_conn, index, self.partition, dictionary_file, edits))
+            process.start()
+            self.connections.append(parent_conn)
+            self.processes.append(process)
+        for conn in self.connections:
+            conn.recv()  # Wait until every shard is built
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Stop every worker."""
+        for conn in self.connections:
+            conn.send(None)
+        for process in self.processes:
+            process.join()
+        self.connections = []
+        self.processes = []
+
+    def _call(self, shard, method, *args):
+        self.connections[shard].send((method, args))
+        return self.connections[shard].recv()
+
+    def _broadcast(self, messages):
+        """Send {shard: (method, args)} to all shards first, then collect {shard: result}."""
+        for shard, message in messages.items():
+            self.connections[shard].send(message)
+        return {shard: self.connections[shard].recv() for shard in messages}
+
+    def find_path(self, start_word, end_word):
+        """Return a shortest ladder from start_word to end_word, or None."""
+        query = next(self.queries)
+        owner = self.partition
+        outbox = {owner(start_word): [(start_word, None)]}
+        found = False
+        try:
+            while outbox and not found:
+                results = self._broadcast({shard: ("step", (query, candidates, end_word))
+                                           for shard, candidates in outbox.items()})
+                outbox = {}
+                for shard_found, expanded in results.values():
+                    found = found or shard_found
+                    for neighbor, parent in expanded:
+                        outbox.setdefault(owner(neighbor), []).append((neighbor, parent))
+            if not found:
+                return None
+            # Walk the parent links back, asking each word's owner
+            path = [end_word]
+            while path[-1] != start_word:
+                path.append(self._call(owner(path[-1]), "parent", query, path[-1]))
+            return path[::-1]
+        finally:
+            self._broadcast({shard: ("finish", (query,)) for shard in range(self.shards)})
+
+    def stats(self):
+        """Return each shard's word and edge counts."""
+        return [self._call(shard, "stats") for shard in range(self.shards)]
+
+
+def main():
+    from engine import WordGraph
+    from query_planner import QueryPlanner
+
+    parser = argparse.ArgumentParser(description="Solve ladders on a graph sharded across processes")
+    parser.add_argument("dictionary", nargs="?", default="dictionary.txt")
+    parser.add_argument("--shards", type=int, default=4)
+    parser.add_argument("--partition", choices=PARTITIONS, default="hash")
+    parser.add_argument("--edits", action="store_true", help="Use the edit-ladder graph")
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args()
+
+    graph = WordGraph.from_file(args.dictionary, edits=args.edits)
+    rng = random.Random(0)
+    pairs = [tuple(rng.sample(graph.words, 2)) for _ in range(args.queries)]
+    # Reference answers from the single-process graph, batched over shared BFS trees
+    expected = QueryPlanner(graph).distances(pairs)
+
+    start_time = time.perf_counter()
+    with ShardedSolver(args.dictionary, args.shards, args.partition, args.edits) as solver:
+        print(f"Built {args.shards} shards in {time.perf_counter() - start_time:.2f}s")
+        for index, stats in enumerate(solver.stats()):
+            print(f"  shard {index}: {stats['words']} words, {stats['edges']} neighbor links")
+
+        start_time = time.perf_counter()
+        mismatches = 0
+        for (start_word, end_word), moves in zip(pairs, expected):
+            path = solver.find_path(start_word, end_word)
+            if (len(path) - 1 if path else None) != moves:
+                mismatches += 1
+        elapsed = time.perf_counter() - start_time
+    print(f"{len(pairs)} queries in {elapsed:.2f}s ({elapsed / len(pairs) * 1000:.2f} ms each), "
+          f"{mismatches} length mismatches against the single-process graph")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+from array import array
+from bisect import bisect_left
+from collections.abc import Mapping, Sequence
+from multiprocessing import shared_memory
+
+from engine import WordGraph
+
+
+class _WordTable(Sequence):
+    """graph.words over the packed text: each word is decoded when it is read."""
+
+    def __init__(self, offsets, text):
+        self.offsets = offsets
+        self.text = text
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        return str(self.text[self.offsets[index]:self.offsets[index + 1]], 'utf-8')
+
+    def __contains__(self, word):
+        i = bisect_left(self, word)
+        return i < len(self) and self[i] == word
+
+
+class _WordIds(Mapping):
+    """graph.ids without a dict: words are sorted, so an ID is a binary search away."""
+
+    def __init__(self, words):
+        self.words = words
+
+    def __getitem__(self, word):
+        i = bisect_left(self.words, word)
+        if i < len(self.words) and self.words[i] == word:
+            return i
+        raise KeyError(word)
+
+    def __iter__(self):
+        return iter(self.words)
+
+    def __len__(self):
+        return len(self.words)
+
+
+class _Adjacency(Sequence):
+    """graph.adjacency read from the shared CSR arrays.
+
+    Each row comes back as a short list rather than a memoryview slice:
+    a slice kept anywhere would pin the block and stop close() unmapping it.
+    """
+
+    def __init__(self, indptr, indices):
+        self.indptr = indptr
+        self.indices = indices
+
+    def __len__(self):
+        return len(self.indptr) - 1
+
+    def __getitem__(self, word_id):
+        return self.indices[self.indptr[word_id]:self.indptr[word_id + 1]].tolist()
+
+
+def _pack(graph):
+    """Lay a WordGraph out as (parts, size, edges, text size) for a PackedGraph buffer."""
+    indptr = array('i', [0])
+    indices = array('i')
+    for neighbors in graph.adjacency:
+        indices.extend(neighbors)
+        indptr.append(len(indices))
+    encoded = [word.encode('utf-8') for word in graph.words]
+    offsets = array('i', [0])
+    for word in encoded:
+        offsets.append(offsets[-1] + len(word))
+    text = b"".join(encoded)
+    parts = [indptr.tobytes(), indices.tobytes(), offsets.tobytes(), text]
+    return parts, len(graph), len(indices), len(text)
+
+
+class PackedGraph(WordGraph):
+    """A WordGraph read from one flat buffer instead of per-word objects.
+
+    The buffer holds the CSR adjacency (indptr, indices), the word offsets
+    and the UTF-8 word text, in that order. Words are decoded when read,
+    ids is a binary search over them and adjacency rows are sliced out of
+    the CSR arrays, so the graph costs a few bytes per word and per edge
+    rather than a str, a dict entry and a tuple per word. pack() builds
+    one in local memory; SharedGraph puts the same layout in shared memory.
+    """
+
+    def __init__(self, buf, size, edges, text_size, edits):
+        self.size = size
+        self.edges = edges
+        self.text_size = text_size
+        self.edits = edits
+        self._components = None
+        self._alphabet = None
+
+        start = 0
+        self.indptr = buf[start:start + (size + 1) * 4].cast('i')
+        start += (size + 1) * 4
+        self.indices = buf[start:start + edges * 4].cast('i')
+        start += edges * 4
+        self.offsets = buf[start:start + (size + 1) * 4].cast('i')
+        start += (size + 1) * 4
+        self.text = buf[start:start + text_size]
+
+        self.words = _WordTable(self.offsets, self.text)
+        self.ids = _WordIds(self.words)
+        self.adjacency = _Adjacency(self.indptr, self.indices)
+
+    @property
+    def alphabet(self):
+        # Only needed by with_changes(), so not worth a pass over the text up front
+        if self._alphabet is None:
+            self._alphabet = sorted(set(str(self.text, 'utf-8')))
+        return self._alphabet
+
+    @classmethod
+    def pack(cls, graph):
+        """Copy a built WordGraph into a new packed graph in local memory."""
+        parts, size, edges, text_size = _pack(graph)
+        return cls(memoryview(b"".join(parts)), size, edges, text_size, graph.edits)
+
+    def __len__(self):
+        return self.size
+
+
+class SharedGraph(PackedGraph):
+    """A PackedGraph published once in shared memory and attached zero-copy.
+
+    publish() copies a built graph into one block; a worker passes
+    handle() to attach() and gets a full WordGraph whose words, ids and
+    adjacency read straight from the block. Attaching parses nothing and
+    copies nothing, so pool start time and per-worker memory no longer
+    grow with the dictionary.
+    """
+
+    def __init__(self, shm, size, edges, text_size, edits, owner):
+        self.shm = shm
+        self.owner = owner
+        self.closed = False
+        super().__init__(shm.buf, size, edges, text_size, edits)
+
+    @classmethod
+    def publish(cls, graph):
+        """Copy a built WordGraph into a new shared memory block."""
+        parts, size, edges, text_size = _pack(graph)
+        total = sum(len(part) for part in parts)
+        # Zero-size blocks are not allowed, so an empty graph still gets one byte
+        shm = shared_memory.SharedMemory(create=True, size=max(total, 1))
+        position = 0
+        for part in parts:
+            shm.buf[position:position + len(part)] = part
+            position += len(part)
+        return cls(shm, size, edges, text_size, graph.edits, owner=True)
+
+    @classmethod
+    def attach(cls, handle):
+        """Attach to a block published by another process."""
+        name, size, edges, text_size, edits = handle
+        return cls(shared_memory.SharedMemory(name=name), size, edges, text_size, edits,
+                   owner=False)
+
+    def handle(self):
+        """Return the small picklable tuple a worker needs to attach."""
+        return self.shm.name, self.size, self.edges, self.text_size, self.edits
+
+    def __reduce__(self):
+        # Pickling sends the handle, never the buffers
+        return SharedGraph.attach, (self.handle(),)
+
+    def close(self):
+        """Release this process's views and mapping; the publisher also unlinks the block."""
+        if self.closed:
+            return
+        self.closed = True
+        for view in (self.text, self.offsets, self.indices, self.indptr):
+            try:
+                view.release()
+            except BufferError:
+                # Something still holds a view of it; the mapping goes at exit
+                pass
+        try:
+            self.shm.close()
+        except BufferError:
+            pass
+        if self.owner:
+            self.shm.unlink()
+
+    def __del__(self):
+        # Worker processes never call close(); release the views before SharedMemory's own cleanup
+        self.close()
@@ -0,0 +1,169 @@
+import queue
+import sqlite3
+import threading
+import time
+from contextlib import closing
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    played_at REAL NOT NULL,
+    mode TEXT NOT NULL,
+    algorithm TEXT NOT NULL,
+    start_word TEXT NOT NULL,
+    end_word TEXT NOT NULL,
+    moves INTEGER NOT NULL,
+    min_moves INTEGER NOT NULL,
+    score REAL NOT NULL,
+    solved INTEGER NOT NULL,
+    auto_solved INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS games_leaderboard ON games (mode, auto_solved, score DESC);
+CREATE INDEX IF NOT EXISTS games_puzzle ON games (start_word, end_word);
+
+CREATE TABLE IF NOT EXISTS timings (
+    id INTEGER PRIMARY KEY,
+    recorded_at REAL NOT NULL,
+    algorithm TEXT NOT NULL,
+    start_word TEXT NOT NULL,
+    end_word TEXT NOT NULL,
+    seconds REAL NOT NULL,
+    path_length INTEGER
+);
+CREATE INDEX IF NOT EXISTS timings_algorithm ON timings (algorithm, path_length);
+"""
+
+_FLUSH = object()
+_STOP = object()
+
+
+class StatsStore:
+    """SQLite store for game results and algorithm timings.
+
+    Writes are queued and a single writer thread commits them in batches,
+    one transaction per batch, so recording a result costs the caller a
+    queue put. The database runs in WAL mode, which lets the query methods
+    read through their own connections while the writer is committing.
+    """
+
+    def __init__(self, db_file='stats.db', batch_size=500, batch_delay=0.5):
+        self.db_file = db_file
+        self.batch_size = batch_size
+        self.batch_delay = batch_delay
+        self.rows = queue.SimpleQueue()
+
+        # The connection's own context manager only commits; closing() releases it too
+        with closing(self._connect()) as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+
+        self.thread = threading.Thread(target=self._writer, name="stats-store", daemon=True)
+        self.thread.start()
+
+    def _connect(self):
+        """Open a connection tuned for WAL; safe to call from any thread."""
+        conn = sqlite3.connect(self.db_file, timeout=30)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def record_game(self, mode, algorithm, start_word, end_word, moves, min_moves,
+                    score, solved=True, auto_solved=False):
+        """Queue one finished or abandoned game."""
+        self.rows.put(("games", (time.time(), mode, algorithm, start_word, end_word,
+                                 moves, min_moves, score, int(solved), int(auto_solved))))
+
+    def record_timing(self, algorithm, start_word, end_word, seconds, path_length=None):
+        """Queue one search timing."""
+        self.rows.put(("timings", (time.time(), algorithm, start_word, end_word,
+                                   seconds, path_length)))
+
+    def flush(self):
+        """Block until everything queued so far is committed."""
+        done = threading.Event()
+        self.rows.put((_FLUSH, done))
+        done.wait()
+
+    def close(self):
+        """Commit pending rows and stop the writer thread."""
+        self.rows.put((_STOP, None))
+        self.thread.join()
+
+    def _writer(self):
+        """Collect queued rows into batches and commit each batch at once."""
+        inserts = {
+            "games": "INSERT INTO games (played_at, mode, algorithm, start_word, end_word, "
+                     "moves, min_moves, score, solved, auto_solved) "
+                     "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            "timings": "INSERT INTO timings (recorded_at, algorithm, start_word, end_word, "
+                       "seconds, path_length) VALUES (?, ?, ?, ?, ?, ?)",
+        }
+        conn = self._connect()
+        try:
+            running = True
+            while running:
+                batch = {"games": [], "timings": []}
+                waiters = []
+                count = 0
+                try:
+                    table, row = self.rows.get()
+                    deadline = time.monotonic() + self.batch_delay
+                    while True:
+                        if table is _STOP:
+                            running = False
+                            break
+                        if table is _FLUSH:
+                            waiters.append(row)
+                            break
+                        batch[table].append(row)
+                        count += 1
+                        if count >= self.batch_size:
+                            break
+                        table, row = self.rows.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    pass
+
+                if count:
+                    with conn:
+                        for table, rows in batch.items():
+                            if rows:
+                                conn.executemany(inserts[table], rows)
+                for done in waiters:
+                    done.set()
+        finally:
+            conn.close()
+
+    def _query(self, sql, params=()):
+        """Run a read-only query on a fresh connection."""
+        conn = self._connect()
+        try:
+            return conn.execute(sql, params).fetchall()
+        finally:
+            conn.close()
+
+    def leaderboard(self, mode, limit=10):
+        """Return the best manual games for a mode as (score, moves, start, end, played_at)."""
+        return self._query(
+            "SELECT score, moves, start_word, end_word, played_at FROM games "
+            "WHERE mode = ? AND auto_solved = 0 AND solved = 1 "
+            "ORDER BY score DESC, moves ASC LIMIT ?", (mode, limit))
+
+    def puzzle_stats(self, start_word, end_word):
+        """Return (games, solve rate, average score, average extra moves) for one puzzle."""
+        return self._query(
+            "SELECT COUNT(*), AVG(solved), AVG(score), AVG(moves - min_moves) FROM games "
+            "WHERE start_word = ? AND end_word = ? AND auto_solved = 0",
+            (start_word, end_word))[0]
+
+    def hardest_puzzles(self, min_games=5, limit=20):
+        """Return puzzles with the lowest solve rates, for difficulty tuning."""
+        return self._query(
+            "SELECT start_word, end_word, mode, COUNT(*) AS n, AVG(solved) AS rate, "
+            "AVG(moves - min_moves) FROM games WHERE auto_solved = 0 "
+            "GROUP BY start_word, end_word, mode HAVING n >= ? "
+            "ORDER BY rate ASC, n DESC LIMIT ?", (min_games, limit))
+
+    def algorithm_summary(self):
+        """Return (algorithm, runs, average seconds, worst seconds) for every algorithm."""
+        return self._query(
+            "SELECT algorithm, COUNT(*), AVG(seconds), MAX(seconds) FROM timings "
+            "GROUP BY algorithm ORDER BY AVG(seconds)")
@@ -0,0 +1,86 @@
+"""Slow, obviously correct reference answers the tests compare against."""
+import heapq
+
+
+def read_words(dictionary_file):
+    """Return the sorted distinct words of a dictionary file."""
+    with open(dictionary_file, 'r') as f:
+        return sorted({line.strip().lower() for line in f if line.strip()})
+
+
+def one_letter_apart(word1, word2):
+    return len(word1) == len(word2) and sum(a != b for a, b in zip(word1, word2)) == 1
+
+
+def distances(neighbors, source, allowed=None):
+    """Return {word: moves from source} by plain BFS, optionally only over allowed words."""
+    dist = {source: 0}
+    queue = [source]
+    for word in queue:
+        for neighbor in sorted(neighbors[word]):
+            if neighbor not in dist and (allowed is None or allowed(neighbor)):
+                dist[neighbor] = dist[word] + 1
+                queue.append(neighbor)
+    return dist
+
+
+def count_shortest(neighbors, start, end):
+    """Return the number of shortest ladders from start to end (0 if none)."""
+    dist = distances(neighbors, start)
+    if end not in dist:
+        return 0
+    ways = {start: 1}
+    for word in sorted(dist, key=dist.get):
+        for neighbor in neighbors[word]:
+            if dist.get(neighbor) == dist[word] + 1:
+                ways[neighbor] = ways.get(neighbor, 0) + ways[word]
+    return ways[end]
+
+
+def simple_ladder_lengths(neighbors, start, end, max_moves):
+    """Return the sorted move counts of every ladder without repeated words, up to max_moves."""
+    lengths = []
+    path = [start]
+    on_path = {start}
+
+    def extend():
+        word = path[-1]
+        if word == end:
+            lengths.append(len(path) - 1)
+            return
+        if len(path) - 1 == max_moves:
+            return
+        for neighbor in neighbors[word]:
+            if neighbor not in on_path:
+                path.append(neighbor)
+                on_path.add(neighbor)
+                extend()
+                on_path.discard(path.pop())
+
+    extend()
+    return sorted(lengths)
+
+
+def cheapest_cost(neighbors, start, end, costs):
+    """Dijkstra with a binary heap; return the cheapest ladder's total cost, or None."""
+    best = {start: 0}
+    heap = [(0, start)]
+    while heap:
+        cost, word = heapq.heappop(heap)
+        if word == end:
+            return cost
+        if cost > best[word]:
+            continue
+        for neighbor in neighbors[word]:
+            new_cost = cost + costs(word, neighbor)
+            if new_cost < best.get(neighbor, new_cost + 1):
+                best[neighbor] = new_cost
+                heapq.heappush(heap, (new_cost, neighbor))
+    return None
+
+
+def assert_ladder(ladder, start, end, neighbors):
+    """Check that ladder runs from start to end in one-letter moves."""
+    assert ladder[0] == start and ladder[-1] == end
+    for a, b in zip(ladder, ladder[1:]):
+        assert b in neighbors[a], f"{a} -> {b} is not a move"
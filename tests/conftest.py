@@ -0,0 +1,51 @@
+import os
+import random
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from brute import read_words, one_letter_apart  # noqa: E402
+from engine import WordGraph  # noqa: E402
+
+DICTIONARY = os.path.join(ROOT, "dictionary.txt")
+
+
+@pytest.fixture(scope="session")
+def dictionary_file():
+    return DICTIONARY
+
+
+@pytest.fixture(scope="session")
+def words():
+    return read_words(DICTIONARY)
+
+
+@pytest.fixture(scope="session")
+def graph(words):
+    return WordGraph(words)
+
+
+@pytest.fixture(scope="session")
+def neighbors(words):
+    """Brute-force adjacency: every pair of words compared letter by letter."""
+    found = {word: set() for word in words}
+    for i, word in enumerate(words):
+        for other in words[i + 1:]:
+            if one_letter_apart(word, other):
+                found[word].add(other)
+                found[other].add(word)
+    return found
+
+
+@pytest.fixture
+def pairs(words):
+    """Seeded random (start, end) pairs of equal length."""
+    rng = random.Random(0)
+    by_length = {}
+    for word in words:
+        by_length.setdefault(len(word), []).append(word)
+    pools = [pool for pool in by_length.values() if len(pool) > 1]
+    return [tuple(rng.sample(rng.choice(pools), 2)) for _ in range(60)]
@@ -0,0 +1,27 @@
+import pytest
+
+from bitset_bfs import BitsetBFS, np
+from brute import assert_ladder, distances
+
+BACKENDS = ["int", pytest.param("numpy", marks=pytest.mark.skipif(np is None, reason="needs NumPy"))]
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_distances_match_brute_force(graph, neighbors, backend):
+    bfs = BitsetBFS(graph, backend=backend)
+    for source, found in bfs.all_distances(batch=16):
+        expected = distances(neighbors, graph.words[source])
+        assert {graph.words[i]: int(d) for i, d in enumerate(found) if d >= 0} == expected
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_shortest_path(graph, neighbors, pairs, backend):
+    bfs = BitsetBFS(graph, backend=backend)
+    for start, end in pairs:
+        path = bfs.shortest_path(start, end)
+        expected = distances(neighbors, start).get(end)
+        if expected is None:
+            assert path is None
+        else:
+            assert len(path) - 1 == expected
+            assert_ladder(path, start, end, neighbors)
@@ -0,0 +1,96 @@
+import random
+
+import pytest
+
+from brute import assert_ladder, distances, one_letter_apart
+from challenge import ChallengeBuilder, CutStructure
+from engine import WordGraph
+
+
+def _simple_ladders(neighbors, start, end, max_moves):
+    """Yield every ladder without repeated words of at most max_moves moves."""
+    path = [start]
+
+    def extend():
+        if path[-1] == end:
+            yield list(path)
+            return
+        if len(path) - 1 < max_moves:
+            for neighbor in sorted(neighbors[path[-1]]):
+                if neighbor not in path:
+                    path.append(neighbor)
+                    yield from extend()
+                    path.pop()
+
+    yield from extend()
+
+
+def test_articulation_points_match_brute_force(graph, neighbors, words):
+    cuts = CutStructure(graph)
+    for word in words:
+        reach = distances(neighbors, word)
+        component = set(reach) - {word}
+        # A cut word leaves the rest of its component split once it is removed
+        split = False
+        if component:
+            first = min(component)
+            rest = distances(neighbors, first, allowed=lambda other: other != word)
+            split = set(rest) != component
+        assert (graph.ids[word] in cuts.articulation) == split, word
+
+
+def test_corridor_holds_every_simple_ladder(graph, neighbors, pairs):
+    cuts = CutStructure(graph)
+    ids = graph.ids
+    for start, end in pairs:
+        corridor = cuts.corridor(ids[start], ids[end])
+        moves = distances(neighbors, start).get(end)
+        if moves is None:
+            assert corridor is None
+            continue
+        for ladder in _simple_ladders(neighbors, start, end, moves + 2):
+            assert {ids[word] for word in ladder} <= corridor
+
+
+def _check_challenges(graph, neighbors, pairs, rng):
+    """Build a Challenge per pair, check it against a constrained BFS; return the detours reached."""
+    builder = ChallengeBuilder(graph)
+    detours = []
+    for start, end in pairs:
+        shortest = distances(neighbors, start).get(end)
+        if shortest is None:
+            with pytest.raises(ValueError):
+                builder.build(start, end, rng=rng)
+            continue
+        challenge = builder.build(start, end, banned=5, letters=3, detour=2, rng=rng)
+        assert len(challenge.banned_words) <= 5 and len(challenge.restricted_letters) <= 3
+
+        def allowed(word):
+            return word not in challenge.banned_words and \
+                challenge.restricted_letters.isdisjoint(word)
+
+        constrained = distances(neighbors, start, allowed=allowed)
+        assert constrained.get(end) == challenge.min_moves, (start, end)
+        assert challenge.min_moves == shortest + challenge.detour
+        assert 0 <= challenge.detour <= 2
+        assert len(challenge.ladder) - 1 == challenge.min_moves
+        assert_ladder(challenge.ladder, start, end, neighbors)
+        # The witness ladder, endpoints included, obeys every constraint
+        assert all(allowed(word) for word in challenge.ladder)
+        detours.append(challenge.detour)
+    return detours
+
+
+def test_constraints_keep_a_ladder_of_min_moves(graph, neighbors, pairs):
+    _check_challenges(graph, neighbors, pairs, random.Random(0))
+
+
+def test_dense_lexicon_reaches_the_detour():
+    # Few letters make a dense graph, where closing a layer takes real letter and ban choices
+    rng = random.Random(1)
+    words = sorted({"".join(rng.choice("abcdefghi") for _ in range(4)) for _ in range(700)})
+    graph = WordGraph(words)
+    neighbors = {word: {other for other in words if one_letter_apart(word, other)} for word in words}
+    pairs = [tuple(rng.sample(words, 2)) for _ in range(40)]
+    detours = _check_challenges(graph, neighbors, pairs, rng)
+    assert 2 in detours
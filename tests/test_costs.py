@@ -0,0 +1,31 @@
+import pytest
+
+from brute import assert_ladder, cheapest_cost, distances
+from costs import EdgeCosts, LetterPenalty, PositionPenalty, RarityPenalty, cheapest_ladder
+
+MODELS = {
+    "uniform": lambda words: (),
+    "rarity": lambda words: (RarityPenalty(words),),
+    "position": lambda words: (PositionPenalty({0: 2, 2: 1}),),
+    "mixed": lambda words: (RarityPenalty(words, levels=3), LetterPenalty("aeo", penalty=4)),
+}
+
+
+@pytest.mark.parametrize("model", MODELS)
+def test_cheapest_ladder_matches_dijkstra(graph, neighbors, words, pairs, model):
+    costs = EdgeCosts(*MODELS[model](words))
+    for start, end in pairs:
+        path, total = cheapest_ladder(graph, start, end, costs)
+        expected = cheapest_cost(neighbors, start, end, costs)
+        assert total == expected, (start, end)
+        if expected is None:
+            assert path is None
+            continue
+        assert_ladder(path, start, end, neighbors)
+        assert sum(costs(a, b) for a, b in zip(path, path[1:])) == total
+
+
+def test_uniform_costs_are_moves(graph, neighbors, pairs):
+    for start, end in pairs:
+        _, total = cheapest_ladder(graph, start, end, EdgeCosts())
+        assert total == distances(neighbors, start).get(end)
@@ -0,0 +1,31 @@
+import random
+
+from brute import one_letter_apart
+from dawg import Dawg
+
+
+def test_matches_the_word_set(words, neighbors):
+    dawg = Dawg(words)
+    assert len(dawg) == len(words)
+    assert list(dawg) == words
+    assert all(word in dawg for word in words)
+    for word in words:
+        assert sorted(dawg.substitutions(word)) == sorted(neighbors[word])
+
+
+def test_random_lexicon_with_shared_prefixes_and_suffixes():
+    rng = random.Random(0)
+    stems = ["".join(rng.choice("abcde") for _ in range(rng.randint(1, 6))) for _ in range(300)]
+    lexicon = sorted(set(stems + [stem + suffix for stem in stems for suffix in ("s", "ed", "ing")]))
+    dawg = Dawg(lexicon)
+    assert list(dawg) == lexicon and len(dawg) == len(lexicon)
+    # Fewer states than characters is the point of sharing suffixes
+    assert dawg.states() < sum(map(len, lexicon))
+    members = set(lexicon)
+    for _ in range(2000):
+        probe = "".join(rng.choice("abcdegins") for _ in range(rng.randint(1, 8)))
+        assert (probe in dawg) == (probe in members)
+    for word in rng.sample(lexicon, 200):
+        expected = sorted(other for other in lexicon if one_letter_apart(word, other))
+        assert sorted(dawg.substitutions(word)) == expected
+    assert 42 not in dawg
@@ -0,0 +1,27 @@
+import random
+
+from brute import assert_ladder, distances
+from incremental import IncrementalSolver
+
+
+def test_queries_in_any_order_match_brute_force(graph, neighbors, words):
+    rng = random.Random(0)
+    for end in rng.sample(words, 10):
+        expected = distances(neighbors, end)
+        solver = IncrementalSolver(graph, end)
+        # Random order mixes words inside the explored region with ones that resume the search
+        for word in rng.sample(words, len(words)):
+            assert solver.distance(word) == expected.get(word)
+            path = solver.path_from(word)
+            if word not in expected:
+                assert path is None and solver.next_move(word) is None
+                continue
+            assert len(path) - 1 == expected[word]
+            assert_ladder(path, word, end, neighbors)
+            assert solver.next_move(word) == (path[1] if len(path) > 1 else None)
+
+
+def test_unknown_words(graph, words):
+    solver = IncrementalSolver(graph, words[0])
+    assert solver.distance("notaword") is None
+    assert IncrementalSolver(graph, "notaword").distance(words[0]) is None
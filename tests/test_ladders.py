@@ -0,0 +1,43 @@
+from brute import assert_ladder, count_shortest, distances, simple_ladder_lengths
+from ladders import ShortestLadders, k_shortest_ladders
+
+
+def test_shortest_ladders_match_brute_force(graph, neighbors, pairs):
+    for start, end in pairs:
+        ladders = ShortestLadders(graph, start, end)
+        expected = count_shortest(neighbors, start, end)
+        assert ladders.count() == expected, (start, end)
+        if not expected:
+            assert ladders.length is None and list(ladders) == []
+            continue
+        moves = distances(neighbors, start)[end]
+        assert ladders.length == moves
+        found = list(ladders)
+        assert len(found) == expected == len({tuple(ladder) for ladder in found})
+        for index, ladder in enumerate(found):
+            assert len(ladder) == moves + 1
+            assert_ladder(ladder, start, end, neighbors)
+            assert ladders.ladder_at(index) == ladder
+            assert all(ladders.is_on_ladder(word) for word in ladder)
+
+
+def test_same_start_and_end(graph, words):
+    ladders = ShortestLadders(graph, words[0], words[0])
+    assert ladders.count() == 1 and list(ladders) == [[words[0]]]
+
+
+def test_k_shortest_ladders_match_brute_force(graph, neighbors, pairs):
+    k = 6
+    for start, end in pairs:
+        found = k_shortest_ladders(graph, start, end, k)
+        if end not in distances(neighbors, start):
+            assert found == []
+            continue
+        assert len({tuple(ladder) for ladder in found}) == len(found)
+        for ladder in found:
+            assert_ladder(ladder, start, end, neighbors)
+            assert len(set(ladder)) == len(ladder)  # Loopless
+        lengths = [len(ladder) - 1 for ladder in found]
+        # The k shortest loopless ladders, by length, are the k smallest of all of them
+        expected = simple_ladder_lengths(neighbors, start, end, max(lengths))[:k]
+        assert lengths == expected, (start, end)
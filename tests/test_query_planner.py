@@ -0,0 +1,45 @@
+import random
+
+from brute import assert_ladder, distances
+from query_planner import QueryPlanner
+
+
+def _queries(words, count, hubs, rng):
+    """Pairs clustered around a few hub words, as pool building makes them."""
+    hub_words = rng.sample(words, hubs)
+    return [(rng.choice(words), rng.choice(hub_words)) for _ in range(count)]
+
+
+def test_batches_match_brute_force(graph, neighbors, words):
+    rng = random.Random(0)
+    queries = _queries(words, 300, 12, rng) + [(words[0], "notaword")]
+    planner = QueryPlanner(graph, max_trees=4)
+    found = planner.distances(queries)
+    ladders = planner.solve(queries)
+    for (start, end), moves, ladder in zip(queries, found, ladders):
+        expected = distances(neighbors, start).get(end) if end in neighbors else None
+        assert moves == expected, (start, end)
+        if expected is None:
+            assert ladder is None
+        else:
+            assert len(ladder) - 1 == expected
+            assert_ladder(ladder, start, end, neighbors)
+    # Grouping by endpoint needs far fewer trees than queries, and the cache stays bounded
+    assert planner.stats["trees_built"] <= 2 * 12
+    assert len(planner.trees) <= 4
+
+
+def test_single_queries_reuse_cached_trees(graph, neighbors, words):
+    planner = QueryPlanner(graph)
+    end = words[10]
+    # The batch shares one tree rooted at end; later single queries to it walk that tree
+    planner.distances([(start, end) for start in words[:50]])
+    assert planner.stats["trees_built"] == 1
+    for start in words[50:]:
+        assert planner.distance(start, end) == distances(neighbors, start).get(end)
+        path, reverse = planner.path(start, end), planner.path(end, start)
+        assert (path is None) == (reverse is None)
+        if path:
+            assert_ladder(path, start, end, neighbors)
+            assert_ladder(reverse, end, start, neighbors)
+    assert planner.stats["trees_built"] == 1
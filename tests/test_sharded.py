@@ -0,0 +1,21 @@
+import pytest
+
+from brute import assert_ladder, distances
+from sharded import ShardedSolver
+
+
+@pytest.mark.parametrize("partition", ["length", "hash"])
+def test_paths_match_brute_force(dictionary_file, neighbors, pairs, partition):
+    with ShardedSolver(dictionary_file, shards=3, partition=partition) as solver:
+        for start, end in pairs:
+            path = solver.find_path(start, end)
+            expected = distances(neighbors, start).get(end)
+            if expected is None:
+                assert path is None
+            else:
+                assert len(path) - 1 == expected, (start, end)
+                assert_ladder(path, start, end, neighbors)
+        # Every shard together holds the whole graph, each word exactly once
+        stats = solver.stats()
+        assert sum(shard["words"] for shard in stats) == len(neighbors)
+        assert sum(shard["edges"] for shard in stats) == sum(map(len, neighbors.values()))
@@ -0,0 +1,45 @@
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+from brute import distances
+from shared_graph import PackedGraph, SharedGraph
+
+
+def _same_graph(packed, graph):
+    assert len(packed) == len(graph)
+    assert list(packed.words) == graph.words
+    assert all(packed.ids[word] == i for i, word in enumerate(graph.words))
+    assert "notaword" not in packed and packed.ids.get("notaword") is None
+    assert [list(packed.adjacency[i]) for i in range(len(graph))] == \
+        [list(neighbors) for neighbors in graph.adjacency]
+
+
+def _distances_in_worker(graph, word):
+    # graph arrives by handle and is attached in this process
+    return {graph.words[i]: d for i, d in graph.distance_field(graph.ids[word]).items()}
+
+
+def test_packed_graph_matches(graph, neighbors):
+    packed = PackedGraph.pack(graph)
+    _same_graph(packed, graph)
+    for word in graph.words[::25]:
+        assert packed.neighbors(word) == sorted(neighbors[word])
+    # Updates read the packed arrays and give the same graph as the original would
+    removed, added = graph.words[3], "zzzzz"
+    assert packed.with_changes({added}, {removed}).adjacency == \
+        graph.with_changes({added}, {removed}).adjacency
+
+
+def test_shared_graph_publish_and_attach(graph, neighbors):
+    shared = SharedGraph.publish(graph)
+    try:
+        _same_graph(shared, graph)
+        attached = pickle.loads(pickle.dumps(shared))
+        _same_graph(attached, graph)
+        attached.close()
+        word = graph.words[0]
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            assert pool.submit(_distances_in_worker, shared, word).result() == \
+                distances(neighbors, word)
+    finally:
+        shared.close()
@@ -0,0 +1,158 @@
+import gc
+import math
+import time
+
+
+class TimingResult:
+    """Per-call timings of one function, with robust summary statistics."""
+
+    def __init__(self, samples, loops):
+        self.samples = sorted(samples)  # seconds per call, one entry per repeat
+        self.loops = loops              # calls averaged into each sample
+
+    def __len__(self):
+        return len(self.samples)
+
+    def quantile(self, q):
+        """Linearly interpolated quantile of the samples."""
+        position = (len(self.samples) - 1) * q
+        low = math.floor(position)
+        high = min(low + 1, len(self.samples) - 1)
+        return self.samples[low] + (self.samples[high] - self.samples[low]) * (position - low)
+
+    @property
+    def median(self):
+        return self.quantile(0.5)
+
+    @property
+    def iqr(self):
+        return self.quantile(0.75) - self.quantile(0.25)
+
+    def confidence_interval(self):
+        """Distribution-free 95% confidence interval for the median.
+
+        Uses the order statistics at ranks n/2 -/+ 1.96 * sqrt(n) / 2, so no
+        assumption is made about the shape of the timing distribution.
+        """
+        n = len(self.samples)
+        half_width = 1.96 * math.sqrt(n) / 2
+        low = max(0, int(math.floor(n / 2 - half_width)))
+        high = min(n - 1, int(math.ceil(n / 2 + half_width)))
+        return self.samples[low], self.samples[high]
+
+
+def measure(func, *args, warmup=3, min_time=0.2, min_repeats=7, max_repeats=1000,
+            resolution=1e-4):
+    """Time func(*args) with warmup, adaptive repeats and the GC switched off.
+
+    Calls that finish faster than resolution are grouped into loops so the
+    timer's granularity doesn't dominate; repeats continue until min_time
+    has been spent (at least min_repeats, at most max_repeats).
+    """
+    return measure_interleaved([(func, args)], warmup, min_time, min_repeats, max_repeats,
+                               resolution)[0]
+
+
+def measure_interleaved(calls, warmup=3, min_time=0.2, min_repeats=7, max_repeats=100,
+                        resolution=1e-4):
+    """Time several (func, args) calls in round robin; return a TimingResult for each.
+
+    Timing one call after another lets clock, cache and thermal drift land
+    on whichever ran last, which a rank test then reads as a real
+    difference. Here each round takes one sample of every call, starting at
+    a different call each round, so drift hits them all alike. min_time is
+    per call, and repeats are capped lower than measure()'s because a few
+    hundred samples already make a rank test flag differences of a percent.
+    """
+    timer = time.perf_counter
+    for func, args in calls:
+        for _ in range(warmup):
+            func(*args)
+
+    gc_was_enabled = gc.isenabled()
+    gc.collect()
+    gc.disable()
+    try:
+        # Calibrate each call: double its loop count until one sample is measurable
+        loops = []
+        samples = []
+        spent = 0.0
+        for func, args in calls:
+            count = 1
+            while True:
+                start_time = timer()
+                for _ in range(count):
+                    func(*args)
+                elapsed = timer() - start_time
+                if elapsed >= resolution or count >= 1 << 20:
+                    break
+                count *= 2
+            loops.append(count)
+            samples.append([elapsed / count])
+            spent += elapsed
+
+        rounds = 1
+        while rounds < max_repeats and (rounds < min_repeats or spent < min_time * len(calls)):
+            for offset in range(len(calls)):
+                index = (rounds + offset) % len(calls)
+                func, args = calls[index]
+                start_time = timer()
+                for _ in range(loops[index]):
+                    func(*args)
+                elapsed = timer() - start_time
+                samples[index].append(elapsed / loops[index])
+                spent += elapsed
+            rounds += 1
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return [TimingResult(timings, count) for timings, count in zip(samples, loops)]
+
+
+def mann_whitney_p(a, b):
+    """Two-sided p-value of the Mann-Whitney U test between two timing results.
+
+    Normal approximation with tie correction; fine for the sample counts
+    measure() produces (7 and up).
+    """
+    n1, n2 = len(a.samples), len(b.samples)
+    combined = sorted([(x, 0) for x in a.samples] + [(x, 1) for x in b.samples])
+
+    # Average ranks over ties
+    rank_sum = 0.0
+    tie_term = 0.0
+    i = 0
+    while i < len(combined):
+        j = i
+        while j + 1 < len(combined) and combined[j + 1][0] == combined[i][0]:
+            j += 1
+        rank = (i + j) / 2 + 1
+        rank_sum += rank * sum(1 for k in range(i, j + 1) if combined[k][1] == 0)
+        ties = j - i + 1
+        tie_term += ties ** 3 - ties
+        i = j + 1
+
+    u = rank_sum - n1 * (n1 + 1) / 2
+    mean = n1 * n2 / 2
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (abs(u - mean) - 0.5) / math.sqrt(variance)
+    return max(0.0, min(1.0, math.erfc(max(z, 0.0) / math.sqrt(2))))
+
+
+def is_significant(a, b, alpha=0.05, min_effect=0.05):
+    """Check whether two timing results differ beyond noise.
+
+    A rank test alone flags any consistent shift once there are enough
+    samples, however small, so the medians must also differ by at least
+    min_effect (relative to the faster one) and their 95% confidence
+    intervals must not overlap.
+    """
+    faster, slower = sorted((a, b), key=lambda result: result.median)
+    if slower.median < faster.median * (1 + min_effect):
+        return False
+    if slower.confidence_interval()[0] <= faster.confidence_interval()[1]:
+        return False
+    return mann_whitney_p(a, b) < alpha
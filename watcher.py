@@ -0,0 +1,32 @@
+import os
+
+
+class FileWatcher:
+    """Notice when a file has changed by polling its modification time and size.
+
+    A change is only reported once the file has looked the same on two
+    polls in a row, so an editor that is halfway through saving does not
+    trigger a reload of a truncated file.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.signature = self._signature()  # as of the last reported change
+        self.last_seen = self.signature
+
+    def _signature(self):
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def changed(self):
+        """Return True once per settled change since the last call that returned True."""
+        signature = self._signature()
+        settled = signature == self.last_seen
+        self.last_seen = signature
+        if settled and signature != self.signature and signature is not None:
+            self.signature = signature
+            return True
+        return False